@@ -0,0 +1,330 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the throughput of PyDjinni on a synthetic IDL corpus.
+
+Each run generates all selected targets from scratch and records the time spent in every phase:
+
+- `configure`: creating and configuring the API
+- `setup`: everything in `parse()` that is not covered by the phases below, e.g. reading files and validation
+- `parse`: lexing and parsing the IDL with ANTLR and building the AST
+- `extern`: loading extern YAML files
+- `resolve`: resolving type references
+- `<target>.marshal`: creating the marshalling models of the target
+- `<target>.render`: rendering the Jinja templates of the target
+- `<target>.write`: writing the generated files and copying the support library
+- `<target>.generate`: everything else in `generate()`, e.g. traversing the AST
+
+Nested phases are only accounted once, e.g. the time spent resolving the types of an imported file is not part of the
+`parse` phase. With `--jobs` > 1, types are rendered by a pool of worker threads. The render time of all worker threads
+is summed up, so the phases of a run may add up to more than its total duration. Files are always written by the main
+thread.
+
+Usage:
+
+    python benchmarks/benchmark.py --records 2000 --interfaces 1000 --output results.json
+    python benchmarks/benchmark.py --compare results.json
+"""
+
+import functools
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable
+from unittest.mock import patch
+
+import click
+from importlib_metadata import version
+from jinja2 import Template
+
+from pydjinni import API
+from pydjinni.file.file_reader_writer import FileReaderWriter
+from pydjinni.generator.target import Target
+from pydjinni.parser.parser import Parser
+from pydjinni.parser.resolver import Resolver
+
+from corpus import Corpus, CorpusConfig, generate_corpus
+
+TARGETS = ["cpp", "java", "objc", "cppcli", "yaml"]
+
+
+class PhaseTimer:
+    """
+    Accumulates the wall-clock time spent in each phase of a run. If phases are nested, the time is only accounted to
+    the innermost phase.
+    """
+
+    def __init__(self):
+        self.durations: dict[str, float] = defaultdict(float)
+        self.calls: dict[str, int] = defaultdict(int)
+        self.prefix = ""
+        """Prefix for the names of target specific phases."""
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _account(self, name: str, duration: float, call: bool = False):
+        with self._lock:
+            self.durations[name] += duration
+            if call:
+                self.calls[name] += 1
+
+    @contextmanager
+    def phase(self, name: str):
+        stack: list[list] = self._local.__dict__.setdefault("stack", [])
+        start = time.perf_counter()
+        if stack:
+            self._account(stack[-1][0], start - stack[-1][1])
+        stack.append([name, start])
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            # the start is moved forward whenever a nested phase ends
+            _, resumed = stack.pop()
+            self._account(name, end - resumed, call=True)
+            if stack:
+                stack[-1][1] = end
+
+    def timed(self, function: Callable, name: Callable[..., str]) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.phase(name(*args)):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+
+@contextmanager
+def instrument(timer: PhaseTimer):
+    """
+    Patches the entry points of all phases, so that the time spent in them is recorded by the given timer.
+    """
+    phases = [
+        (Parser, "_analyze", lambda *_: "parse"),
+        (Resolver, "load_external", lambda *_: "extern"),
+        (Resolver, "resolve", lambda *_: "resolve"),
+        (Target, "marshal", lambda target, *_: f"{target.key}.marshal"),
+        (Template, "render", lambda *_: f"{timer.prefix}render"),
+        (FileReaderWriter, "_write", lambda *_: f"{timer.prefix}write"),
+        (FileReaderWriter, "_copy", lambda *_: f"{timer.prefix}write"),
+    ]
+    with ExitStack() as stack:
+        for owner, attribute, name in phases:
+            stack.enter_context(patch.object(owner, attribute, timer.timed(getattr(owner, attribute), name)))
+        yield
+
+
+def configuration(targets: list[str], out: Path, parser_engine: str = "antlr") -> dict:
+    target_configuration = {
+        "cpp": {"cpp": {"out": out / "cpp"}},
+        "java": {
+            "java": {"out": out / "java", "package": "benchmark"},
+            "jni": {"out": out / "jni", "namespace": "benchmark::jni"},
+        },
+        "objc": {"objc": {"out": out / "objc"}, "objcpp": {"out": out / "objcpp"}},
+        "cppcli": {"cppcli": {"out": out / "cppcli"}},
+        "yaml": {"yaml": {"out": out / "yaml"}},
+    }
+    generate = {}
+    for target in targets:
+        generate.update(target_configuration[target])
+    return {"generate": {"parser_engine": parser_engine, **generate}}
+
+
+def run(
+        corpus: Corpus, targets: list[str], out: Path, jobs: int, parser_engine: str = "antlr"
+) -> tuple[PhaseTimer, float]:
+    """
+    Generates all targets from scratch.
+
+    Returns:
+        the recorded phases and the total duration of the run
+    """
+    shutil.rmtree(out, ignore_errors=True)
+    timer = PhaseTimer()
+    with instrument(timer):
+        start = time.perf_counter()
+        with timer.phase("configure"):
+            context = API(root_path=corpus.root.parent).configure(options=configuration(targets, out, parser_engine))
+        with timer.phase("setup"):
+            generate_context = context.parse(corpus.root, use_cache=False)
+        for target in targets:
+            timer.prefix = f"{target}."
+            with timer.phase(f"{target}.generate"):
+                generate_context.generate(target, jobs=jobs)
+        timer.prefix = ""
+        total = time.perf_counter() - start
+    return timer, total
+
+
+def peak_memory(corpus: Corpus, targets: list[str], out: Path, jobs: int, parser_engine: str) -> int:
+    """
+    Peak memory in bytes that has been allocated by Python during a run.
+    Measured in a separate run, because tracing the allocations distorts the timings.
+    """
+    tracemalloc.start()
+    try:
+        run(corpus, targets, out, jobs, parser_engine)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def statistics_of(samples: list[float]) -> dict[str, float]:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "max": max(samples),
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=Path(__file__).parent, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def benchmark(
+        config: CorpusConfig,
+        targets: list[str],
+        repeat: int = 5,
+        warmup: int = 1,
+        jobs: int = 1,
+        memory: bool = True,
+        work_dir: Path | None = None,
+        parser_engine: str = "antlr") -> dict:
+    """
+    Runs the benchmark on a synthetic corpus.
+
+    Returns:
+        the machine-readable results
+    """
+    with tempfile.TemporaryDirectory(dir=work_dir) as directory:
+        corpus = generate_corpus(Path(directory) / "corpus", config)
+        out = Path(directory) / "out"
+        for _ in range(warmup):
+            run(corpus, targets, out, jobs, parser_engine)
+        runs = [run(corpus, targets, out, jobs, parser_engine) for _ in range(repeat)]
+        phases: dict[str, dict] = {}
+        for name in runs[0][0].durations:
+            phases[name] = {
+                **statistics_of([timer.durations.get(name, 0.0) for timer, _ in runs]),
+                "calls": runs[0][0].calls[name],
+            }
+        return {
+            "environment": {
+                "pydjinni": version("pydjinni"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "commit": git_commit(),
+            },
+            "corpus": {**asdict(config), "size": corpus.size},
+            "targets": targets,
+            "repeat": repeat,
+            "jobs": jobs,
+            "parser_engine": parser_engine,
+            "total": statistics_of([total for _, total in runs]),
+            "phases": phases,
+            "peak_memory": peak_memory(corpus, targets, out, jobs, parser_engine) if memory else None,
+        }
+
+
+def report(results: dict, baseline: dict | None = None) -> str:
+    """
+    Human-readable summary of the results, optionally compared against the results of a previous benchmark.
+    """
+
+    def row(name: str, median: float, reference: dict | None) -> str:
+        line = f"{name:<24}{median * 1000:>12.1f} ms"
+        if reference:
+            change = (median / reference["median"] - 1) * 100 if reference["median"] else 0.0
+            line += f"{reference['median'] * 1000:>12.1f} ms{change:>+9.1f} %"
+        return line
+
+    lines = [f"{'phase':<24}{'median':>15}" + (f"{'baseline':>15}{'change':>11}" if baseline else "")]
+    for name, phase in results["phases"].items():
+        lines.append(row(name, phase["median"], baseline["phases"].get(name) if baseline else None))
+    lines.append(row("total", results["total"]["median"], baseline["total"] if baseline else None))
+    if results["peak_memory"] is not None:
+        lines.append(f"{'peak memory':<24}{results['peak_memory'] / 2 ** 20:>12.1f} MiB")
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option("--seed", default=CorpusConfig.seed, show_default=True, help="Seed of the synthetic corpus.")
+@click.option("--files", default=CorpusConfig.files, show_default=True, help="Number of IDL files.")
+@click.option("--namespaces", default=CorpusConfig.namespaces, show_default=True, help="Number of namespaces.")
+@click.option("--records", default=CorpusConfig.records, show_default=True, help="Number of records.")
+@click.option("--interfaces", default=CorpusConfig.interfaces, show_default=True, help="Number of interfaces.")
+@click.option("--enums", default=CorpusConfig.enums, show_default=True, help="Number of enums.")
+@click.option("--fields", default=CorpusConfig.fields, show_default=True, help="Number of fields per record.")
+@click.option("--methods", default=CorpusConfig.methods, show_default=True, help="Number of methods per interface.")
+@click.option("--generic-depth", default=CorpusConfig.generic_depth, show_default=True,
+              help="Maximum nesting depth of generic types.")
+@click.option("--comment-ratio", default=CorpusConfig.comment_ratio, show_default=True,
+              help="Share of documented declarations.")
+@click.option("--extern-types", default=CorpusConfig.extern_types, show_default=True,
+              help="Number of types declared in an extern YAML file.")
+@click.option("--target", "-t", "targets", multiple=True, type=click.Choice(TARGETS), default=TARGETS,
+              show_default=True, help="Targets that are generated.")
+@click.option("--repeat", "-r", default=5, show_default=True, type=click.IntRange(min=1),
+              help="Number of measured runs.")
+@click.option("--warmup", default=1, show_default=True, type=click.IntRange(min=0),
+              help="Number of runs before measuring.")
+@click.option("--jobs", "-j", default=1, show_default=True, type=click.IntRange(min=1),
+              help="Number of types that are rendered in parallel.")
+@click.option("--parser-engine", type=click.Choice(["antlr", "fast"]), default="antlr", show_default=True,
+              help="Engine that parses the IDL files.")
+@click.option("--no-memory", is_flag=True, help="Skip the additional run that measures the peak memory.")
+@click.option("--output", "-o", type=click.Path(dir_okay=False, path_type=Path),
+              help="Write the results as JSON to the given file.")
+@click.option("--compare", type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              help="Compare against the JSON results of a previous benchmark.")
+def main(seed, files, namespaces, records, interfaces, enums, fields, methods, generic_depth, comment_ratio,
+         extern_types, targets, repeat, warmup, jobs, parser_engine, no_memory, output, compare):
+    """
+    Benchmark parsing, resolving, marshalling, rendering and writing on a synthetic IDL corpus.
+    """
+    config = CorpusConfig(
+        seed=seed, files=files, namespaces=namespaces, records=records, interfaces=interfaces, enums=enums,
+        fields=fields, methods=methods, generic_depth=generic_depth, comment_ratio=comment_ratio,
+        extern_types=extern_types
+    )
+    results = benchmark(
+        config, list(targets), repeat=repeat, warmup=warmup, jobs=jobs, memory=not no_memory,
+        parser_engine=parser_engine
+    )
+    if output:
+        output.write_text(json.dumps(results, indent=2))
+    baseline = json.loads(compare.read_text()) if compare else None
+    click.echo(report(results, baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import yaml
+
+PRIMITIVES = ["bool", "i8", "i16", "i32", "i64", "f32", "f64", "string", "binary", "date"]
+KEY_PRIMITIVES = ["i32", "i64", "string"]
+
+
+@dataclass
+class CorpusConfig:
+    """
+    Shape of a synthetic IDL corpus. The same configuration always produces the same corpus.
+    """
+    seed: int = 0
+    files: int = 4
+    """Number of IDL files. Each file imports all previous files, the last one is the root file."""
+    namespaces: int = 4
+    """Number of namespaces that declarations are distributed across, in addition to the global namespace."""
+    records: int = 200
+    interfaces: int = 100
+    enums: int = 40
+    fields: int = 6
+    """Number of fields per record."""
+    methods: int = 6
+    """Number of methods per interface."""
+    generic_depth: int = 3
+    """Maximum nesting depth of generic collection types."""
+    comment_ratio: float = 0.5
+    """Share of declarations that are documented with a Markdown comment."""
+    extern_types: int = 20
+    """Number of record types that are declared in an extern YAML file."""
+
+
+@dataclass
+class Corpus:
+    root: Path
+    """The IDL file that transitively imports the whole corpus."""
+    files: list[Path] = field(default_factory=list)
+    """All generated IDL and extern YAML files."""
+
+    @property
+    def size(self) -> int:
+        return sum(file.stat().st_size for file in self.files)
+
+
+@dataclass
+class _Declaration:
+    name: str
+    namespace: str
+    kind: str
+
+    @property
+    def reference(self) -> str:
+        return f"{self.namespace}.{self.name}" if self.namespace else self.name
+
+
+class _CorpusGenerator:
+    def __init__(self, config: CorpusConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.records: list[_Declaration] = []
+        self.interfaces: list[_Declaration] = []
+        self.enums: list[_Declaration] = []
+        self.extern_records = [
+            _Declaration(name=f"extern_record_{index}", namespace="external", kind="record")
+            for index in range(config.extern_types)
+        ]
+
+    def namespace(self, index: int) -> str:
+        namespace_index = index % (self.config.namespaces + 1)
+        if namespace_index == self.config.namespaces:
+            return ""
+        return f"group_{namespace_index}" if namespace_index % 2 else f"group_{namespace_index}.nested"
+
+    def comment(self, indent: str, summary: str, params: list[str] = (), returns: bool = False) -> list[str]:
+        if self.random.random() >= self.config.comment_ratio:
+            return []
+        lines = [
+            summary,
+            "",
+            f"Synthetic declaration with **bold**, *emphasized* and `inline code`. Seed: {self.random.random():.6f}",
+        ]
+        lines += [f"@param {param} description of `{param}`" for param in params]
+        if returns:
+            lines.append("@returns the synthetic result")
+        if self.random.random() < 0.05:
+            lines.append("@deprecated kept for compatibility")
+        return [f"{indent}# {line}".rstrip() for line in lines]
+
+    def value_type(self, depth: int, allow_optional: bool = True) -> str:
+        """A random field, parameter or return type that only references previously declared types."""
+        choice = self.random.random()
+        if depth > 0 and choice < 0.3:
+            generic = self.random.choice(["list", "set", "map"])
+            if generic == "list":
+                type_ref = f"list<{self.value_type(depth - 1, allow_optional=False)}>"
+            elif generic == "set":
+                type_ref = f"set<{self.random.choice(KEY_PRIMITIVES)}>"
+            else:
+                type_ref = (
+                    f"map<{self.random.choice(KEY_PRIMITIVES)}, {self.value_type(depth - 1, allow_optional=False)}>"
+                )
+        elif choice < 0.5 and self.records:
+            type_ref = self.random.choice(self.records).reference
+        elif choice < 0.6 and self.enums:
+            type_ref = self.random.choice(self.enums).reference
+        elif choice < 0.65 and self.extern_records:
+            type_ref = self.random.choice(self.extern_records).reference
+        else:
+            type_ref = self.random.choice(PRIMITIVES)
+        if allow_optional and self.random.random() < 0.1:
+            type_ref += "?"
+        return type_ref
+
+    def enum(self, index: int) -> tuple[_Declaration, list[str]]:
+        declaration = _Declaration(name=f"enum_{index}", namespace=self.namespace(index), kind="enum")
+        lines = self.comment("", f"Enum number {index}")
+        lines.append(f"{declaration.name} = enum {{")
+        lines += [f"    item_{item};" for item in range(self.random.randint(2, 8))]
+        lines.append("}")
+        return declaration, lines
+
+    def record(self, index: int) -> tuple[_Declaration, list[str]]:
+        declaration = _Declaration(name=f"record_{index}", namespace=self.namespace(index), kind="record")
+        lines = self.comment("", f"Record number {index}")
+        lines.append(f"{declaration.name} = record {{")
+        for field_index in range(self.config.fields):
+            lines += self.comment("    ", f"Field number {field_index}")
+            lines.append(f"    field_{field_index}: {self.value_type(self.config.generic_depth)};")
+        lines.append("} deriving (eq)" if self.random.random() < 0.3 else "}")
+        return declaration, lines
+
+    def interface(self, index: int) -> tuple[_Declaration, list[str]]:
+        declaration = _Declaration(name=f"interface_{index}", namespace=self.namespace(index), kind="interface")
+        lines = self.comment("", f"Interface number {index}")
+        lines.append(f"{declaration.name} = main interface +cpp {{")
+        for method_index in range(self.config.methods):
+            params = [f"param_{param_index}" for param_index in range(self.random.randint(0, 4))]
+            parameters = []
+            for param in params:
+                if self.interfaces and self.random.random() < 0.1:
+                    parameters.append(f"{param}: {self.random.choice(self.interfaces).reference}")
+                else:
+                    parameters.append(f"{param}: {self.value_type(self.config.generic_depth)}")
+            returns = self.random.random() < 0.7
+            lines += self.comment("    ", f"Method number {method_index}", params, returns)
+            modifier = self.random.choice(["", "", "static ", "const "])
+            return_type = f" -> {self.value_type(self.config.generic_depth)}" if returns else ""
+            lines.append(f"    {modifier}method_{method_index}({', '.join(parameters)}){return_type};")
+        lines.append("}")
+        return declaration, lines
+
+    def declarations(self) -> list[tuple[str, int]]:
+        """All declarations in a deterministic, interleaved order."""
+        declarations = (
+            [("enum", index) for index in range(self.config.enums)]
+            + [("record", index) for index in range(self.config.records)]
+            + [("interface", index) for index in range(self.config.interfaces)]
+        )
+        order = {"enum": 0, "record": 1, "interface": 2}
+        # records may only reference previously declared records, but should be spread across all files
+        return sorted(declarations, key=lambda item: (item[1] * 3 + order[item[0]]))
+
+    def extern_yaml(self) -> str:
+        documents = []
+        for declaration in self.extern_records:
+            name = declaration.name
+            class_name = "".join(part.capitalize() for part in name.split("_"))
+            documents.append({
+                "name": name,
+                "namespace": [declaration.namespace],
+                "primitive": "record",
+                "comment": f"Extern record {name}",
+                "cpp": {
+                    "typename": f"::external::{class_name}",
+                    "header": f"external/{name}.hpp",
+                    "by_value": False,
+                },
+                "java": {
+                    "typename": f"external.{class_name}",
+                    "boxed": f"external.{class_name}",
+                    "reference": True,
+                    "generic": False,
+                },
+                "jni": {
+                    "translator": f"::external::jni::{class_name}",
+                    "header": f"external/marshal_{name}.hpp",
+                    "typename": "jobject",
+                    "type_signature": f"Lexternal/{class_name};",
+                    "boxed_type_signature": f"Lexternal/{class_name};",
+                },
+                "objc": {
+                    "typename": f"EXT{class_name}",
+                    "boxed": f"EXT{class_name}",
+                    "header": f"EXT{class_name}.h",
+                    "pointer": True,
+                },
+                "objcpp": {
+                    "translator": f"::external::objcpp::{class_name}",
+                    "header": f"EXT{class_name}+Private.h",
+                },
+                "cppcli": {
+                    "typename": f"::External::CppCli::{class_name}",
+                    "translator": f"::External::CppCli::{class_name}",
+                    "header": f"CppCli{class_name}.hpp",
+                    "reference": True,
+                },
+            })
+        return yaml.safe_dump_all(documents, sort_keys=True)
+
+    def write(self, directory: Path) -> Corpus:
+        directory.mkdir(parents=True, exist_ok=True)
+        # namespace blocks per file, in order of appearance
+        file_blocks: list[dict[str, list[str]]] = [{} for _ in range(self.config.files)]
+        declarations = self.declarations()
+        for position, (kind, index) in enumerate(declarations):
+            file_index = position * self.config.files // len(declarations) if declarations else 0
+            declaration, lines = getattr(self, kind)(index)
+            getattr(self, f"{kind}s").append(declaration)
+            file_blocks[file_index].setdefault(declaration.namespace, []).extend(lines + [""])
+
+        corpus_files = []
+        extern_file = directory / "extern_types.yaml"
+        if self.extern_records:
+            extern_file.write_text(self.extern_yaml())
+            corpus_files.append(extern_file)
+        for file_index in range(self.config.files):
+            lines = []
+            if file_index == 0 and self.extern_records:
+                lines.append(f'@extern "{extern_file.name}"')
+            lines += [f'@import "corpus_{imported}.pydjinni"' for imported in range(file_index)]
+            lines.append("")
+            for namespace, block in file_blocks[file_index].items():
+                if namespace:
+                    lines.append(f"namespace {namespace} {{")
+                    lines += [f"    {line}".rstrip() for line in block]
+                    lines.append("}")
+                    lines.append("")
+                else:
+                    lines += block
+            idl_file = directory / f"corpus_{file_index}.pydjinni"
+            idl_file.write_text("\n".join(lines))
+            corpus_files.append(idl_file)
+        return Corpus(root=corpus_files[-1], files=corpus_files)
+
+
+def generate_corpus(directory: Path, config: CorpusConfig = CorpusConfig()) -> Corpus:
+    """
+    Writes a synthetic IDL corpus into the given directory.
+
+    The corpus consists of records, interfaces and enums that are spread across multiple namespaces and IDL files
+    that import each other. Types reference each other across files and namespaces, are nested in generic collections
+    up to the configured depth, are documented with Markdown comments and use record types from an extern YAML file.
+
+    Args:
+        directory: output directory for the corpus files
+        config: shape of the corpus
+
+    Returns:
+        the generated corpus
+    """
+    return _CorpusGenerator(config).write(directory)
@@ -0,0 +1,62 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from benchmark import TARGETS, main
+from corpus import CorpusConfig, generate_corpus
+
+SMALL_CORPUS = CorpusConfig(files=2, namespaces=2, records=6, interfaces=3, enums=2, extern_types=2)
+
+
+def test_corpus_is_deterministic(tmp_path: Path):
+    # WHEN generating the same corpus twice
+    first = generate_corpus(tmp_path / "first", SMALL_CORPUS)
+    second = generate_corpus(tmp_path / "second", SMALL_CORPUS)
+
+    # THEN both corpora should be identical
+    assert [file.name for file in first.files] == [file.name for file in second.files]
+    for first_file, second_file in zip(first.files, second.files):
+        assert first_file.read_text() == second_file.read_text()
+
+    # AND THEN the root file should import all other IDL files
+    assert first.root.name == "corpus_1.pydjinni"
+    assert '@import "corpus_0.pydjinni"' in first.root.read_text()
+
+
+def test_benchmark(tmp_path: Path):
+    # GIVEN an output file for the results
+    output = tmp_path / "results.json"
+
+    # WHEN benchmarking a small corpus
+    result = CliRunner().invoke(main, [
+        "--files", "2", "--records", "6", "--interfaces", "3", "--enums", "2", "--extern-types", "2",
+        "--repeat", "1", "--warmup", "0", "--output", str(output)
+    ])
+
+    # THEN the benchmark should succeed
+    assert result.exit_code == 0, result.output
+
+    # AND THEN all phases of all targets should have been measured
+    results = json.loads(output.read_text())
+    assert {"configure", "setup", "parse", "extern", "resolve"} <= set(results["phases"])
+    for target in TARGETS:
+        assert {f"{target}.marshal", f"{target}.write", f"{target}.generate"} <= set(results["phases"])
+        # the yaml target serializes the types directly, without templates
+        assert (f"{target}.render" in results["phases"]) == (target != "yaml")
+    assert results["peak_memory"] > 0
+    assert results["corpus"]["records"] == 6
@@ -15,17 +15,18 @@
 from __future__ import annotations
 
 import json
+import os
+from collections.abc import Callable, Iterator, Mapping
 from functools import cached_property
 from importlib.metadata import entry_points, EntryPoint
 from pathlib import Path
-from typing import Any
+from typing import Any, Generic, TypeVar, TYPE_CHECKING
 
 from pydjinni.builder.build_config import BuildBaseConfig
+from pydjinni.builder.target import BuildTarget
 from pydjinni.file.processed_files_model_builder import ProcessedFilesModelBuilder, ProcessedFiles
-from pydjinni.packaging.architecture import Architecture
-from pydjinni.packaging.packaging_config import PackageBaseConfig
-from pydjinni.packaging.target import PackageTarget
 from pydjinni.parser.ast import Namespace
+from pydjinni.parser.parse_cache import ParseCache
 from pydjinni.parser.parser import Parser
 
 try:
@@ -43,12 +44,19 @@ from pydjinni.generator.external_types import ExternalTypesBuilder
 from pydjinni.file.file_reader_writer import FileReaderWriter
 from pydjinni.generator.generate_config import GenerateBaseConfig
 from pydjinni.generator.target import Target
-from pydjinni.builder.target import BuildTarget
 from pydjinni.parser.base_models import BaseField, BaseType, BaseExternalType, TypeReference, FileReference
-from pydjinni.position import Position
+from pydjinni.position import Position, reset_files
+from pydjinni.profiler import profiled, span
 from pydjinni.parser.resolver import Resolver
 from pydjinni.parser.type_model_builder import TypeModelBuilder
 
+if TYPE_CHECKING:
+    from pydjinni.packaging.architecture import Architecture
+    from pydjinni.packaging.packaging_config import PackageBaseConfig
+    from pydjinni.packaging.target import PackageTarget
+
+TargetType = TypeVar("TargetType")
+
 
 def combine_into(d: dict, combined: dict) -> None:
     for k, v in d.items():
@@ -79,6 +87,63 @@ def get_config(config: Any, key: str, base_path: str = None) -> Any:
         raise ConfigurationException(f"Missing configuration for '{'.'.join([base_path, key]) if base_path else key}'")
 
 
+class TargetPlugins(Mapping[str, TargetType], Generic[TargetType]):
+    """
+    The targets provided by the plugins of an entry point group, by name of the entry point.
+
+    A plugin is only loaded and initialized once its target is accessed. Listing the names of the available targets
+    does not load any plugin.
+    """
+
+    def __init__(self, group: str, init_plugin: Callable[[EntryPoint], TargetType]):
+        self._plugins: dict[str, EntryPoint] = {plugin.name: plugin for plugin in entry_points(group=group)}
+        self._init_plugin = init_plugin
+        self._targets: dict[str, TargetType] = {}
+        self._internal: dict[str, bool] = {}
+
+    def __getitem__(self, key: str) -> TargetType:
+        target = self._targets.get(key)
+        if target is None:
+            target = self._init_plugin(self._plugins[key])
+            self._targets[key] = target
+        return target
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._plugins)
+
+    def __len__(self) -> int:
+        return len(self._plugins)
+
+    def load(self, keys: set[str]) -> None:
+        """
+        Loads the plugins with the given names. Unknown names are ignored.
+        """
+        for key in self._plugins:
+            if key in keys:
+                self[key]
+
+    @property
+    def loaded(self) -> tuple[str, ...]:
+        """
+        Names of all plugins that have been loaded so far.
+        """
+        return tuple(self._targets)
+
+    def internal(self, key: str) -> bool:
+        """
+        Whether the target is an internal component. The flag is read once from the class of the plugin, without
+        initializing it.
+        """
+        internal = self._internal.get(key)
+        if internal is None:
+            target = self._targets.get(key)
+            target_class = type(target) if target is not None else self._plugins[key].load()
+            # `internal` is a property of the base class, internal targets override it with a class attribute
+            internal = getattr(target_class, "internal", False) is True
+            self._internal[key] = internal
+        return internal
+
+
 class API:
     """
     PyDjinni has a powerful API that can be used to control the code generation directly from Python:
@@ -102,21 +167,30 @@ class API:
         self._config_model_builder = ConfigModelBuilder()
         self._external_type_model_builder = TypeModelBuilder(BaseExternalType)
         self._processed_files_model_builder = ProcessedFilesModelBuilder()
-        # initializing plugins
-        self._generate_targets = [
-            self._init_generator_plugin(plugin) for plugin in entry_points(group="pydjinni.generator")
-        ]
-        self._build_targets = [self._init_build_plugin(plugin) for plugin in entry_points(group="pydjinni.builder")]
-        self._package_targets = [
-            self._init_package_plugin(plugin) for plugin in entry_points(group="pydjinni.packaging")
-        ]
-
-        # generate models
-        self._configuration_model = self._config_model_builder.build()
-        self._external_type_model = self._external_type_model_builder.build()
-        self._processed_files_model = self._processed_files_model_builder.build()
-        self._file_reader_writer.setup(self._processed_files_model)
-        self._external_types_builder = ExternalTypesBuilder(self._external_type_model)
+        # plugins are only initialized once they are needed
+        self._generate_targets: TargetPlugins[Target] = TargetPlugins("pydjinni.generator", self._init_generator_plugin)
+        self._build_targets: TargetPlugins[BuildTarget] = TargetPlugins("pydjinni.builder", self._init_build_plugin)
+        self._package_targets: TargetPlugins[PackageTarget] = TargetPlugins(
+            "pydjinni.packaging", self._init_package_plugin
+        )
+        self._models_plugins: tuple | None = None
+
+    def _load_all_plugins(self):
+        for targets in (self._generate_targets, self._build_targets, self._package_targets):
+            targets.load(set(targets))
+
+    def _build_models(self):
+        """
+        (Re-)generates the models from all plugins that have been loaded so far.
+        """
+        loaded_plugins = (self._generate_targets.loaded, self._build_targets.loaded, self._package_targets.loaded)
+        if loaded_plugins != self._models_plugins:
+            self._models_plugins = loaded_plugins
+            self._configuration_model = self._config_model_builder.build()
+            self._external_type_model = self._external_type_model_builder.build()
+            self._processed_files_model = self._processed_files_model_builder.build()
+            self._file_reader_writer.setup(self._processed_files_model)
+            self._external_types_builder = ExternalTypesBuilder(self._external_type_model)
 
     @property
     def configuration_model(self) -> type[BaseModel]:
@@ -126,6 +200,8 @@ class API:
         Returns:
             the `pydantic` model that defines the required configuration structure.
         """
+        self._load_all_plugins()
+        self._build_models()
         return self._configuration_model
 
     @property
@@ -136,6 +212,8 @@ class API:
         Returns:
             The `pydantic` model that defines the required datastructure for external types.
         """
+        self._load_all_plugins()
+        self._build_models()
         return self._external_type_model
 
     @property
@@ -146,26 +224,28 @@ class API:
         Returns:
             The `pydantic` model that defines the datastructure that will be generated by PyDjinni.
         """
+        self._load_all_plugins()
+        self._build_models()
         return self._processed_files_model
 
-    @cached_property
-    def generation_targets(self) -> dict[str, Target]:
+    @property
+    def generation_targets(self) -> Mapping[str, Target]:
         """
         Caution:
             The returned `Target` types are not considered part of the stable public API. Internals may change with any
             release.
         Returns:
-            dictionary of all available generator targets.
+            mapping of all available generator targets. The targets are loaded on first access.
         """
-        return {target.key: target for target in self._generate_targets}
+        return self._generate_targets
 
-    @cached_property
-    def package_targets(self) -> dict[str, PackageTarget]:
-        return {target.key: target for target in self._package_targets}
+    @property
+    def package_targets(self) -> Mapping[str, PackageTarget]:
+        return self._package_targets
 
-    @cached_property
-    def build_targets(self) -> dict[str, BuildTarget]:
-        return {target.key: target for target in self._build_targets}
+    @property
+    def build_targets(self) -> Mapping[str, BuildTarget]:
+        return self._build_targets
 
     @cached_property
     def internal_types(self) -> list:
@@ -173,10 +253,31 @@ class API:
         Returns:
             A list of all pre-defined types that are available to use in the IDL.
         """
-        for target in self._generate_targets:
+        self._load_all_plugins()
+        self._build_models()
+        for target in self._generate_targets.values():
             target.register_external_types(self._external_types_builder)
         return self._external_types_builder.build()
 
+    @staticmethod
+    def _configured_keys(config_dict: dict | None, section: str) -> set[str]:
+        """
+        Keys of a configuration section, including the keys that are provided by environment variables or the `.env`
+        file in the format `PYDJINNI__<SECTION>__<KEY>...`.
+        """
+        section_dict = (config_dict or {}).get(section)
+        keys = set(section_dict.keys()) if isinstance(section_dict, dict) else set()
+        variables = list(os.environ)
+        if Path(".env").is_file():
+            from dotenv import dotenv_values
+
+            variables += list(dotenv_values(".env"))
+        prefix = f"pydjinni__{section}__"
+        for variable in variables:
+            if variable.lower().startswith(prefix):
+                keys.add(variable[len(prefix):].split("__")[0].lower())
+        return keys
+
     def _init_generator_plugin(self, plugin: EntryPoint) -> Target:
         return plugin.load()(
             file_reader_writer=self._file_reader_writer,
@@ -191,6 +292,7 @@ class API:
     def _init_package_plugin(self, plugin: EntryPoint) -> PackageTarget:
         return plugin.load()(config_model_builder=self._config_model_builder, root_path=self._root_path)
 
+    @profiled("configure", lambda *args, **kwargs: {"name": "configure"})
     def configure(self, path: Path | str | None = None, options: dict | None = None) -> ConfiguredContext:
         """
         Parses the configuration input.
@@ -239,11 +341,19 @@ class API:
             else:
                 config_dict = dict()
             combine_into(options, config_dict)
+            # only the plugins that are configured are required to validate and process the configuration
+            for section, targets in [
+                ("generate", self._generate_targets),
+                ("build", self._build_targets),
+                ("package", self._package_targets),
+            ]:
+                targets.load(self._configured_keys(config_dict, section))
+            self._build_models()
             config = self._configuration_model.model_validate(config_dict)
             return API.ConfiguredContext(
                 config=config,
                 root_path=self._root_path,
-                external_types_model=self.external_type_model,
+                external_types_model=self._external_type_model,
                 generate_targets=self.generation_targets,
                 package_targets=self.package_targets,
                 build_targets=self.build_targets,
@@ -260,9 +370,9 @@ class API:
             config: BaseModel,
             root_path: Path,
             external_types_model: type[BaseExternalType],
-            generate_targets: dict[str, Target],
-            package_targets: dict[str, PackageTarget],
-            build_targets: dict[str, BuildTarget],
+            generate_targets: TargetPlugins[Target],
+            package_targets: TargetPlugins[PackageTarget],
+            build_targets: TargetPlugins[BuildTarget],
             file_reader_writer: FileReaderWriter,
         ):
             self._config = config
@@ -277,7 +387,7 @@ class API:
             self._generate_config: GenerateBaseConfig = self._config.generate
             generate_targets: list[str] = list(self._generate_config.model_fields_set) if self._generate_config else []
             self._configured_targets: list[Target] = [
-                target for key, target in self._generate_targets.items() if key in generate_targets
+                self._generate_targets[key] for key in self._generate_targets if key in generate_targets
             ]
 
         @property
@@ -292,11 +402,23 @@ class API:
             """
             return self._config
 
-        def parse(self, idl: Path | str) -> GenerateContext:
+        @profiled("setup", lambda *args, **kwargs: {"name": "parse"})
+        def parse(
+            self,
+            idl: Path | str | list[Path | str],
+            use_cache: bool = True,
+            import_cache: Parser.ImportCache | None = None,
+        ) -> GenerateContext:
             """
             Parses the given IDL into an Abstract Syntax tree. Does not generate any file output.
             Args:
-                idl: Path to the IDL file that should be processed.
+                idl: Path to the IDL file that should be processed, or a list of IDL files. Multiple IDL files are
+                     combined into one AST. Each IDL file can only use the types that it declares or imports.
+                     Files that are imported by more than one IDL file are only parsed once.
+                use_cache: if set to `False`, the configured `cache_dir` is ignored and no cached results are used.
+                import_cache: in-memory cache of imported files that is kept across multiple calls. Only imports
+                              that have not changed since the previous call are reused, the given IDL files are always
+                              parsed again. Must not be shared between different configured contexts.
 
             Returns:
                 context that can be used to generate output
@@ -307,33 +429,92 @@ class API:
                 IdlParser.DuplicateTypeException : When a type is re-declared.
                 IdlParser.MarshalException       : When an error happened during marshalling.
             """
-            if isinstance(idl, str):
-                idl = Path(idl)
+            idls = [Path(item) if isinstance(item, str) else item for item in (idl if isinstance(idl, list) else [idl])]
 
             external_types_builder = ExternalTypesBuilder(self._external_types_model)
 
-            for target in self.configured_targets:
-                target.register_external_types(external_types_builder)
-                target.configure(self._generate_config)
+            if self._generate_config.incremental and not self._generate_config.cache_dir:
+                raise ConfigurationException("'generate.incremental' requires 'generate.cache_dir' to be configured!")
 
-            self.resolver.reset()
-            for external_type_def in external_types_builder.build():
-                self.resolver.register(external_type_def)
+            cache_dir = self._generate_config.cache_dir if use_cache else None
+            if cache_dir and not cache_dir.is_absolute():
+                cache_dir = self._root_path / cache_dir
+            parse_cache = ParseCache(cache_dir / "ast", self._generate_config.cache_max_size) if cache_dir else None
 
-            parser = Parser(
-                resolver=self.resolver,
-                targets=self.configured_targets,
-                supported_target_keys=[key for key, value in self._generate_targets.items() if not value.internal],
-                file_reader=self._file_reader_writer,
-                include_dirs=[
-                    dir if dir.is_absolute() else self._root_path / dir for dir in self._generate_config.include_dirs
-                ],
-                default_deriving=set(self._generate_config.default_deriving),
-                idl=idl,
-            )
-
-            # parsing the input IDL. The output is an AST that contains type definitions for each provided marshal
-            type_defs, type_refs, file_imports, fields, ast = parser.parse()
+            for target in self.configured_targets:
+                target.register_external_types(external_types_builder)
+                target.configure(
+                    self._generate_config,
+                    cache_dir=cache_dir,
+                    incremental=self._generate_config.incremental,
+                    inputs=[Parser.ImportCache.key(idl) for idl in idls],
+                )
+
+            self._file_reader_writer.setup_write_if_changed(self._generate_config.write_if_changed)
+
+            if import_cache is None:
+                import_cache = Parser.ImportCache()
+            import_cache.refresh()
+            if import_cache.external_type_defs is None:
+                # cached imports reference the external types that they have been resolved against
+                import_cache.external_type_defs = external_types_builder.build()
+
+            reset_files()
+
+            type_defs: list[BaseType] = []
+            type_refs: list[TypeReference] = []
+            file_imports: list[FileReference] = []
+            fields: list[BaseField] = []
+            ast: list[BaseType | Namespace] = []
+            parsed: set[Path] = set()
+            try:
+                for idl in idls:
+                    key = Parser.ImportCache.key(idl)
+                    if key in parsed:
+                        # already included as import of a previously parsed IDL file
+                        continue
+                    # each IDL file can only resolve the types of its own (transitive) imports. Imports that are
+                    # shared with a previous IDL file are registered again from the import cache, without parsing them
+                    self.resolver.reset()
+                    for external_type_def in import_cache.external_type_defs:
+                        self.resolver.register(external_type_def)
+                    import_cache.registered = set()
+                    import_cache.invalidate({key})
+                    import_cache.roots.append(key)
+                    parser = Parser(
+                        resolver=self.resolver,
+                        targets=self.configured_targets,
+                        supported_target_keys=[
+                            key for key in self._generate_targets if not self._generate_targets.internal(key)
+                        ],
+                        file_reader=self._file_reader_writer,
+                        include_dirs=[
+                            dir if dir.is_absolute() else self._root_path / dir
+                            for dir in self._generate_config.include_dirs
+                        ],
+                        default_deriving=set(self._generate_config.default_deriving),
+                        idl=idl,
+                        import_cache=import_cache,
+                        parse_cache=parse_cache,
+                        engine=self._generate_config.parser_engine,
+                    )
+
+                    # parsing the input IDL. The output is an AST that contains type definitions for each provided
+                    # marshal
+                    idl_type_defs, idl_type_refs, idl_file_imports, idl_fields, idl_ast = parser.parse()
+                    parsed |= import_cache.registered
+
+                    # imports that are shared between multiple IDL files are contained in the result of each of them
+                    known_type_defs = {id(type_def) for type_def in type_defs}
+                    type_defs += [type_def for type_def in idl_type_defs if id(type_def) not in known_type_defs]
+                    known_type_refs = {id(type_ref) for type_ref in type_refs}
+                    type_refs += [type_ref for type_ref in idl_type_refs if id(type_ref) not in known_type_refs]
+                    file_imports += idl_file_imports
+                    fields += idl_fields
+                    ast += idl_ast
+            finally:
+                if parse_cache:
+                    parse_cache.prune()
 
             return API.ConfiguredContext.GenerateContext(
                 generate_targets=self._generate_targets,
@@ -431,7 +612,7 @@ class API:
         class GenerateContext:
             def __init__(
                 self,
-                generate_targets: dict[str, Target],
+                generate_targets: Mapping[str, Target],
                 file_writer: FileReaderWriter,
                 type_defs: list[BaseType],
                 type_refs: list[TypeReference],
@@ -451,19 +632,30 @@ class API:
                 self._config = config
                 self._resolver = resolver
 
-            def generate(self, target_name: str, clean: bool = False) -> API.ConfiguredContext.GenerateContext:
+            def generate(
+                self, target_name: str, clean: bool = False, jobs: int = 1
+            ) -> API.ConfiguredContext.GenerateContext:
                 """
                 generate output for a specified target based on the previously parsed IDL.
                 Args:
                     target_name: name (key) of the target.
                     clean: if set to `True`, all output directories are purged before generating output, to make sure
                            that no leftovers from previous executions are still present.
+                    jobs: number of threads that render types in parallel. The generated files and the processed
+                          files report are identical to a sequential run. Only free-threaded interpreters render
+                          faster with multiple jobs.
 
                 Returns:
                     the same context. Generation commands can be chained.
                 """
                 target = self._generate_targets[target_name]
-                target.generate(self.type_defs, clean=clean, copy_support_lib_sources=self._config.support_lib_sources)
+                with span(target_name, "generate", target=target_name):
+                    target.generate(
+                        self.type_defs,
+                        clean=clean,
+                        copy_support_lib_sources=self._config.support_lib_sources,
+                        jobs=jobs
+                    )
                 return self
 
             @property
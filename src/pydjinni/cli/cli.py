@@ -12,18 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import glob
 import logging
 import sys
 from collections import defaultdict
 from pathlib import Path
 
 import click
+from rich.console import Console
 from rich.logging import RichHandler
-from rich.pretty import pretty_repr
+from rich.table import Table
 
 from pydjinni.api import API, combine_into
 from pydjinni.defs import DEFAULT_CONFIG_PATH
-from pydjinni.exceptions import ApplicationException, ApplicationExceptionList
+from pydjinni.exceptions import ApplicationException, ApplicationExceptionList, FileNotFoundException
 from .context import (
     CliContext, pass_cli_context,
     GenerateContext, pass_generate_context,
@@ -32,6 +34,7 @@ from .context import (
     PublishConfigurationContext, pass_publish_configuration_context
 )
 from pydjinni.packaging.architecture import Architecture
+from pydjinni.profiler import Profiler
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +52,69 @@ def main():
         exit(e.items[0].code)
 
 
+def print_profile(profiler: Profiler, limit: int = 10):
+    """
+    Prints the time spent per phase and per target, as well as the slowest types and templates.
+    """
+    total = profiler.duration
+
+    def table(title: str, columns: list[str], rows: list[list[str]], labels: int = 1) -> Table:
+        output = Table(title=title, title_justify="left")
+        for index, column in enumerate(columns):
+            output.add_column(column, justify="left" if index < labels else "right")
+        for row in rows:
+            output.add_row(*row)
+        return output
+
+    def seconds(duration: float) -> str:
+        return f"{duration * 1000:.1f} ms"
+
+    phases = profiler.totals(lambda span: span.category)
+    phase_rows = [
+        [phase, seconds(duration), f"{duration / total:.1%}" if total else "-", str(count)]
+        for phase, (duration, count) in phases.items()
+    ]
+    phase_rows.append(["total", seconds(total), "", ""])
+
+    target_phases = profiler.totals(lambda span: (span.target, span.category) if span.target else None)
+    targets = list(profiler.totals(lambda span: span.target))
+    target_columns = [phase for phase in phases if any((target, phase) in target_phases for target in targets)]
+    target_rows = [
+        [target]
+        + [seconds(target_phases.get((target, phase), (0.0, 0))[0]) for phase in target_columns]
+        + [seconds(sum(target_phases.get((target, phase), (0.0, 0))[0] for phase in target_columns))]
+        for target in targets
+    ]
+
+    types = profiler.totals(
+        lambda span: (span.args["generator"], span.args["type"]) if "type" in span.args else None
+    )
+    templates = profiler.totals(
+        lambda span: (span.args["generator"], span.args["template"]) if "template" in span.args else None
+    )
+
+    console = Console()
+    console.print(table("Phases", ["phase", "time", "share", "calls"], phase_rows))
+    console.print(table("Targets", ["target", *target_columns, "total"], target_rows))
+    console.print(table(f"Slowest types (top {limit})", ["type", "generator", "render time"], [
+        [name, generator, seconds(duration)] for (generator, name), (duration, _) in list(types.items())[:limit]
+    ], labels=2))
+    console.print(table(f"Slowest templates (top {limit})", ["template", "generator", "renders", "render time"], [
+        [template, generator, str(count), seconds(duration)]
+        for (generator, template), (duration, count) in list(templates.items())[:limit]
+    ], labels=2))
+    if profiler.counters:
+        cache_rows = []
+        for (category, name), values in sorted(profiler.counters.items()):
+            hits, misses = values.get("hits", 0), values.get("misses", 0)
+            cache_rows.append([
+                category, name, str(hits), str(misses),
+                f"{hits / (hits + misses):.1%}" if hits + misses else "-",
+                str(values.get("size", 0))
+            ])
+        console.print(table("Caches", ["cache", "name", "hits", "misses", "hit rate", "entries"], cache_rows, labels=2))
+
+
 class MultiCommand(click.Group):
     @staticmethod
     def get_api(context: click.Context):
@@ -76,7 +142,7 @@ class GenerateCli(MultiCommand):
         @pass_generate_context
         def command(generate_context: GenerateContext):
             logger.info(f"generating files for target '{name}'")
-            return generate_context.context.generate(name, clean=generate_context.clean)
+            return generate_context.context.generate(name, clean=generate_context.clean, jobs=generate_context.jobs)
 
         return None if target is None else command
 
@@ -169,7 +235,12 @@ class PublishCli(MultiCommand):
 @click.option("--log-level", "-l", default="info",
               type=click.Choice(["debug", "info", "warn", "error"], case_sensitive=False),
               help="Log level")
-def cli(ctx, log_level, config, option):
+@click.option("--profile", is_flag=True,
+              help="Print the time spent per phase and target, and the slowest types and templates.")
+@click.option("--trace", type=Path,
+              help="Write a trace of all phases in the Chrome trace event format to the given file. "
+                   "The trace can be viewed with Perfetto or `chrome://tracing`.")
+def cli(ctx, log_level, config, option, profile, trace):
     def parse_option(option: str) -> dict:
         """
         helper to parse options in the format `foo.bar=baz` into a hierarchical dict
@@ -203,6 +274,19 @@ def cli(ctx, log_level, config, option):
     )
     logger.setLevel(log_level)
 
+    if profile or trace:
+        profiler = Profiler()
+
+        @ctx.call_on_close
+        def report():
+            if profile:
+                print_profile(profiler)
+            if trace:
+                profiler.write_trace(trace)
+                logger.info(f"trace available at: {trace.absolute()}")
+
+        ctx.with_resource(profiler)
+
     options_dict = dict()
     for value in option:
         combine_into(parse_option(value), options_dict)
@@ -212,13 +296,53 @@ def cli(ctx, log_level, config, option):
     api = API()
     context = api.configure(path=config, options=options_dict)
     logger.debug("Configuration:")
-    logger.debug(pretty_repr(context.config))
+    if logger.level <= logging.DEBUG:
+        from rich.pretty import pretty_repr
+
+        logger.debug(pretty_repr(context.config))
     ctx.obj = CliContext(
         api=api,
         context=context
     )
 
 
+def expand_idl_argument(idl: str, base_dir: Path = Path()) -> list[Path]:
+    """
+    Resolves the IDL argument of the `generate` command into a list of IDL files.
+
+    Args:
+        idl: path to an IDL file, a glob pattern or a manifest file prefixed with `@`. Manifest files list one IDL file
+             or glob pattern per line, relative to the manifest file. Empty lines and lines starting with `#` are
+             ignored.
+        base_dir: directory that relative paths and patterns are resolved against.
+
+    Returns:
+        the IDL files in the given order. Glob matches are sorted.
+
+    Raises:
+        FileNotFoundException: if a manifest file doesn't exist or a glob pattern doesn't match any file.
+    """
+    if idl.startswith("@"):
+        manifest = base_dir / idl[1:]
+        try:
+            lines = manifest.read_text().splitlines()
+        except FileNotFoundError:
+            raise FileNotFoundException(manifest)
+        idl_files = []
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                idl_files += expand_idl_argument(line, manifest.parent)
+        return idl_files
+    elif any(character in idl for character in "*?["):
+        matches = sorted(glob.glob(idl, root_dir=base_dir, recursive=True))
+        if not matches:
+            raise FileNotFoundException(base_dir / idl)
+        return [base_dir / match for match in matches]
+    else:
+        return [base_dir / idl]
+
+
 @cli.group(cls=GenerateCli, chain=True)
 @pass_cli_context
 @click.pass_context
@@ -227,27 +351,45 @@ def cli(ctx, log_level, config, option):
     is_flag=True,
     help="If enabled, deletes all specified output directories before generating new output. "
          "Caution: This deletes the entire output folders, including all files that are inside it!")
-@click.argument('idl', type=Path)
-def generate(ctx, cli_context: CliContext, idl: Path, clean: bool):
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help="If enabled, ignores the configured `generate.cache_dir` and processes all inputs from scratch.")
+@click.option(
+    '--jobs', '-j',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of threads that render types in parallel. Only speeds up generation on free-threaded Python builds.")
+@click.argument('idl', type=str)
+def generate(ctx, cli_context: CliContext, idl: str, clean: bool, no_cache: bool, jobs: int):
     """
     Generate glue-code from the provided IDL file.
 
+    IDL is either a path to a single IDL file, a glob pattern (e.g. `'idl/**/*.djinni'`) or a manifest file prefixed
+    with `@` (e.g. `@idl-files.txt`) that lists one IDL file or glob pattern per line. All IDL files are processed with
+    the same configuration and are reported in one combined processed files report.
+
     COMMAND specifies the target languages.
     """
-    logger.info("parsing IDL")
-    context = cli_context.context.parse(idl)
+    idl_files = expand_idl_argument(idl)
+    logger.info("parsing IDL" if len(idl_files) == 1 else f"parsing {len(idl_files)} IDL files")
+    context = cli_context.context.parse(idl_files, use_cache=not no_cache)
     logger.debug("generated AST:")
     if logger.level <= logging.DEBUG:
+        from rich.pretty import pretty_repr
+
         logger.debug(pretty_repr(context.ast))
     ctx.obj = GenerateContext(
         api=cli_context.api,
         context=context,
-        clean=clean
+        clean=clean,
+        jobs=jobs
     )
 
 
 @generate.result_callback()
-def generate_callback(generate_context, idl, clean):
+def generate_callback(generate_context, idl, clean, no_cache, jobs):
     output = generate_context[0].write_processed_files()
     if output:
         logger.info(f"report available at: {output.absolute()}")
@@ -32,9 +32,10 @@ class CliContext(Context[API.ConfiguredContext]):
 
 
 class GenerateContext(Context[API.ConfiguredContext.GenerateContext]):
-    def __init__(self, api: API, context: ContextType, clean: bool):
+    def __init__(self, api: API, context: ContextType, clean: bool, jobs: int = 1):
         super().__init__(api, context)
         self.clean = clean
+        self.jobs = jobs
 
 
 class PackageConfigurationContext(Context[API.ConfiguredContext]):
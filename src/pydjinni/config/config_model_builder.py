@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import inspect
+from functools import cache
 
 from pydantic import create_model, BaseModel
 from pydantic.fields import FieldInfo
@@ -47,7 +48,9 @@ class Settings(BaseSettings):
 
 class ConfigModelBuilder:
     """
-    Generates the final config schema from all loaded plugins
+    Generates the final config schema from all loaded plugins.
+
+    Built models are memoized per process, keyed on the registered plugin config models.
     """
 
     def __init__(self):
@@ -66,32 +69,49 @@ class ConfigModelBuilder:
 
 
     def build(self):
+        return self._build(
+            tuple(self._generator_config_models.items()),
+            tuple(self._builder_config_models.items()),
+            tuple(self._package_config_models.items())
+        )
+
+    @staticmethod
+    @cache
+    def _build(
+        generator_config_models: tuple[tuple[str, type[BaseModel]], ...],
+        builder_config_models: tuple[tuple[str, type[BaseModel]], ...],
+        package_config_models: tuple[tuple[str, type[BaseModel]], ...]
+    ):
+        create_config_model = ConfigModelBuilder._create_config_model
         return create_model(
             "Config",
             __base__=Settings,
             generate=(
-                self._create_config_model("Generate", GenerateBaseConfig, self._generator_config_models) | None,
+                create_config_model("Generate", GenerateBaseConfig, generator_config_models) | None,
                 FieldInfo(
                     default=None,
                     description=inspect.cleandoc(GenerateBaseConfig.__doc__)
                 )
             ),
             build=(
-                self._create_config_model("Build", BuildBaseConfig, self._builder_config_models) | None, FieldInfo(
+                create_config_model("Build", BuildBaseConfig, builder_config_models) | None, FieldInfo(
                     default=None,
                     description=inspect.cleandoc(BuildBaseConfig.__doc__)
                 )
             ),
             package=(
-                self._create_config_model("Package", PackageBaseConfig, self._package_config_models) | None, FieldInfo(
+                create_config_model("Package", PackageBaseConfig, package_config_models) | None, FieldInfo(
                     default=None,
                     description=inspect.cleandoc(PackageBaseConfig.__doc__)
                 )
             )
         )
 
-    def _create_config_model(self, model_name: str, base: type[BaseModel], models: dict[str, type[BaseModel]]):
-        field_kwargs = {key: (config_model, None) for key, config_model in models.items()}
+    @staticmethod
+    def _create_config_model(
+        model_name: str, base: type[BaseModel], models: tuple[tuple[str, type[BaseModel]], ...]
+    ):
+        field_kwargs = {key: (config_model, None) for key, config_model in models}
         return create_model(
             model_name,
             __base__=base,
@@ -48,3 +48,13 @@ class IdentifierStyle(BaseModel):
         default=None,
         description="Prefix that is added to the beginning of the identifier"
     )
+
+
+class ParserEngine(str, Enum):
+    antlr = 'antlr'
+    """Parser generated by ANTLR from the IDL grammar. Reference implementation."""
+    fast = 'fast'
+    """
+    Hand-written recursive descent parser. Considerably faster than the ANTLR parser.
+    Input with syntax errors is parsed again with the ANTLR parser, so that errors are reported the same way.
+    """
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import filecmp
 import json
+import locale
+import os
 import shutil
 from pathlib import Path
 
@@ -21,6 +24,7 @@ import yaml
 
 from pydjinni.exceptions import ConfigurationException
 from pydjinni.file.processed_files_model_builder import ProcessedFiles
+from pydjinni.profiler import profiled
 
 
 class FileReaderWriter:
@@ -33,13 +37,28 @@ class FileReaderWriter:
         self._root_path = root_path
         self._processed_files = None
         self._used_keys: list[str] = []
+        self._write_if_changed = False
 
     def _to_absolute_path(self, path: Path):
         return path if path.is_absolute() else self._root_path / path
 
+    def absolute_path(self, path: Path) -> Path:
+        """
+        Returns:
+            the given path, relative to the root path if it is not absolute. Generated files are written to this path.
+        """
+        return self._to_absolute_path(path)
+
     def setup(self, processed_files_model: type[ProcessedFiles]):
         self._processed_files = processed_files_model().model_copy(deep=True)
 
+    def setup_write_if_changed(self, write_if_changed: bool):
+        """
+        If enabled, generated files are only written if their content differs from the existing file. Unchanged files
+        keep their modification time, so that downstream build systems don't rebuild them.
+        """
+        self._write_if_changed = write_if_changed
+
     def setup_include_dir(self, key: str, include_dir: Path):
         generator = getattr(self.processed_files.generated, key)
         generator.include_dir = self._to_absolute_path(include_dir)
@@ -64,42 +83,95 @@ class FileReaderWriter:
             self.processed_files.parsed.external_types.append(filename)
         return filename.read_text()
 
-    def write_source(self, key: str, filename: Path, content: str, append: bool = True):
-        absolute_filename = self._write(filename, content)
+    def write_source(self, key: str, filename: Path, content: str, append: bool = True) -> Path:
+        absolute_filename, written = self._write(filename, content)
         if append:
             generator = getattr(self.processed_files.generated, key)
             generator.source.append(absolute_filename)
+            self._record_output(absolute_filename, written)
             self._used_keys.append(key)
+        return absolute_filename
+
+    def keep_source(self, key: str, filename: Path):
+        """
+        Records a previously generated source file that is still up to date, without writing it again.
+        """
+        absolute_filename = self._to_absolute_path(filename)
+        generator = getattr(self.processed_files.generated, key)
+        generator.source.append(absolute_filename)
+        self._record_output(absolute_filename, False)
+        self._used_keys.append(key)
 
-    def write_header(self, key: str, filename: Path, content: str, append: bool = True):
-        absolute_filename = self._write(filename, content)
+    def write_header(self, key: str, filename: Path, content: str, append: bool = True) -> Path:
+        absolute_filename, written = self._write(filename, content)
         if append:
             generator = getattr(self.processed_files.generated, key)
             generator.header.append(absolute_filename)
+            self._record_output(absolute_filename, written)
             self._used_keys.append(key)
+        return absolute_filename
 
-    def _write(self, filename: Path, content: str) -> Path:
+    def keep_header(self, key: str, filename: Path):
+        """
+        Records a previously generated header file that is still up to date, without writing it again.
+        """
         absolute_filename = self._to_absolute_path(filename)
+        generator = getattr(self.processed_files.generated, key)
+        generator.header.append(absolute_filename)
+        self._record_output(absolute_filename, False)
+        self._used_keys.append(key)
+
+    def _record_output(self, filename: Path, written: bool):
+        if written:
+            self.processed_files.written.append(filename)
+        else:
+            self.processed_files.unchanged.append(filename)
+
+    @staticmethod
+    def _encode(content: str) -> bytes:
+        # same newline translation and encoding that `Path.write_text()` applies
+        return content.replace("\n", os.linesep).encode(locale.getpreferredencoding(False))
+
+    @staticmethod
+    def _has_content(filename: Path, data: bytes) -> bool:
+        try:
+            return filename.stat().st_size == len(data) and filename.read_bytes() == data
+        except FileNotFoundError:
+            return False
+
+    @profiled("write", lambda self, filename, content: {"name": filename.name, "file": filename})
+    def _write(self, filename: Path, content: str) -> tuple[Path, bool]:
+        absolute_filename = self._to_absolute_path(filename)
+        data = self._encode(content)
+        if self._write_if_changed and self._has_content(absolute_filename, data):
+            return absolute_filename, False
         absolute_filename.parent.mkdir(parents=True, exist_ok=True)
-        absolute_filename.write_text(content)
-        return absolute_filename
+        absolute_filename.write_bytes(data)
+        return absolute_filename, True
 
-    def _copy(self, source_file: Path, target_file: Path) -> Path:
+    def _copy(self, source_file: Path, target_file: Path) -> tuple[Path, bool]:
         absolute_target_file = self._to_absolute_path(target_file)
         absolute_source_file = self._to_absolute_path(source_file)
+        if (
+            self._write_if_changed
+            and absolute_target_file.exists()
+            and filecmp.cmp(absolute_source_file, absolute_target_file, shallow=False)
+        ):
+            return absolute_target_file, False
         absolute_target_file.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy(absolute_source_file, absolute_target_file)
-        return absolute_target_file
+        return absolute_target_file, True
 
     def copy_source_directory(self, key: str, source_dir: Path, target_dir: Path, append: bool = True):
         if source_dir.exists():
             for file_path in source_dir.rglob('*'):
                 if file_path.is_file():
                     target_file_path = target_dir / file_path.relative_to(source_dir)
-                    absolute_target_filename = self._copy(file_path, target_file_path)
+                    absolute_target_filename, written = self._copy(file_path, target_file_path)
                     if append:
                         generator = getattr(self.processed_files.generated, key)
                         generator.source.append(absolute_target_filename)
+                        self._record_output(absolute_target_filename, written)
                         self._used_keys.append(key)
 
     def copy_header_directory(self, key: str, header_dir: Path, target_dir: Path, append: bool = True):
@@ -107,10 +179,11 @@ class FileReaderWriter:
             for file_path in header_dir.rglob('*'):
                 if file_path.is_file():
                     target_file_path = target_dir / file_path.relative_to(header_dir)
-                    absolute_target_filename = self._copy(file_path, target_file_path)
+                    absolute_target_filename, written = self._copy(file_path, target_file_path)
                     if append:
                         generator = getattr(self.processed_files.generated, key)
                         generator.header.append(absolute_target_filename)
+                        self._record_output(absolute_target_filename, written)
                         self._used_keys.append(key)
 
     def write_processed_files(self, filename: Path):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import cache
 from pathlib import Path
 
 from pydantic import BaseModel, Field, create_model
@@ -29,9 +30,24 @@ class ProcessedFiles(BaseModel):
         )
 
     parsed: ParsedFiles = ParsedFiles()
+    written: list[Path] = Field(
+        default=[],
+        description="List of generated files that have been written."
+    )
+    unchanged: list[Path] = Field(
+        default=[],
+        description="List of generated files that have not been written, because their content has not changed. "
+                    "Only populated if `generate.write_if_changed` or `generate.incremental` is enabled."
+    )
 
 
 class ProcessedFilesModelBuilder:
+    """
+    Generates the model of the processed files report from all loaded generators.
+
+    Built models are memoized per process, keyed on the registered generator outputs.
+    """
+
     def __init__(self):
         self._generated_fields: dict[str, tuple[bool, bool]] = {}
 
@@ -39,7 +55,12 @@ class ProcessedFilesModelBuilder:
         self._generated_fields[key] = (header, source)
 
     def build(self):
-        generated_files_model = self._generated_files_model()
+        return self._build(tuple(self._generated_fields.items()))
+
+    @staticmethod
+    @cache
+    def _build(generated_fields: tuple[tuple[str, tuple[bool, bool]], ...]):
+        generated_files_model = ProcessedFilesModelBuilder._generated_files_model(generated_fields)
         generated_files_model.__doc__ = "List of generated files from all registered generators"
         return create_model(
             "ProcessedFiles",
@@ -47,7 +68,8 @@ class ProcessedFilesModelBuilder:
             generated=(generated_files_model, generated_files_model())
         )
 
-    def _generated_files_model(self):
+    @staticmethod
+    def _generated_files_model(generated_fields: tuple[tuple[str, tuple[bool, bool]], ...]):
         def key_model(key: str, fields: tuple[bool, bool]):
             fields_kwargs = {}
             if fields[0]:
@@ -74,7 +96,7 @@ class ProcessedFilesModelBuilder:
             )
 
         field_kwargs = {}
-        for key, fields in self._generated_fields.items():
+        for key, fields in generated_fields:
             model = key_model(key, fields)
             field_kwargs[key] = (model, model())
         return create_model(
@@ -17,10 +17,10 @@ from pathlib import PurePosixPath
 
 from pydantic import BaseModel, Field, computed_field
 
-from pydjinni.generator.cpp.cpp.comment_renderer import DoxygenCommentRenderer
 from pydjinni.generator.cpp.cpp.config import CppConfig
 from pydjinni.generator.cpp.cpp.keywords import keywords
 from pydjinni.generator.filters import headers, quote
+from pydjinni.generator.type_specifiers import TypeSpecifierCache
 from pydjinni.generator.validator import validate
 from pydjinni.parser.ast import Parameter, Record, Interface, Function, Enum, ErrorDomain, Flags
 from pydjinni.parser.base_models import (
@@ -57,30 +57,38 @@ def deprecated(decl: BaseCommentModel, prefix: str = "", postfix: str = ""):
     return f"{prefix}[[deprecated{message}]]{postfix}" if decl.deprecated else ""
 
 
+def type_specifier(type_ref: TypeReference | None, is_parameter: bool = False, not_null: str | None = None) -> str:
+    output = type_ref.type_def.cpp.typename if type_ref else "void"
+    if type_ref:
+        if type_ref.parameters:
+            parameter_output = ""
+            for parameter in type_ref.parameters:
+                if parameter_output:
+                    parameter_output += ", "
+                parameter_output += type_specifier(parameter)
+            output += f"<{parameter_output}>"
+        if type_ref.type_def.primitive == BaseExternalType.Primitive.interface:
+            output = f"std::shared_ptr<{output}>"
+            if not_null and not type_ref.optional:
+                output = f"{not_null}<{output}>"
+        elif type_ref.optional and not type_ref.type_def.primitive == BaseExternalType.Primitive.function:
+            output = f"std::optional<{output}>"
+    return f"const {output} &" if is_parameter and not type_ref.type_def.cpp.by_value else output
+
+
 class CppBaseCommentModel(BaseModel):
     decl: BaseCommentModel = Field(exclude=True, repr=False)
     config: CppConfig = Field(exclude=True, repr=False)
 
     def _type_specifier(self, type_ref: TypeReference, is_parameter: bool = False, use_notnull: bool = False) -> str:
-        output = type_ref.type_def.cpp.typename if type_ref else "void"
-        if type_ref:
-            if type_ref.parameters:
-                parameter_output = ""
-                for parameter in type_ref.parameters:
-                    if parameter_output:
-                        parameter_output += ", "
-                    parameter_output += self._type_specifier(parameter)
-                output += f"<{parameter_output}>"
-            if type_ref.type_def.primitive == BaseExternalType.Primitive.interface:
-                output = f"std::shared_ptr<{output}>"
-                if use_notnull and self.config.not_null.type and not type_ref.optional:
-                    output = f"{self.config.not_null.type}<{output}>"
-            elif type_ref.optional and not type_ref.type_def.primitive == BaseExternalType.Primitive.function:
-                output = f"std::optional<{output}>"
-        return f"const {output} &" if is_parameter and not type_ref.type_def.cpp.by_value else output
+        return TypeSpecifierCache.of(self.config).get(
+            type_specifier, type_ref, is_parameter, self.config.not_null.type if use_notnull else None
+        )
 
     @cached_property
     def comment(self):
+        from pydjinni.generator.cpp.cpp.comment_renderer import DoxygenCommentRenderer
+
         return DoxygenCommentRenderer(self.config.identifier).render_tokens(*self.decl._parsed_comment).strip() \
             if self.decl._parsed_comment else ''
 
@@ -22,10 +22,10 @@ from pydjinni.parser.ast import Interface, Record
 from pydjinni.parser.identifier import IdentifierType as Identifier
 
 from pydjinni.parser.ast import Function
-from .comment_renderer import XmlCommentRenderer
 from .config import CppCliConfig
 from .keywords import keywords
 from pydjinni.parser.base_models import BaseType, BaseField, TypeReference, DataField, BaseCommentModel
+from pydjinni.generator.type_specifiers import TypeSpecifierCache
 from pydjinni.generator.validator import validate
 
 from pydjinni.generator.filters import headers, quote
@@ -65,6 +65,8 @@ class CppCliBaseCommentModel(BaseModel):
 
     @cached_property
     def comment(self):
+        from .comment_renderer import XmlCommentRenderer
+
         return XmlCommentRenderer(self.config.identifier).render(*self.decl._parsed_comment).strip() \
             if self.decl._parsed_comment else ''
 
@@ -152,11 +154,11 @@ class CppCliBaseField(CppCliBaseCommentModel):
 
     @cached_property
     def typename(self) -> str:
-        return typename(self.decl.type_ref)
+        return TypeSpecifierCache.of(self.config).get(typename, self.decl.type_ref)
 
     @cached_property
     def translator(self) -> str:
-        return translator(self.decl.type_ref)
+        return TypeSpecifierCache.of(self.config).get(translator, self.decl.type_ref)
 
     @cached_property
     def nullability_attribute(self) -> str:
@@ -195,15 +197,15 @@ class CppCliInterface(CppCliBaseType):
 
         @cached_property
         def typename(self) -> str:
-            return typename(self.decl.return_type_ref, self.decl.asynchronous)
+            return TypeSpecifierCache.of(self.config).get(typename, self.decl.return_type_ref, self.decl.asynchronous)
 
         @cached_property
         def synchronous_typename(self) -> str:
-            return typename(self.decl.return_type_ref)
+            return TypeSpecifierCache.of(self.config).get(typename, self.decl.return_type_ref)
 
         @cached_property
         def translator(self) -> str:
-            return translator(self.decl.return_type_ref)
+            return TypeSpecifierCache.of(self.config).get(translator, self.decl.return_type_ref)
 
         @cached_property
         def async_proxy_name(self) -> str:
@@ -350,7 +352,7 @@ class CppCliFunction(CppCliBaseType):
 
     @cached_property
     def return_typename(self) -> str:
-        return typename(self.decl.return_type_ref)
+        return TypeSpecifierCache.of(self.config).get(typename, self.decl.return_type_ref)
 
     @computed_field
     @cached_property
@@ -102,6 +102,6 @@ class ExternalTypesBuilder:
                 params=model.params,
                 **field_kwargs
             )
-            type_decl._parsed_comment = MarkdownParser().parse(model.comment, namespace=model.namespace)
+            type_decl._parsed_comment = MarkdownParser().parse_deferred(model.comment, namespace=model.namespace)
             output.append(type_decl)
         return output
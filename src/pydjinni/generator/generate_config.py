@@ -16,6 +16,7 @@ from pathlib import Path
 
 from pydantic import BaseModel, Field
 
+from pydjinni.config.types import ParserEngine
 from pydjinni.parser.ast import Record
 
 
@@ -39,3 +40,28 @@ class GenerateBaseConfig(BaseModel):
         default=True,
         description="Whether the required support lib sources should be copied to the generated output."
     )
+    write_if_changed: bool = Field(
+        default=False,
+        description="Only write generated files if their content has changed. "
+                    "Unchanged files keep their modification time, which avoids unnecessary rebuilds."
+    )
+    incremental: bool = Field(
+        default=False,
+        description="Only render types whose declaration, dependencies, configuration or templates have changed since "
+                    "the last run. Outputs of removed types are deleted. Requires `cache_dir` to be configured."
+    )
+    cache_dir: Path = Field(
+        default=None,
+        description="Directory where intermediate results are cached across runs to speed up repeated generation. "
+                    "Caching is disabled if no directory is configured."
+    )
+    cache_max_size: int = Field(
+        default=256 * 1024 * 1024,
+        description="Maximum size of the parse cache in bytes. "
+                    "If the limit is exceeded, the least recently used entries are evicted."
+    )
+    parser_engine: ParserEngine = Field(
+        default=ParserEngine.antlr,
+        description="Engine that parses the IDL files. The `fast` engine is a hand-written parser that is considerably "
+                    "faster than the ANTLR parser. Files with syntax errors are always parsed by the ANTLR parser."
+    )
@@ -12,14 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import inspect
+import json
 import re
 import shutil
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Callable, TypeVar
+from typing import Callable, Iterator, TypeVar
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template
 from pydantic import BaseModel
 
 from pydjinni.config.config_model_builder import ConfigModelBuilder
@@ -29,13 +33,16 @@ from pydjinni.file.file_reader_writer import FileReaderWriter
 from pydjinni.file.processed_files_model_builder import ProcessedFilesModelBuilder
 from pydjinni.parser.base_models import BaseExternalType, BaseType, BaseField
 from pydjinni.parser.type_model_builder import TypeModelBuilder
+from pydjinni.profiler import profiled
 from .external_types import ExternalTypesBuilder
+from .manifest import GenerationManifest, TypeFingerprints, code_fingerprint, directory_fingerprint
 from .metadata import MetadataBase
 
 ConfigModel = TypeVar("ConfigModel", bound=BaseModel)
 ExternalTypeModel = TypeVar("ExternalTypeModel", bound=BaseModel)
 MetadataModel = TypeVar("MetadataModel", bound=BaseModel)
 
+
 class Generator(ABC):
     """
     Abstract class for defining generators. Each generator can utilize one or more Marshal classes, specified as
@@ -49,6 +56,56 @@ class Generator(ABC):
             super().__init__(message)
             self.input_def = input_def
 
+    _generate_handlers: dict[type, Callable[["Generator", BaseType], None]] = {}
+    _registered_marshal_models: dict[type, type] = {}
+    _generate_dispatch: dict[type, Callable[["Generator", BaseType], None] | str | None] = {}
+    _marshal_dispatch: dict[type, type | None] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._generate_handlers = {}
+        cls._registered_marshal_models = {}
+        cls._generate_dispatch = {}
+        cls._marshal_dispatch = {}
+
+    @classmethod
+    def register_generate_handler(cls, ast_type: type[BaseType], handler: Callable[["Generator", BaseType], None]):
+        """
+        Registers a function that generates the given AST type and all types deriving from it. Registered handlers
+        take precedence over `generate_<type>` methods for the same AST type.
+
+        Args:
+            ast_type: the AST type, e.g. `Interface`.
+            handler: called with the generator instance and the type definition.
+        """
+        cls._generate_handlers[ast_type] = handler
+        cls._clear_dispatch_tables()
+
+    @classmethod
+    def register_marshal_model(cls, ast_type: type[BaseModel], marshal_model: type[BaseModel]):
+        """
+        Registers a marshalling model for the given AST type and all types deriving from it. Registered models take
+        precedence over the `marshal_models` mapping.
+        """
+        cls._registered_marshal_models[ast_type] = marshal_model
+        cls._clear_dispatch_tables()
+
+    @classmethod
+    def _registered(cls, registry: str, ast_type: type):
+        """Looks up an explicit registration for the AST type, starting at the most derived generator class"""
+        for generator_class in cls.__mro__:
+            registered = generator_class.__dict__.get(registry)
+            if registered and ast_type in registered:
+                return registered[ast_type]
+        return None
+
+    @classmethod
+    def _clear_dispatch_tables(cls):
+        cls._generate_dispatch = {}
+        cls._marshal_dispatch = {}
+        for subclass in cls.__subclasses__():
+            subclass._clear_dispatch_tables()
+
     @property
     @abstractmethod
     def key(self) -> str:
@@ -156,8 +213,9 @@ class Generator(ABC):
         If no marshalling model is found, an error will be thrown suggesting that the given AST type is not supported
         by the generator.
 
-        The generator will search for a matching marshalling model by traversing the type hierarchy of the AST type until
-        a matching marshalling model is found.
+        The generator will search for a matching marshalling model by traversing the method resolution order of the AST
+        type until a matching marshalling model is found. Additional models can be registered with
+        `register_marshal_model`.
 
         A marshalling model must be a Pydantic model with two fields:
         - `decl` for the type of field declaration and
@@ -223,6 +281,12 @@ class Generator(ABC):
         self._generator_directory = Path(inspect.getfile(self.__class__)).parent
         self.config: ConfigModel | None = None
         self.metadata: MetadataBase | None = None
+        self._templates: dict[tuple[str, ...], Template] = {}
+        self._templates_lock = threading.Lock()
+        self._manifest: GenerationManifest | None = None
+        self._rendering = threading.local()
+        # renders types in parallel. If not set, types are rendered sequentially
+        self.executor: Executor | None = None
 
         self._jinja_env = Environment(
             loader=FileSystemLoader(self._generator_directory / "templates"),
@@ -278,9 +342,38 @@ class Generator(ABC):
         if self.external_types:
             external_types_factory.register(self.key, self.external_types)
 
-    def configure(self, config: ConfigModel, metadata: MetadataBase):
+    def configure(
+            self,
+            config: ConfigModel,
+            metadata: MetadataBase,
+            cache_dir: Path | None = None,
+            config_fingerprint: str | None = None,
+            inputs: list[Path] | None = None):
+        """
+        Args:
+            config: the generator configuration.
+            metadata: metadata that is passed to all templates.
+            cache_dir: directory for intermediate results. If not set, nothing is cached.
+            config_fingerprint: fingerprint of the whole generate configuration. If provided together with `cache_dir`,
+                generation is incremental and only types that have changed since the last run are rendered.
+            inputs: the IDL files that are generated. Incremental runs only share their manifest with previous runs
+                of the same input files.
+        """
         self.config = config
         self.metadata = metadata
+        if cache_dir and config_fingerprint:
+            self._manifest = GenerationManifest(
+                path=cache_dir / "manifest" / f"{self.key}-{self._manifest_key(inputs or [])}.json",
+                fingerprint=self.fingerprint(config_fingerprint)
+            )
+        else:
+            self._manifest = None
+        if cache_dir:
+            template_cache_dir = cache_dir / "templates" / self.key
+            template_cache_dir.mkdir(parents=True, exist_ok=True)
+            self._jinja_env.bytecode_cache = FileSystemBytecodeCache(str(template_cache_dir))
+        else:
+            self._jinja_env.bytecode_cache = None
         if self.writes_header:
             self._file_writer.setup_include_dir(self.key, self.header_path)
         if self.writes_source:
@@ -318,6 +411,80 @@ class Generator(ABC):
         else:
             return out
 
+    def fingerprint(self, config_fingerprint: str) -> str:
+        """
+        Fingerprint of everything besides the type definitions that influences the generated output: The configuration,
+        the metadata, the PyDjinni sources and the templates and marshalling code of the generator.
+        """
+        return hashlib.sha256("\0".join([
+            config_fingerprint,
+            self.metadata.model_dump_json() if self.metadata else "",
+            code_fingerprint(),
+            directory_fingerprint(self._generator_directory),
+        ]).encode()).hexdigest()
+
+    @property
+    def _output_directories(self) -> list[Path]:
+        """
+        The absolute output directories of the generator.
+        """
+        directories = [self.header_path] if self.writes_header else []
+        if self.writes_source:
+            directories.append(self.source_path)
+        return [self._file_writer.absolute_path(directory) for directory in directories]
+
+    def _manifest_key(self, inputs: list[Path]) -> str:
+        """
+        Key of the generation manifest. Runs that share the cache directory, but generate different input files or
+        write to different output directories, each have their own manifest and don't consider each other's outputs
+        stale.
+        """
+        return hashlib.sha256(json.dumps([
+            [path.as_posix() for path in sorted(inputs)],
+            [directory.as_posix() for directory in self._output_directories],
+        ]).encode()).hexdigest()[:16]
+
+    def _template_cache_key(self, template: Path) -> tuple[str, ...]:
+        return (
+            Path(template).as_posix(),
+            self.template_optional_variable_prefix,
+            self.template_line_statement_prefix,
+            self.template_variable_start_string,
+            self.template_variable_end_string,
+        )
+
+    def get_template(self, template: Path) -> Template:
+        """
+        Returns the compiled template for the given template path.
+
+        Each template is preprocessed and compiled only once per generator instance. If a bytecode cache is configured,
+        the compiled code is additionally persisted, so that subsequent runs can skip the compilation entirely.
+        """
+        key = self._template_cache_key(template)
+        compiled_template = self._templates.get(key)
+        if compiled_template is None:
+            with self._templates_lock:
+                compiled_template = self._templates.get(key)
+                if compiled_template is None:
+                    name = Path(template).as_posix()
+                    filename = str(self._generator_directory / "templates" / template)
+                    source = self.template_preprocessing(template)
+                    bytecode_cache = self._jinja_env.bytecode_cache
+                    if bytecode_cache is not None:
+                        bucket = bytecode_cache.get_bucket(self._jinja_env, name, filename, source)
+                        if bucket.code is None:
+                            bucket.code = self._jinja_env.compile(source, name, filename)
+                            bytecode_cache.set_bucket(bucket)
+                        code = bucket.code
+                    else:
+                        code = self._jinja_env.compile(source, name, filename)
+                    compiled_template = self._jinja_env.template_class.from_code(
+                        self._jinja_env, code, self._jinja_env.make_globals(None)
+                    )
+                    self._templates[key] = compiled_template
+        return compiled_template
+
+    @profiled("render", lambda self, *args, **kwargs: self._describe_output(*args, **kwargs))
     def write_header(self, template: Path, filename: Path = None, **kwargs):
         """
         Method that must be used for any header file that is written by the generator.
@@ -329,10 +496,10 @@ class Generator(ABC):
         assert kwargs.get('type_def') or filename, "If no type_def is given, an explicit filename must be provided"
         if kwargs.get('type_def') and filename is None:
             filename = getattr(kwargs['type_def'], self.key).header
-        self._file_writer.write_header(
-            key=self.key,
+        self._write_output(
+            kind="header",
             filename=self.header_path / filename,
-            content=self._jinja_env.from_string(self.template_preprocessing(template)).render(
+            content=self.get_template(template).render(
                 config=self.config,
                 is_header=True,
                 metadata=self.metadata,
@@ -340,6 +507,7 @@ class Generator(ABC):
             )
         )
 
+    @profiled("render", lambda self, *args, **kwargs: self._describe_output(*args, **kwargs))
     def write_source(self, template: Path, filename: Path = None, **kwargs):
         """
         Method that must be used for any source file that is written by the generator.
@@ -351,10 +519,10 @@ class Generator(ABC):
         assert kwargs.get('type_def') or filename, "If no type_def is given, an explicit filename must be provided"
         if kwargs.get('type_def') and filename is None:
             filename = getattr(kwargs['type_def'], self.key).source
-        self._file_writer.write_source(
-            key=self.key,
+        self._write_output(
+            kind="source",
             filename=self.source_path / filename,
-            content=self._jinja_env.from_string(self.template_preprocessing(template)).render(
+            content=self.get_template(template).render(
                 config=self.config,
                 is_header=False,
                 metadata=self.metadata,
@@ -362,6 +530,26 @@ class Generator(ABC):
             )
         )
 
+    def _describe_output(self, template: Path, filename: Path = None, **kwargs) -> dict:
+        """
+        Describes a rendered output for the profiler.
+        """
+        type_def = kwargs.get('type_def')
+        description = {"generator": self.key, "template": Path(template).as_posix()}
+        if type_def:
+            description["type"] = ".".join([*type_def.namespace, type_def.name])
+        description["name"] = description.get("type") or Path(filename).name
+        return description
+
+    def _write_output(self, kind: str, filename: Path, content: str):
+        rendered_outputs = getattr(self._rendering, "outputs", None)
+        if rendered_outputs is not None:
+            rendered_outputs.append((kind, filename, content))
+        elif kind == "header":
+            self._file_writer.write_header(key=self.key, filename=filename, content=content)
+        else:
+            self._file_writer.write_source(key=self.key, filename=filename, content=content)
+
     def generate_support_lib(self):
         """
         Copies support lib files if they exist. Fails silently if no files can be found in the expected directories.
@@ -406,42 +594,132 @@ class Generator(ABC):
             ...
         ```
 
-        If no direct match for the types class name can be found, the inheritance hierarchy is traversed until a match
-        was found.
+        If no direct match for the types class name can be found, the method resolution order of the type is traversed
+        until a match was found. Handlers registered with `register_generate_handler` take precedence over methods.
+        The resolved handler is cached for each type in the dispatch table of the generator class.
 
         Examples:
             - `def generate_interface(self, type_def: Interface)` will match for the `Interface` type.
             - `def generate_base_type(self, type_def: BaseType)` will match for all types deriving from `BaseType`
               if no better match can be found.
 
+        If an `executor` is set, the types are rendered in parallel. The rendered files are always written in the
+        order of the given type definitions.
+
         This method may be overridden if the default dynamic detection behaviour doesn't fit the requirements.
         """
-
-        def call_generate_method(definition: BaseType):
-            def traverse_hierarchy(def_class, definition):
-                if def_class == BaseExternalType:
-                    raise Generator.GenerationException(
-                        definition,
-                        f"The generator '{self.key}' does not support the type '{definition.__class__.__qualname__}'"
-                    )
-                qualifier = '_'.join([word.lower() for word in re.findall(r'[A-Z][a-z0-9]*', def_class.__qualname__)])
-                method_name = f"generate_{qualifier}"
-                if hasattr(self, method_name):
-                    getattr(self, method_name)(definition)
-                else:
-                    for base in def_class.__bases__:
-                        traverse_hierarchy(base, definition)
-
-            traverse_hierarchy(definition.__class__, definition)
-
         if self.config:
             if copy_support_lib_sources:
                 self.generate_support_lib()
-            for type_def in ast:
-                call_generate_method(type_def)
+            if self._manifest:
+                self._generate_incremental(ast)
+            else:
+                for _ in self._render_types(ast):
+                    pass
         else:
             raise ConfigurationException(f"Missing configuration for 'generator.{self.key}'!")
 
+    def _generate_handler(self, def_class: type) -> Callable[["Generator", BaseType], None] | str | None:
+        """
+        Resolves the registered handler or the name of the `generate_<type>` method for the given AST type by walking
+        its MRO up to `BaseExternalType`. The result is cached in the dispatch table of the generator class.
+        """
+        try:
+            return self._generate_dispatch[def_class]
+        except KeyError:
+            pass
+        handler = None
+        for base in def_class.__mro__:
+            if base is BaseExternalType:
+                break
+            handler = self._registered("_generate_handlers", base)
+            if handler is None:
+                qualifier = '_'.join([word.lower() for word in re.findall(r'[A-Z][a-z0-9]*', base.__qualname__)])
+                method_name = f"generate_{qualifier}"
+                handler = method_name if hasattr(type(self), method_name) else None
+            if handler is not None:
+                break
+        self._generate_dispatch[def_class] = handler
+        return handler
+
+    def _generate_type(self, definition: BaseType):
+        handler = self._generate_handler(type(definition))
+        if handler is None:
+            raise Generator.GenerationException(
+                definition,
+                f"The generator '{self.key}' does not support the type '{definition.__class__.__qualname__}'"
+            )
+        elif isinstance(handler, str):
+            getattr(self, handler)(definition)
+        else:
+            handler(self, definition)
+
+    def _render_type(self, type_def: BaseType) -> list[tuple[str, Path, str]]:
+        """
+        Calls the generate method for the given type, without writing any files.
+
+        Returns:
+            the kind (`header` or `source`), filename and content of each rendered file.
+        """
+        self._rendering.outputs = []
+        try:
+            self._generate_type(type_def)
+            return self._rendering.outputs
+        finally:
+            self._rendering.outputs = None
+
+    def _render_types(self, type_defs: list[BaseType]) -> Iterator[list[tuple[str, Path]]]:
+        """
+        Renders the given types and writes the resulting files in the order of the given type definitions.
+        If an executor is set, the types are rendered in parallel while the files are written by the calling thread.
+
+        Returns:
+            the kind and absolute path of the written files for each type.
+        """
+        if self.executor is not None and len(type_defs) > 1:
+            rendered_types = self.executor.map(self._render_type, type_defs)
+        else:
+            rendered_types = map(self._render_type, type_defs)
+        for rendered_outputs in rendered_types:
+            yield self._write_rendered(rendered_outputs)
+
+    def _write_rendered(self, rendered_outputs: list[tuple[str, Path, str]]) -> list[tuple[str, Path]]:
+        written_outputs = []
+        for kind, filename, content in rendered_outputs:
+            if kind == "header":
+                absolute_filename = self._file_writer.write_header(key=self.key, filename=filename, content=content)
+            else:
+                absolute_filename = self._file_writer.write_source(key=self.key, filename=filename, content=content)
+            written_outputs.append((kind, absolute_filename))
+        return written_outputs
+
+    def _generate_incremental(self, ast: list[BaseType]):
+        """
+        Only renders types whose fingerprint has changed since the last run. The outputs of unchanged types are
+        recorded without writing them, outputs that are no longer generated are deleted.
+        """
+        fingerprints = TypeFingerprints()
+        self._manifest.load()
+        type_entries = []
+        for type_def in ast:
+            key = fingerprints.key(type_def)
+            fingerprint = fingerprints.fingerprint(type_def)
+            type_entries.append((type_def, key, fingerprint, self._manifest.outputs(key, fingerprint)))
+        rendered_types = self._render_types([type_def for type_def, _, _, outputs in type_entries if outputs is None])
+        for type_def, key, fingerprint, outputs in type_entries:
+            if outputs is None:
+                outputs = next(rendered_types)
+            else:
+                for kind, filename in outputs:
+                    if kind == "header":
+                        self._file_writer.keep_header(self.key, filename)
+                    else:
+                        self._file_writer.keep_source(self.key, filename)
+            self._manifest.record(key, fingerprint, outputs)
+        for filename in self._manifest.stale_outputs(self._output_directories):
+            filename.unlink(missing_ok=True)
+        self._manifest.store()
+
     def marshal(self, type_decls: list[BaseType], field_decls: list[BaseField]):
         """
         Attaches marshalling models to the provided type and field definitions.
@@ -450,6 +728,8 @@ class Generator(ABC):
         If no direct match can be found, the inheritance hierarchy is traversed until a matching model is found.
 
         Once a matching marshalling model was found, it is initialized and attached to the given type/field definition.
+        The model is built with `model_construct`, skipping Pydantic validation: the declaration and the generator
+        config are already validated models, validating them again for every declaration only costs time and memory.
 
         Note:
             During attachment of the marshalling models, no actual marshalling is happening. Only during rendering of
@@ -460,22 +740,38 @@ class Generator(ABC):
         declaration passed to the method!
         """
 
-        def traverse_hierarchy(def_class, definition):
-            if def_class in [BaseExternalType, BaseModel]:
-                raise Generator.GenerationException(
-                    definition,
-                    f"Language feature '{definition.__class__.__qualname__}' is not supported for the target '{self.key}'"
-                )
-            if self.marshal_models.get(def_class):
-                definition.__setattr__(self.key, self.marshal_models[def_class](decl=definition, config=self.config))
-            else:
-                for base in def_class.__bases__:
-                    traverse_hierarchy(base, definition)
-
         if self.config:
-            if self.marshal_models:
+            if self.marshal_models or self._registered_marshal_models:
                 for definitions in [type_decls, field_decls]:
                     for definition in definitions:
-                        traverse_hierarchy(type(definition), definition)
+                        marshal_model = self._marshal_model(type(definition))
+                        if marshal_model is None:
+                            raise Generator.GenerationException(
+                                definition,
+                                f"Language feature '{definition.__class__.__qualname__}' is not supported for the "
+                                f"target '{self.key}'"
+                            )
+                        definition.__setattr__(
+                            self.key, marshal_model.model_construct(decl=definition, config=self.config)
+                        )
         else:
             raise ConfigurationException(f"Missing configuration for 'generator.{self.key}'!")
+
+    def _marshal_model(self, def_class: type) -> type | None:
+        """
+        Resolves the marshalling model for the given AST type by walking its MRO up to `BaseExternalType`. The result
+        is cached in the dispatch table of the generator class.
+        """
+        try:
+            return self._marshal_dispatch[def_class]
+        except KeyError:
+            pass
+        marshal_model = None
+        for base in def_class.__mro__:
+            if base in (BaseExternalType, BaseModel):
+                break
+            marshal_model = self._registered("_registered_marshal_models", base) or self.marshal_models.get(base)
+            if marshal_model is not None:
+                break
+        self._marshal_dispatch[def_class] = marshal_model
+        return marshal_model
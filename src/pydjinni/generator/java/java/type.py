@@ -17,7 +17,6 @@ from pathlib import PurePosixPath
 
 from pydantic import BaseModel, Field, computed_field
 
-from pydjinni.generator.java.java.comment_renderer import JavaDocCommentRenderer
 from pydjinni.generator.java.java.config import JavaConfig
 from pydjinni.generator.java.java.keywords import keywords
 from pydjinni.generator.validator import validate
@@ -107,6 +106,8 @@ class JavaBaseType(JavaBase):
 
     @cached_property
     def comment(self):
+        from pydjinni.generator.java.java.comment_renderer import JavaDocCommentRenderer
+
         return JavaDocCommentRenderer(self.config.identifier).render_tokens(*self.decl._parsed_comment).strip() \
             if self.decl._parsed_comment else ''
 
@@ -127,6 +128,8 @@ class JavaBaseField(JavaBase):
 
     @cached_property
     def comment(self):
+        from pydjinni.generator.java.java.comment_renderer import JavaDocCommentRenderer
+
         return JavaDocCommentRenderer(self.config.identifier).render_tokens(*self.decl._parsed_comment).strip() \
             if self.decl._parsed_comment else ''
 
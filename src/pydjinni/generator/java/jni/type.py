@@ -14,6 +14,7 @@
 
 from pydjinni.generator.cpp.cpp.keywords import keywords as cpp_keywords
 from pydjinni.generator.filters import headers, quote
+from pydjinni.generator.type_specifiers import TypeSpecifierCache
 from pydjinni.generator.validator import validate
 
 try:
@@ -206,7 +207,8 @@ class JniFunction(JniBaseType):
         return self.decl.return_type_ref.type_def.jni.typename if self.decl.return_type_ref else "void"
 
     @cached_property
-    def return_type_translator(self) -> str: return translator(self.decl.return_type_ref)
+    def return_type_translator(self) -> str:
+        return TypeSpecifierCache.of(self.config).get(translator, self.decl.return_type_ref)
 
     @property
     def source_includes(self) -> set[str]: return super().source_includes | {"<memory>"}
@@ -221,7 +223,7 @@ class JniBaseField(BaseModel):
     def name(self) -> str: return self.decl.name.convert(self.config.identifier.field)
 
     @property
-    def translator(self) -> str: return translator(self.decl.type_ref)
+    def translator(self) -> str: return TypeSpecifierCache.of(self.config).get(translator, self.decl.type_ref)
 
 
 class JniSymbolicConstantField(JniBaseField):
@@ -277,7 +279,8 @@ class JniInterface(JniBaseType):
                 return self.decl.return_type_ref.type_def.jni.typename if self.decl.return_type_ref else "void"
 
         @cached_property
-        def return_type_translator(self) -> str: return translator(self.decl.return_type_ref)
+        def return_type_translator(self) -> str:
+            return TypeSpecifierCache.of(self.config).get(translator, self.decl.return_type_ref)
 
 
 class JniParameter(JniBaseField):
@@ -0,0 +1,207 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+from enum import Enum
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from pydjinni.parser.ast import Namespace
+from pydjinni.parser.base_models import BaseExternalType, BaseCommentModel, TypeReference
+
+
+def directory_fingerprint(directory: Path) -> str:
+    """
+    Fingerprint of all files in the given directory, e.g. the templates and marshalling code of a generator.
+    """
+    fingerprint = hashlib.sha256()
+    for file in sorted(directory.rglob("*")):
+        if file.is_file() and "__pycache__" not in file.parts:
+            fingerprint.update(file.relative_to(directory).as_posix().encode())
+            fingerprint.update(b"\0")
+            fingerprint.update(file.read_bytes())
+    return fingerprint.hexdigest()
+
+
+@cache
+def code_fingerprint() -> str:
+    """
+    Fingerprint of the PyDjinni sources. Any change to the parser or the generators invalidates all manifests.
+    """
+    fingerprint = hashlib.sha256()
+    package_directory = Path(__file__).parent.parent
+    for file in sorted(package_directory.rglob("*.py")):
+        fingerprint.update(file.relative_to(package_directory).as_posix().encode())
+        fingerprint.update(b"\0")
+        fingerprint.update(file.read_bytes())
+    return fingerprint.hexdigest()
+
+
+class TypeFingerprints:
+    """
+    Computes the fingerprint of type definitions.
+
+    The fingerprint of a type covers its own declaration (without source positions), the file it has been declared in
+    and the declarations of all types that it transitively depends on. This includes types that are only referenced
+    in documentation comments, as those may be rendered as links in the generated output.
+    """
+
+    def __init__(self):
+        self._declarations: dict[int, tuple[str, list[BaseExternalType]]] = {}
+        self._fingerprints: dict[int, str] = {}
+
+    @staticmethod
+    def key(type_def: BaseExternalType) -> str:
+        return ".".join([*type_def.namespace, type_def.name])
+
+    def _serialize(self, value: Any, references: list[BaseExternalType]) -> Any:
+        match value:
+            case TypeReference():
+                if value.type_def is not None:
+                    references.append(value.type_def)
+                return {
+                    "type": self.key(value.type_def) if value.type_def is not None else value.name,
+                    "parameters": [self._serialize(parameter, references) for parameter in value.parameters],
+                    "optional": value.optional,
+                }
+            case Namespace():
+                return value.name
+            case BaseModel():
+                output = {
+                    name: self._serialize(getattr(value, name), references)
+                    for name in type(value).model_fields
+                    if name not in ("position", "identifier_position")
+                }
+                # deferred comments do not reference any types and are not parsed here
+                if isinstance(value, BaseCommentModel) and isinstance(value._comment, tuple):
+                    self._serialize(value._comment[0], references)
+                return output
+            case dict():
+                return {str(key): self._serialize(item, references) for key, item in value.items()}
+            case list() | tuple():
+                return [self._serialize(item, references) for item in value]
+            case set() | frozenset():
+                return sorted(str(self._serialize(item, references)) for item in value)
+            case Enum():
+                return value.value
+            case Path():
+                return value.as_posix()
+            case str() | int() | float() | bool() | None:
+                return value
+            case _:
+                return repr(value)
+
+    def _declaration(self, type_def: BaseExternalType) -> tuple[str, list[BaseExternalType]]:
+        declaration = self._declarations.get(id(type_def))
+        if declaration is None:
+            references: list[BaseExternalType] = []
+            dump = self._serialize(type_def, references)
+            if type_def.position and type_def.position.file:
+                dump["file"] = type_def.position.file.as_posix()
+            digest = hashlib.sha256(json.dumps(dump, sort_keys=True).encode()).hexdigest()
+            declaration = (digest, references)
+            self._declarations[id(type_def)] = declaration
+        return declaration
+
+    def fingerprint(self, type_def: BaseExternalType) -> str:
+        fingerprint = self._fingerprints.get(id(type_def))
+        if fingerprint is None:
+            visited: dict[int, str] = {}
+            pending = [type_def]
+            while pending:
+                current = pending.pop()
+                if id(current) not in visited:
+                    digest, references = self._declaration(current)
+                    visited[id(current)] = digest
+                    pending += references
+            own_digest = visited.pop(id(type_def))
+            fingerprint = hashlib.sha256(
+                "\0".join([own_digest, *sorted(visited.values())]).encode()
+            ).hexdigest()
+            self._fingerprints[id(type_def)] = fingerprint
+        return fingerprint
+
+
+class GenerationManifest:
+    """
+    Records the fingerprint of each generated type together with the files that have been written for it.
+
+    On subsequent runs, types with an unchanged fingerprint don't have to be rendered again, as long as all of their
+    output files still exist. Outputs of types that no longer produce them are reported as stale, so that they can be
+    deleted.
+    """
+
+    def __init__(self, path: Path, fingerprint: str):
+        self._path = path
+        self._fingerprint = fingerprint
+        self._previous: dict[str, dict] = {}
+        self._current: dict[str, dict] = {}
+
+    def load(self):
+        self._current = {}
+        try:
+            content = json.loads(self._path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            content = {}
+        if content.get("fingerprint") == self._fingerprint:
+            self._previous = content.get("types", {})
+        else:
+            self._previous = {
+                key: {"outputs": entry.get("outputs", [])} for key, entry in content.get("types", {}).items()
+            }
+
+    def outputs(self, key: str, fingerprint: str) -> list[tuple[str, Path]] | None:
+        """
+        Returns:
+            The outputs of the type if it is up to date, otherwise `None`.
+        """
+        entry = self._previous.get(key)
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return None
+        outputs = [(kind, Path(filename)) for kind, filename in entry["outputs"]]
+        if not all(filename.exists() for _, filename in outputs):
+            return None
+        return outputs
+
+    def record(self, key: str, fingerprint: str, outputs: list[tuple[str, Path]]):
+        self._current[key] = {
+            "fingerprint": fingerprint,
+            "outputs": [(kind, str(filename)) for kind, filename in outputs]
+        }
+
+    def stale_outputs(self, directories: list[Path]) -> list[Path]:
+        """
+        Args:
+            directories: the output directories of the generator. Recorded files outside of them are never stale.
+        Returns:
+            All files in the given directories that have been recorded by this manifest in a previous run, but have not
+            been generated in the current run.
+        """
+        current_outputs = {filename for entry in self._current.values() for _, filename in entry["outputs"]}
+        return sorted({
+            Path(filename) for entry in self._previous.values() for _, filename in entry["outputs"]
+            if filename not in current_outputs
+            and any(Path(filename).is_relative_to(directory) for directory in directories)
+        })
+
+    def store(self):
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self._path.with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps({"fingerprint": self._fingerprint, "types": self._current}, indent=2))
+        temporary_path.replace(self._path)
@@ -18,7 +18,6 @@ from pathlib import PurePosixPath
 from pydantic import BaseModel, Field, computed_field
 
 from pydjinni.generator.filters import headers, quote
-from pydjinni.generator.objc.objc.comment_renderer import DocCCommentRenderer
 from pydjinni.generator.objc.objc.config import ObjcConfig
 from pydjinni.generator.objc.objc.keywords import swift_keywords, keywords
 from pydjinni.generator.validator import validate
@@ -70,6 +69,8 @@ class ObjcBaseCommentModel(BaseModel):
 
     @cached_property
     def comment(self) -> str:
+        from pydjinni.generator.objc.objc.comment_renderer import DocCCommentRenderer
+
         return DocCCommentRenderer(self.config.identifier).render_tokens(*self.decl._parsed_comment).strip() \
             if self.decl._parsed_comment else ''
 
@@ -21,6 +21,7 @@ from pydjinni.config.types import IdentifierStyle
 from pydjinni.generator.filters import headers, quote
 from pydjinni.generator.objc.objcpp import external_types
 from pydjinni.generator.objc.objcpp.config import ObjcppConfig
+from pydjinni.generator.type_specifiers import TypeSpecifierCache
 from pydjinni.parser.ast import Function, Interface, Record
 from pydjinni.parser.base_models import BaseType, BaseField, BaseCommentModel, TypeReference
 
@@ -125,7 +126,7 @@ class ObjcppBaseField(ObjcBaseModel):
     def name(self) -> str: return self.decl.name.convert(IdentifierStyle.Case.camel)
 
     @property
-    def translator(self): return translator(self.decl.type_ref)
+    def translator(self): return TypeSpecifierCache.of(self.config).get(translator, self.decl.type_ref)
 
 class ObjcppInterface(ObjcppBaseType):
     decl: Interface = Field(exclude=True, repr=False)
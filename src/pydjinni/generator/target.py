@@ -11,10 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import inspect
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from pathlib import Path
 
-from pydantic import create_model
+from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
 
 from pydjinni.config.config_model_builder import ConfigModelBuilder
@@ -23,9 +27,11 @@ from pydjinni.file.processed_files_model_builder import ProcessedFilesModelBuild
 from pydjinni.parser.ast import Record
 from pydjinni.parser.base_models import BaseType, BaseField
 from pydjinni.parser.type_model_builder import TypeModelBuilder
+from pydjinni.profiler import count, profiled
 from .external_types import ExternalTypesBuilder
 from .generator import Generator, ConfigModel
 from .metadata import MetadataBase
+from .type_specifiers import TypeSpecifierCache
 
 
 class Target(ABC):
@@ -92,12 +98,36 @@ class Target(ABC):
             for generator in self.generators
         ]
 
-    def generate(self, ast: list[BaseType], clean: bool = False, copy_support_lib_sources: bool = True):
-        for generator_instance in self.generator_instances:
-            if clean:
-                generator_instance.clean()
-            generator_instance.generate(ast, copy_support_lib_sources)
+    def generate(
+        self, ast: list[BaseType], clean: bool = False, copy_support_lib_sources: bool = True, jobs: int = 1
+    ):
+        """
+        Generates the output of all generators of the target.
+
+        If `jobs` is greater than 1, the types are rendered by a pool of threads that is shared by all generators of
+        the target. Rendering is CPU-bound, it only runs faster on free-threaded interpreters.
+        """
+        executor = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+        try:
+            for generator_instance in self.generator_instances:
+                if clean:
+                    generator_instance.clean()
+                generator_instance.executor = executor
+                generator_instance.generate(ast, copy_support_lib_sources)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+                for generator_instance in self.generator_instances:
+                    generator_instance.executor = None
+            # the memoized type specifiers keep the AST alive, they are only valid for a single run. Generators may
+            # render aggregate files after the types, so the caches are released once all generators have finished
+            for generator_instance in self.generator_instances:
+                if generator_instance.config is not None:
+                    type_specifiers = TypeSpecifierCache.of(generator_instance.config)
+                    count(generator_instance.key, "type specifiers", **type_specifiers.info()._asdict())
+                    TypeSpecifierCache.release(generator_instance.config)
 
+    @profiled("marshal", lambda self, type_defs, field_defs: {"name": self.key, "target": self.key})
     def marshal(self, type_defs: list[BaseType], field_defs: list[BaseField]):
         for generator in self.generator_instances:
             generator.marshal(type_defs, field_defs)
@@ -106,21 +136,44 @@ class Target(ABC):
         for generator in self.generator_instances:
             generator.register_external_types(external_types_factory)
 
-    def configure(self, config: ConfigModel):
-        metadata_model = create_model(
+    @staticmethod
+    @cache
+    def _metadata_model(metadata_models: tuple[tuple[str, type[BaseModel]], ...]) -> type[MetadataBase]:
+        """
+        Combines the metadata models of all generators of a target. The model only depends on the generator classes,
+        so it is built once per process and reused on every call to `configure`.
+        """
+        return create_model(
             "Metadata",
             __base__=MetadataBase,
             **{
-                generator.key: (
-                    generator.metadata_model,
-                    FieldInfo(
-                        default=generator.metadata_model(config=getattr(config, generator.key)),
-                        description=inspect.cleandoc(generator.metadata_model.__doc__),
-                    ),
-                )
-                for generator in self.generator_instances
-                if generator.metadata_model is not None
+                key: (metadata_model, FieldInfo(description=inspect.cleandoc(metadata_model.__doc__)))
+                for key, metadata_model in metadata_models
             },
         )
+
+    def configure(
+        self,
+        config: ConfigModel,
+        cache_dir: Path | None = None,
+        incremental: bool = False,
+        inputs: list[Path] | None = None
+    ):
+        generators = [generator for generator in self.generator_instances if generator.metadata_model is not None]
+        metadata_model = self._metadata_model(
+            tuple((generator.key, generator.metadata_model) for generator in generators)
+        )
+        metadata = metadata_model(**{
+            generator.key: generator.metadata_model(config=getattr(config, generator.key)) for generator in generators
+        })
+        config_fingerprint = (
+            hashlib.sha256(config.model_dump_json(warnings=False).encode()).hexdigest() if incremental else None
+        )
         for generator in self.generator_instances:
-            generator.configure(getattr(config, generator.key), metadata_model())
+            generator.configure(
+                getattr(config, generator.key),
+                metadata,
+                cache_dir=cache_dir,
+                config_fingerprint=config_fingerprint,
+                inputs=inputs
+            )
@@ -0,0 +1,104 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import weakref
+from typing import Callable, Hashable, NamedTuple
+
+from pydantic import BaseModel
+
+from pydjinni.parser.base_models import TypeReference
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+def shape(type_ref: TypeReference | None) -> tuple | None:
+    """
+    Canonical shape of a type reference: the identity of the referenced type, the optionality and the shapes of the
+    generic parameters. Structurally identical references have the same shape, regardless of their position.
+    """
+    if type_ref is None:
+        return None
+    return id(type_ref.type_def), type_ref.optional, *[shape(parameter) for parameter in type_ref.parameters]
+
+
+class TypeSpecifierCache:
+    """
+    Memoizes type specifiers like `std::vector<std::optional<::a::B>>` per canonical generic instantiation.
+
+    Type specifiers are rendered for every field, parameter and return type, but they only depend on the shape of the
+    type reference and the configuration of the generator. There is one cache per generator configuration, each
+    distinct instantiation is computed once until the cache is released at the end of a generation run.
+    """
+    # caches by the id of the configuration. The entry is removed as soon as the configuration is garbage collected
+    _caches: dict[int, tuple[weakref.ref, "TypeSpecifierCache"]] = {}
+    _lock = threading.Lock()
+
+    def __init__(self):
+        # the type reference is kept with the result, so that the ids in the key can't be reused by other types
+        self._entries: dict[Hashable, tuple[TypeReference | None, str]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._entries_lock = threading.Lock()
+
+    @classmethod
+    def of(cls, config: BaseModel) -> "TypeSpecifierCache":
+        """
+        Returns:
+            the cache of the generator with the given configuration.
+        """
+        entry = cls._caches.get(id(config))
+        if entry is None:
+            key = id(config)
+            with cls._lock:
+                entry = cls._caches.get(key)
+                if entry is None:
+                    entry = (weakref.ref(config, lambda _: cls._caches.pop(key, None)), cls())
+                    cls._caches[key] = entry
+        return entry[1]
+
+    @classmethod
+    def release(cls, config: BaseModel):
+        """
+        Drops the cache of the given configuration, together with the type references that it keeps alive.
+        """
+        with cls._lock:
+            cls._caches.pop(id(config), None)
+
+    def get(self, compute: Callable[..., str], type_ref: TypeReference | None, *args: Hashable) -> str:
+        """
+        Returns the result of `compute(type_ref, *args)`, memoized by the compute function, the shape of the type
+        reference and the additional arguments.
+        """
+        key = (compute, shape(type_ref), *args)
+        entry = self._entries.get(key)
+        if entry is None:
+            # types may be rendered by multiple threads, the result of the first thread is kept
+            result = (type_ref, compute(type_ref, *args))
+            with self._entries_lock:
+                entry = self._entries.setdefault(key, result)
+                self._misses += 1
+        else:
+            with self._entries_lock:
+                self._hits += 1
+        return entry[1]
+
+    def info(self) -> CacheInfo:
+        """Statistics of the memoized type specifiers"""
+        return CacheInfo(self._hits, self._misses, len(self._entries))
+
@@ -29,6 +29,13 @@ class YamlGenerator(Generator):
         return type_def.model_dump(mode='json', exclude_none=True, exclude=set(
             [field for field in type_def.model_fields.keys() if field not in (BaseExternalType.model_fields.keys())]))
 
+    def generate_base_type(self, type_def: BaseType):
+        self._write_output(
+            kind="source",
+            filename=self.source_path / f"{type_def.name}.yaml",
+            content=yaml.dump(self.generate_type_dict(type_def))
+        )
+
     def generate(self, ast: list[BaseType], copy_support_lib_sources: bool = True):
         filtered_type_defs = [type_def for type_def in ast if
                               not (type_def.primitive == BaseExternalType.Primitive.function and type_def.anonymous)]
@@ -40,12 +47,10 @@ class YamlGenerator(Generator):
                     filename=self.source_path / self.config.out_file,
                     content=yaml.dump_all([self.generate_type_dict(type_def) for type_def in filtered_type_defs])
                 )
+                if self._manifest:
+                    # no type has its own output, all files of previous runs with one file per type are stale
+                    self._generate_incremental([])
             else:
-                for type_def in filtered_type_defs:
-                    self._file_writer.write_source(
-                        key=self.key,
-                        filename=self.source_path / f"{type_def.name}.yaml",
-                        content=yaml.dump(self.generate_type_dict(type_def))
-                    )
+                super().generate(filtered_type_defs, copy_support_lib_sources)
         else:
             raise ConfigurationException(f"Missing configuration for 'generator.{self.key}'!")
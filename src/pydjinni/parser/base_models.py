@@ -14,16 +14,19 @@
 
 from __future__ import annotations
 from pathlib import Path
+from typing import Callable, TYPE_CHECKING
 
-from mistune import BlockState
 from pydantic.json_schema import SkipJsonSchema
 from pydjinni.parser.identifier import Identifier
-from pydjinni.parser.namespace import Namespace
+from pydjinni.parser.namespace import Namespace, NamespaceIdentifiers
 from pydjinni.position import Position
 
 from enum import StrEnum
 from pydantic import BaseModel, Field, PrivateAttr, SkipValidation, computed_field
 
+if TYPE_CHECKING:
+    from mistune import BlockState
+
 
 class DocStrEnum(StrEnum):
     def __new__(cls, value, doc=None):
@@ -42,7 +45,20 @@ class BaseCommentModel(BaseModel):
         default=False,
         description="Marks a type as deprecated"
     )
-    _parsed_comment: tuple[list, BlockState] | None = PrivateAttr(default=None)
+    _comment: tuple[list, BlockState] | Callable[[], tuple[list, BlockState]] | None = PrivateAttr(default=None)
+
+    @property
+    def _parsed_comment(self) -> tuple[list, BlockState] | None:
+        """
+        The markdown tokens of the comment. A deferred comment is parsed when it is requested for the first time.
+        """
+        if callable(self._comment):
+            self._comment = self._comment()
+        return self._comment
+
+    @_parsed_comment.setter
+    def _parsed_comment(self, value: tuple[list, BlockState] | Callable[[], tuple[list, BlockState]] | None):
+        self._comment = value
 
 class BaseExternalType(BaseCommentModel):
     class Primitive(StrEnum):
@@ -58,8 +74,8 @@ class BaseExternalType(BaseCommentModel):
     name: Identifier = Field(
         description="Name of the type in the IDL"
     )
-    namespace: list[Identifier] = Field(
-        default=[],
+    namespace: NamespaceIdentifiers = Field(
+        default=(),
         description="Namespace that the type lives in"
     )
     primitive: str = Field(
@@ -73,7 +89,7 @@ class BaseExternalType(BaseCommentModel):
 
 class TypeReference(BaseModel):
     name: Identifier
-    namespace: Namespace | list[Identifier] = []
+    namespace: Namespace | NamespaceIdentifiers = ()
     position: Position | None = None
     identifier_position: Position | None = None
     parameters: list[TypeReference] = []
@@ -1,34 +1,32 @@
-from typing import Any
-
-from mistune import BlockState, Markdown
-from mistune.renderers.markdown import MarkdownRenderer
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
 
 from pydjinni.parser.ast import Interface, ErrorDomain
 from pydjinni.parser.base_models import BaseCommentModel
+from pydjinni.parser.markdown_parser import CommentCommands, DeferredComment
 
-class ParserCommentProcessor(MarkdownRenderer):
-    def __init__(self, decl: BaseCommentModel):
-        super().__init__()
-        self.decl = decl
-
-    def iter_tokens(self, tokens, state):
-        for tok in tokens:
-            try:
-                yield self.render_token(tok, state)
-            except AttributeError:
-                pass
-
-    def deprecated(self, token: dict[str, Any], state: BlockState) -> str:
-        text = self.render_children(token, state)
-        self.decl.deprecated = text if text else True
-        return ""
 
-    def param(self, token: dict[str, Any], state: BlockState):
-        name = token['attrs']['name']
-        description = self.render_children(token, state)
-        if (isinstance(self.decl, Interface.Method) or isinstance(self.decl, ErrorDomain.ErrorCode)) and description:
-            param = next((param for param in self.decl.parameters if param.name == name), None)
-            if param:
+def process_comment_commands(decl: BaseCommentModel):
+    """
+    Applies the `@deprecated` and `@param` commands of the comment to the declaration and its parameters.
+    """
+    commands = CommentCommands.scan(decl.comment)
+    if commands.deprecated:
+        decl.deprecated = commands.deprecated
+    if isinstance(decl, (Interface.Method, ErrorDomain.ErrorCode)):
+        for param in decl.parameters:
+            description = commands.params.get(param.name)
+            if description:
                 param.comment = description
-                param._parsed_comment = Markdown().parse(description)
-        return ""
+                param._parsed_comment = DeferredComment(description, [], None, commands=False)
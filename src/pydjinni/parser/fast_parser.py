@@ -0,0 +1,536 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from typing import Any
+
+
+class Token:
+    __slots__ = ("type", "text", "line", "column")
+
+    def __init__(self, type: str, text: str, line: int, column: int):
+        self.type = type
+        self.text = text
+        self.line = line
+        """1-based line number, like in ANTLR"""
+        self.column = column
+
+    def getText(self) -> str:
+        return self.text
+
+
+class SyntaxNode:
+    """
+    Node of the syntax tree that is produced by the `FastParser`.
+
+    Provides the same interface as the ANTLR rule contexts, as far as it is used by the `Parser` visitor: The first and
+    last token of the rule are available as `start` and `stop`, children are accessed by calling a method with the name
+    of the child rule or token (e.g. `ctx.identifier()`, `ctx.TARGET()`).
+    """
+
+    __slots__ = ("rule", "start", "stop", "children")
+
+    def __init__(self, rule: str, start: Token, stop: Token, children: dict[str, Any]):
+        self.rule = rule
+        self.start = start
+        self.stop = stop
+        self.children = children
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        child = self.children.get(name)
+        return lambda: child
+
+    def accept(self, visitor):
+        return getattr(visitor, f"visit{self.rule}")(self)
+
+
+_KEYWORDS = {
+    "namespace": "NAMESPACE",
+    "enum": "ENUM",
+    "flags": "FLAGS",
+    "static": "STATIC",
+    "const": "CONST",
+    "main": "MAIN",
+    "interface": "INTERFACE",
+    "record": "RECORD",
+    "deriving": "DERIVING",
+    "function": "FUNCTION",
+    "property": "PROPERTY",
+    "async": "ASYNC",
+    "error": "ERROR",
+    "throws": "THROWS",
+    "@import": "IMPORT",
+    "@extern": "EXTERN",
+}
+
+_PUNCTUATION = {
+    "->": "ARROW",
+    "?": "OPTIONAL",
+    "=": "ASSIGN",
+    ":": "COLON",
+    "(": "LPAREN",
+    ")": "RPAREN",
+    "{": "LBRACE",
+    "}": "RBRACE",
+    ">": "GT",
+    "<": "LT",
+    ";": "SEMI",
+    ",": "COMMA",
+    ".": "DOT",
+}
+
+# Mirrors the lexer rules of `grammar/Idl.g4`. The alternatives are ordered so that the longest match wins.
+_TOKENS = re.compile(
+    r"""
+    (?P<WS>[ \t\r\n]+)
+    | (?P<COMMENT>\#[^\r\n]*)
+    | (?P<ID>\.?[a-zA-Z][a-zA-Z0-9_]*(?:\.[a-zA-Z][a-zA-Z0-9_]*)*)
+    | (?P<FILEPATH>"[^"]*")
+    | (?P<TARGET>[+-][a-z]+)
+    | (?P<KEYWORD>@import|@extern)
+    | (?P<PUNCTUATION>->|[?=:(){}<>;,.])
+    | (?P<INVALID>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_TYPE_REF_START = ("ID", "NS_ID", "FUNCTION", "LPAREN")
+
+
+class FastParser:
+    """
+    Recursive descent parser for the IDL grammar in `grammar/Idl.g4`.
+
+    Accepts exactly the input that the ANTLR parser accepts without syntax errors and produces a syntax tree of the same
+    shape, that can be visited by the `Parser`. There is no error recovery: The first unexpected token or character
+    raises a `FastParser.UnexpectedToken`.
+    """
+
+    class UnexpectedToken(Exception):
+        def __init__(self, token: Token):
+            super().__init__(f"unexpected input '{token.text}' at {token.line}:{token.column}")
+            self.token = token
+
+    def __init__(self, content: str):
+        self.tokens = self._tokenize(content)
+        self.index = 0
+
+    @staticmethod
+    def _tokenize(content: str) -> list[Token]:
+        tokens: list[Token] = []
+        line = 1
+        line_start = 0
+        for match in _TOKENS.finditer(content):
+            kind = match.lastgroup
+            text = match.group()
+            start = match.start()
+            if kind == "ID":
+                if "." in text:
+                    kind = "NS_ID"
+                else:
+                    kind = _KEYWORDS.get(text, "ID")
+            elif kind == "KEYWORD":
+                kind = _KEYWORDS[text]
+            elif kind == "PUNCTUATION":
+                kind = _PUNCTUATION[text]
+            elif kind == "INVALID":
+                raise FastParser.UnexpectedToken(Token(kind, text, line, start - line_start))
+            if kind != "WS":
+                tokens.append(Token(kind, text, line, start - line_start))
+            if kind in ("WS", "FILEPATH"):
+                newlines = text.count("\n")
+                if newlines:
+                    line += newlines
+                    line_start = start + text.rfind("\n") + 1
+        tokens.append(Token("EOF", "<EOF>", line, len(content) - line_start))
+        return tokens
+
+    def parse(self) -> SyntaxNode:
+        """
+        Returns:
+            the syntax tree of the `idl` rule.
+        Raises:
+            FastParser.UnexpectedToken: if the input does not match the grammar.
+        """
+        self.index = 0
+        return self._idl()
+
+    def _token(self, offset: int = 0) -> Token:
+        return self.tokens[min(self.index + offset, len(self.tokens) - 1)]
+
+    def _type(self, offset: int = 0) -> str:
+        return self._token(offset).type
+
+    def _match(self, type: str) -> Token:
+        token = self.tokens[self.index]
+        if token.type != type:
+            raise FastParser.UnexpectedToken(token)
+        self.index += 1
+        return token
+
+    def _optional(self, type: str) -> Token | None:
+        return self._match(type) if self.tokens[self.index].type == type else None
+
+    def _node(self, rule: str, start: int, **children) -> SyntaxNode:
+        return SyntaxNode(rule, self.tokens[start], self.tokens[self.index - 1], children)
+
+    def _comment_length(self) -> int:
+        """Number of comment tokens, starting at the current token"""
+        offset = 0
+        while self._type(offset) == "COMMENT":
+            offset += 1
+        return offset
+
+    def _idl(self) -> SyntaxNode:
+        start = self.index
+        loads = []
+        while self._type() in ("IMPORT", "EXTERN"):
+            loads.append(self._load())
+        contents = []
+        while self._type() != "EOF":
+            contents.append(self._namespace_content())
+        self._match("EOF")
+        return self._node("Idl", start, load=loads, namespaceContent=contents)
+
+    def _load(self) -> SyntaxNode:
+        start = self.index
+        rule = "ImportDef" if self._match(self._type()).type == "IMPORT" else "Extern"
+        filepath_start = self.index
+        path = self._match("FILEPATH")
+        return self._node(rule, start, filepath=self._node("Filepath", filepath_start, FILEPATH=path))
+
+    def _namespace_content(self) -> SyntaxNode:
+        if self._type(self._comment_length()) == "NAMESPACE":
+            return self._namespace()
+        return self._type_decl()
+
+    def _comment(self) -> SyntaxNode | None:
+        start = self.index
+        lines = []
+        while self._type() == "COMMENT":
+            lines.append(self._match("COMMENT"))
+        return self._node("Comment", start, COMMENT=lines) if lines else None
+
+    def _namespace(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        self._match("NAMESPACE")
+        identifier = self._ns_identifier()
+        self._match("LBRACE")
+        contents = []
+        while self._type() != "RBRACE":
+            contents.append(self._namespace_content())
+        self._match("RBRACE")
+        return self._node("Namespace", start, comment=comment, nsIdentifier=identifier, namespaceContent=contents)
+
+    def _type_decl(self) -> SyntaxNode:
+        start = self.index
+        offset = self._comment_length()
+        if self._type(offset) != "ID":
+            raise FastParser.UnexpectedToken(self._token(offset))
+        if self._type(offset + 1) != "ASSIGN":
+            raise FastParser.UnexpectedToken(self._token(offset + 1))
+        match self._type(offset + 2):
+            case "ENUM":
+                children = {"enum": self._enum()}
+            case "FLAGS":
+                children = {"flags": self._flags()}
+            case "RECORD":
+                children = {"record": self._record()}
+            case "MAIN" | "INTERFACE":
+                children = {"interface": self._interface()}
+            case "ERROR":
+                children = {"errorDomain": self._error_domain()}
+            case "FUNCTION" | "LPAREN":
+                children = {"namedFunction": self._named_function()}
+            case _:
+                raise FastParser.UnexpectedToken(self._token(offset + 2))
+        return self._node("TypeDecl", start, **children)
+
+    def _identifier(self) -> SyntaxNode:
+        start = self.index
+        return self._node("Identifier", start, ID=self._match("ID"))
+
+    def _ns_identifier(self) -> SyntaxNode:
+        start = self.index
+        if self._type() == "NS_ID":
+            return self._node("NsIdentifier", start, NS_ID=self._match("NS_ID"))
+        return self._node("NsIdentifier", start, ID=self._match("ID"))
+
+    def _targets(self) -> SyntaxNode:
+        start = self.index
+        targets = []
+        while self._type() == "TARGET":
+            targets.append(self._match("TARGET"))
+        return self._node("Targets", start, TARGET=targets)
+
+    def _enum(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        identifier = self._identifier()
+        self._match("ASSIGN")
+        self._match("ENUM")
+        self._match("LBRACE")
+        items = []
+        while self._type() in ("COMMENT", "ID"):
+            items.append(self._item())
+        self._match("RBRACE")
+        return self._node("Enum", start, comment=comment, identifier=identifier, item=items)
+
+    def _item(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        identifier = self._identifier()
+        self._match("SEMI")
+        return self._node("Item", start, comment=comment, identifier=identifier)
+
+    def _flags(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        identifier = self._identifier()
+        self._match("ASSIGN")
+        self._match("FLAGS")
+        self._match("LBRACE")
+        flags = []
+        while self._type() in ("COMMENT", "ID"):
+            flags.append(self._flag())
+        self._match("RBRACE")
+        return self._node("Flags", start, comment=comment, identifier=identifier, flag=flags)
+
+    def _flag(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        identifier = self._identifier()
+        modifier = None
+        if self._type() == "ASSIGN":
+            modifier_start = self.index
+            self._match("ASSIGN")
+            modifier = self._node("Modifier", modifier_start, ID=self._match("ID"))
+        self._match("SEMI")
+        return self._node("Flag", start, comment=comment, identifier=identifier, modifier=modifier)
+
+    def _record(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        identifier = self._identifier()
+        self._match("ASSIGN")
+        self._match("RECORD")
+        targets = self._targets()
+        self._match("LBRACE")
+        fields = []
+        while self._type() in ("COMMENT", "ID"):
+            fields.append(self._field())
+        self._match("RBRACE")
+        deriving = self._deriving() if self._type() == "DERIVING" else None
+        return self._node(
+            "Record", start, comment=comment, identifier=identifier, targets=targets, field=fields, deriving=deriving
+        )
+
+    def _field(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        identifier = self._identifier()
+        self._match("COLON")
+        type_ref = self._type_ref()
+        self._match("SEMI")
+        return self._node("Field", start, comment=comment, identifier=identifier, typeRef=type_ref)
+
+    def _deriving(self) -> SyntaxNode:
+        start = self.index
+        self._match("DERIVING")
+        self._match("LPAREN")
+        declarations = []
+        if self._type() == "ID":
+            declarations.append(self._declaration())
+            while self._optional("COMMA"):
+                declarations.append(self._declaration())
+        self._match("RPAREN")
+        return self._node("Deriving", start, declaration=declarations)
+
+    def _declaration(self) -> SyntaxNode:
+        start = self.index
+        return self._node("Declaration", start, ID=self._match("ID"))
+
+    def _type_ref(self) -> SyntaxNode:
+        start = self.index
+        if self._type() in ("FUNCTION", "LPAREN"):
+            return self._node("TypeRef", start, function=self._function())
+        return self._node("TypeRef", start, dataType=self._data_type())
+
+    def _data_type(self) -> SyntaxNode:
+        start = self.index
+        identifier = self._ns_identifier()
+        parameters = []
+        if self._optional("LT"):
+            parameters.append(self._data_type())
+            while self._optional("COMMA"):
+                parameters.append(self._data_type())
+            self._match("GT")
+        optional = self._optional("OPTIONAL")
+        return self._node("DataType", start, nsIdentifier=identifier, dataType=parameters, OPTIONAL=optional)
+
+    def _parameters(self) -> list[SyntaxNode]:
+        """Comma separated parameter list in parentheses"""
+        self._match("LPAREN")
+        parameters = []
+        if self._type() == "ID":
+            parameters.append(self._parameter())
+            while self._optional("COMMA"):
+                parameters.append(self._parameter())
+        self._match("RPAREN")
+        return parameters
+
+    def _parameter(self) -> SyntaxNode:
+        start = self.index
+        identifier = self._identifier()
+        self._match("COLON")
+        return self._node("Parameter", start, identifier=identifier, typeRef=self._type_ref())
+
+    def _function(self) -> SyntaxNode:
+        start = self.index
+        function = self._optional("FUNCTION")
+        targets = self._targets() if function else None
+        parameters = self._parameters()
+        throwing = self._throwing() if self._type() == "THROWS" else None
+        return_type = self._type_ref() if self._optional("ARROW") else None
+        return self._node(
+            "Function",
+            start,
+            FUNCTION=function,
+            targets=targets,
+            parameter=parameters,
+            throwing=throwing,
+            typeRef=return_type,
+        )
+
+    def _throwing(self) -> SyntaxNode:
+        start = self.index
+        self._match("THROWS")
+        type_refs = []
+        if self._type() in _TYPE_REF_START:
+            type_refs.append(self._thrown_type())
+            # `identifier ':'` after the comma is the next parameter of an enclosing parameter list
+            while self._type() == "COMMA" and not (self._type(1) == "ID" and self._type(2) == "COLON"):
+                self._match("COMMA")
+                type_refs.append(self._thrown_type())
+        return self._node("Throwing", start, typeRef=type_refs)
+
+    def _thrown_type(self) -> SyntaxNode:
+        # Function types in `throws` lists make the grammar ambiguous, ANTLR resolves them with full-context prediction.
+        # As only errors can be thrown, such input is invalid anyway and is left to the ANTLR parser.
+        if self._type() in ("FUNCTION", "LPAREN"):
+            raise FastParser.UnexpectedToken(self._token())
+        return self._type_ref()
+
+    def _interface(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        identifier = self._identifier()
+        self._match("ASSIGN")
+        main = self._optional("MAIN")
+        self._match("INTERFACE")
+        targets = self._targets()
+        self._match("LBRACE")
+        methods = []
+        properties = []
+        while True:
+            match self._type(self._comment_length()):
+                case "PROPERTY":
+                    properties.append(self._prop())
+                case "STATIC" | "CONST" | "ASYNC" | "ID":
+                    methods.append(self._method())
+                case _:
+                    break
+        self._match("RBRACE")
+        return self._node(
+            "Interface",
+            start,
+            comment=comment,
+            identifier=identifier,
+            MAIN=main,
+            targets=targets,
+            method=methods,
+            prop=properties,
+        )
+
+    def _method(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        static = self._optional("STATIC")
+        const = self._optional("CONST")
+        asynchronous = self._optional("ASYNC")
+        identifier = self._identifier()
+        parameters = self._parameters()
+        throwing = self._throwing() if self._type() == "THROWS" else None
+        return_type = self._type_ref() if self._optional("ARROW") else None
+        self._match("SEMI")
+        return self._node(
+            "Method",
+            start,
+            comment=comment,
+            STATIC=static,
+            CONST=const,
+            ASYNC=asynchronous,
+            identifier=identifier,
+            parameter=parameters,
+            throwing=throwing,
+            typeRef=return_type,
+        )
+
+    def _prop(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        self._match("PROPERTY")
+        identifier = self._identifier()
+        self._match("COLON")
+        type_ref = self._type_ref()
+        self._match("SEMI")
+        return self._node("Prop", start, comment=comment, identifier=identifier, typeRef=type_ref)
+
+    def _named_function(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        identifier = self._identifier()
+        self._match("ASSIGN")
+        function = self._function()
+        self._match("SEMI")
+        return self._node("NamedFunction", start, comment=comment, identifier=identifier, function=function)
+
+    def _error_domain(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        identifier = self._identifier()
+        self._match("ASSIGN")
+        self._match("ERROR")
+        self._match("LBRACE")
+        error_codes = []
+        while self._type() in ("COMMENT", "ID"):
+            error_codes.append(self._error_code())
+        self._match("RBRACE")
+        return self._node("ErrorDomain", start, comment=comment, identifier=identifier, errorCode=error_codes)
+
+    def _error_code(self) -> SyntaxNode:
+        start = self.index
+        comment = self._comment()
+        identifier = self._identifier()
+        parameters = []
+        if self._optional("LPAREN"):
+            # unlike other parameter lists, the parameters of error codes are not separated by commas
+            while self._type() == "ID":
+                parameters.append(self._parameter())
+            self._match("RPAREN")
+        self._match("SEMI")
+        return self._node("ErrorCode", start, comment=comment, identifier=identifier, parameter=parameters)
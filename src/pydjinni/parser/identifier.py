@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+from functools import lru_cache
 from typing import Annotated
 
 from pydantic import AfterValidator
@@ -19,41 +21,53 @@ from pydantic import AfterValidator
 from pydjinni.config.types import IdentifierStyle
 
 
-class IdentifierType(str):
-    def convert(self, style: IdentifierStyle | IdentifierStyle.Case):
-        def convert_token(token: str, style: IdentifierStyle.Case, first: bool = False) -> str:
-            match (style, first):
-                case (IdentifierStyle.Case.camel, True) | (IdentifierStyle.Case.snake, True | False) | (
-                    IdentifierStyle.Case.kebab, True | False):
-                    return token.lower()
-                case (IdentifierStyle.Case.camel, False) | (IdentifierStyle.Case.pascal, True | False):
-                    return token.capitalize()
-                case (IdentifierStyle.Case.train, True | False):
-                    return token.upper()
-                case _:
-                    return token
-
-        identifier_style: IdentifierStyle = style if type(
-            style) is IdentifierStyle else IdentifierStyle(style=style.value)
-
-        tokens = [self] if identifier_style.style == IdentifierStyle.Case.none else self.split('_')
-
-        match identifier_style.style:
-            case IdentifierStyle.Case.train | IdentifierStyle.Case.snake:
-                link = '_'
-            case IdentifierStyle.Case.kebab:
-                link = '-'
+@lru_cache(maxsize=65536)
+def _convert(identifier: str, style: IdentifierStyle.Case, prefix: str | None) -> str:
+    """
+    Converts the identifier to the given style. The results are memoized and interned, because the generators
+    convert the same identifiers many times.
+    """
+    def convert_token(token: str, first: bool = False) -> str:
+        match (style, first):
+            case (IdentifierStyle.Case.camel, True) | (IdentifierStyle.Case.snake, True | False) | (
+                IdentifierStyle.Case.kebab, True | False):
+                return token.lower()
+            case (IdentifierStyle.Case.camel, False) | (IdentifierStyle.Case.pascal, True | False):
+                return token.capitalize()
+            case (IdentifierStyle.Case.train, True | False):
+                return token.upper()
             case _:
-                link = ''
+                return token
+
+    tokens = [identifier] if style == IdentifierStyle.Case.none else identifier.split('_')
+
+    match style:
+        case IdentifierStyle.Case.train | IdentifierStyle.Case.snake:
+            link = '_'
+        case IdentifierStyle.Case.kebab:
+            link = '-'
+        case _:
+            link = ''
 
-        converted_tokens = [convert_token(tokens[0], identifier_style.style, first=True)]
-        converted_tokens += [convert_token(token, identifier_style.style) for token in tokens[1:]]
+    converted_tokens = [convert_token(tokens[0], first=True)]
+    converted_tokens += [convert_token(token) for token in tokens[1:]]
 
-        output = link.join(converted_tokens)
-        if identifier_style.prefix is not None:
-            output = f"{style.prefix}{output}"
-        return output
+    output = link.join(converted_tokens)
+    if prefix is not None:
+        output = f"{prefix}{output}"
+    return sys.intern(output)
+
+
+class IdentifierType(str):
+    def convert(self, style: IdentifierStyle | IdentifierStyle.Case) -> str:
+        if type(style) is IdentifierStyle:
+            return _convert(self, style.style, style.prefix)
+        return _convert(self, style, None)
 
+    @staticmethod
+    def cache_info():
+        """Statistics of the memoized conversions"""
+        return _convert.cache_info()
 
 Identifier = Annotated[
     str,
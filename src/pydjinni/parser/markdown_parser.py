@@ -12,49 +12,68 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import cache
 from re import Match
-from typing import Any, Dict, List, Tuple, Union
-from mistune import BlockState, InlineState, Markdown
+from typing import Any, Dict, List, Tuple, Union, TYPE_CHECKING
 
 from .identifier import Identifier
 from pydjinni.position import Cursor, Position
 
 from .base_models import CommentTypeReference, TypeReference
 
+if TYPE_CHECKING:
+    from mistune import BlockState, InlineState, Markdown
+
+
+@dataclass
+class CommentContext:
+    """
+    Per-parse state of the shared markdown parser. Passed to the commands in the environment of the parser state.
+    """
+    namespace: tuple[Identifier, ...]
+    position: Position | None
+    type_references: list[TypeReference]
+
+    @staticmethod
+    def of(state: BlockState | InlineState) -> CommentContext:
+        return state.env["comment_context"]
+
+
 @dataclass
 class InlineTypeReference:
     """
     Represents an inline type reference in a markdown comment.
     This is used to parse type references that are defined inline, e.g. ``type_name``.
     """
-    namespace: list[Identifier]
-    position: Position
-    type_references: list[TypeReference]
 
     @property
     def name(self) -> str:
         return "inline_type_ref"
-    
+
     @property
     def pattern(self) -> str:
         return r"``(?P<type_ref_name>[\w.]+)``"
-    
+
     @property
     def command(self):
         def parse_inline_type_ref(_, match: Match, state: InlineState):
+            context = CommentContext.of(state)
             type_reference = match.group("type_ref_name")
             typename = type_reference.rsplit(".")[-1]
-            match_position = Position.from_match(state.src, self.position.file, match, "type_ref_name").relative_to(
-                self.position, column_offset=2
+            match_position = Position.from_match(state.src, context.position.file, match, "type_ref_name").relative_to(
+                context.position, column_offset=2
             )
             parameter_type_ref = CommentTypeReference(
                 name=type_reference,
-                namespace=self.namespace,
+                namespace=context.namespace,
                 position=match_position,
                 identifier_position=match_position.with_offset(start=Cursor(col=len(type_reference) - len(typename))),
             )
-            self.type_references.append(parameter_type_ref)
+            context.type_references.append(parameter_type_ref)
             state.append_token({"type": self.name, "attrs": {"type_ref": parameter_type_ref}})
             return match.end()
 
@@ -120,63 +139,146 @@ class TypeReferenceMarkdownCommand(ParameterMarkdownCommand):
     Defines a command that has a type reference as first parameter
     """
 
-    position: Position
-    namespace: list[Identifier]
-    type_references: list[TypeReference]
-
     @property
     def command(self):
         def parse_type_parameter_block_command(_, match: Match, state: BlockState):
+            context = CommentContext.of(state)
             parameter = match.group(self.parameter_group)
             typename = parameter.rsplit(".")[-1]
             text = match.group(self.command_content_group)
-            position = Position.from_match(state.src, self.position.file, match, self.parameter_group).relative_to(
-                self.position, column_offset=1
+            position = Position.from_match(state.src, context.position.file, match, self.parameter_group).relative_to(
+                context.position, column_offset=1
             )
             parameter_type_ref = CommentTypeReference(
                 name=parameter,
-                namespace=self.namespace,
+                namespace=context.namespace,
                 position=position,
                 identifier_position=position.with_offset(start=Cursor(col=len(parameter) - len(typename))),
             )
-            self.type_references.append(parameter_type_ref)
+            context.type_references.append(parameter_type_ref)
             state.append_token({"type": self.name, "text": text, "attrs": {self.parameter: parameter_type_ref}})
             return match.end() + 1
 
         return parse_type_parameter_block_command
 
 
+RETURNS = MarkdownCommand("returns", "documents the return value of a method")
+DEPRECATED = MarkdownCommand("deprecated", "marks a type, field or method as deprecated")
+PARAM = ParameterMarkdownCommand("param", "documents a method parameter", parameter="name")
+THROWS = TypeReferenceMarkdownCommand(
+    name="throws",
+    description="documents an exception type that a method may throw",
+    parameter="type_ref",
+)
+INLINE_TYPE_REF = InlineTypeReference()
+
+_FENCED_CODE = r"^[ \t]*(?P<fence>`{3,}|~{3,}).*?(?:^[ \t]*(?P=fence)[ \t]*$|\Z)"
+_SEMANTIC_COMMANDS = re.compile(
+    f"(?P<fenced_code>{_FENCED_CODE})|(?P<returns>{RETURNS.pattern})|(?P<deprecated>{DEPRECATED.pattern})"
+    f"|(?P<param>{PARAM.pattern})|(?P<throws>{THROWS.pattern})",
+    re.M | re.S
+)
+_TYPE_REFERENCES = re.compile(f"{THROWS.pattern}|{INLINE_TYPE_REF.pattern}", re.M)
+
+
+@cache
+def _markdown(commands: bool = True) -> Markdown:
+    """
+    Markdown parser that is shared by all comments. All per-comment state is kept in the `CommentContext`.
+    """
+
+    def commands_plugin(md: Markdown):
+        for command in MarkdownParser.commands():
+            md.block.register(command.name, command.pattern, command.command)
+
+    def inline_type_ref_plugin(md: Markdown):
+        md.inline.register(INLINE_TYPE_REF.name, INLINE_TYPE_REF.pattern, INLINE_TYPE_REF.command, before="codespan")
+
+    # mistune is only imported when the first comment is parsed
+    from mistune import Markdown
+
+    return Markdown(plugins=[commands_plugin, inline_type_ref_plugin] if commands else None)
+
+
+def _command_text(text: str | None) -> str:
+    return "\n".join(line.strip() for line in text.strip().splitlines()) if text else ""
+
+
+@dataclass
+class CommentCommands:
+    """
+    Commands of a comment that change the semantics of the documented declaration.
+    """
+    deprecated: str | bool = False
+    params: dict[str, str] = field(default_factory=dict)
+
+    @staticmethod
+    def scan(text: str | None) -> CommentCommands:
+        """
+        Extracts the `@deprecated` and `@param` commands from the given comment without parsing the markdown.
+        Commands in fenced code blocks and in the text of other commands are ignored. If a command is given multiple
+        times, the last one wins.
+        """
+        commands = CommentCommands()
+        for match in _SEMANTIC_COMMANDS.finditer(text or ""):
+            if match.group("deprecated") is not None:
+                commands.deprecated = _command_text(match.group(DEPRECATED.command_content_group)) or True
+            elif match.group("param") is not None:
+                commands.params[match.group(PARAM.parameter_group)] = _command_text(
+                    match.group(PARAM.command_content_group)
+                )
+        return commands
+
+
+class DeferredComment:
+    """
+    A comment that is only parsed when the tokens are requested for the first time, see
+    `BaseCommentModel._parsed_comment`. Only used for comments that cannot contain any type references, which have to
+    be collected while parsing the IDL.
+    """
+    __slots__ = ("text", "namespace", "position", "commands")
+
+    def __init__(self, text: str, namespace: tuple[Identifier, ...], position: Position | None, commands: bool = True):
+        self.text = text
+        self.namespace = namespace
+        self.position = position
+        self.commands = commands
+
+    def __call__(self) -> Tuple[Union[str, List[Dict[str, Any]]], BlockState]:
+        if self.commands:
+            return MarkdownParser([]).parse(self.text, self.namespace, self.position)
+        return _markdown(commands=False).parse(self.text)
+
+
 class MarkdownParser:
     def __init__(self, type_references: list[TypeReference] = []):
         self.type_references = type_references
 
-    def commands(self, namespace: list[Identifier] = [], position: Position | None = None) -> list[MarkdownCommand]:
-        return [
-            MarkdownCommand("returns", "documents the return value of a method"),
-            MarkdownCommand("deprecated", "marks a type, field or method as deprecated"),
-            ParameterMarkdownCommand("param", "documents a method parameter", parameter="name"),
-            TypeReferenceMarkdownCommand(
-                name="throws",
-                description="documents an exception type that a method may throw",
-                parameter="type_ref",
-                position=position,
-                namespace=namespace,
-                type_references=self.type_references,
-            ),
-        ]
+    @staticmethod
+    def commands() -> list[MarkdownCommand]:
+        return [RETURNS, DEPRECATED, PARAM, THROWS]
 
     def parse(
-        self, text: str | None, namespace: list[Identifier], position: Position | None = None
+        self, text: str | None, namespace: tuple[Identifier, ...], position: Position | None = None
     ) -> Tuple[Union[str, List[Dict[str, Any]]], BlockState] | None:
-        def commands_plugin(md: Markdown):
-            for command in self.commands(namespace, position):
-                md.block.register(command.name, command.pattern, command.command)
-
-        def inline_type_ref_plugin(md: Markdown):
-            plugin = InlineTypeReference(namespace, position, self.type_references)
-            md.inline.register(plugin.name, plugin.pattern, plugin.command, before="codespan")
-
         if text:
-            return Markdown(plugins=[commands_plugin, inline_type_ref_plugin]).parse(text)
+            markdown = _markdown()
+            state = markdown.block.state_cls()
+            state.env["comment_context"] = CommentContext(namespace, position, self.type_references)
+            return markdown.parse(text, state)
+        else:
+            return None
+
+    def parse_deferred(
+        self, text: str | None, namespace: tuple[Identifier, ...], position: Position | None = None
+    ) -> Tuple[Union[str, List[Dict[str, Any]]], BlockState] | DeferredComment | None:
+        """
+        Like `parse`, but defers parsing comments that do not reference any types until they are needed.
+        Comments that may reference types are parsed immediately, so that all type references are collected.
+        """
+        if text and _TYPE_REFERENCES.search(text):
+            return self.parse(text, namespace, position)
+        elif text:
+            return DeferredComment(text, namespace, position)
         else:
             return None
@@ -12,15 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Annotated
+from typing import Annotated, Iterable
 
 from pydantic import AfterValidator, PlainSerializer, WithJsonSchema
 
-from pydjinni.parser.identifier import Identifier
+from pydjinni.parser.identifier import IdentifierType
+
+_namespaces: dict[tuple[str, ...], tuple[IdentifierType, ...]] = {}
+
+
+def intern_namespace(namespace: Iterable[str]) -> tuple[IdentifierType, ...]:
+    """
+    Returns the shared tuple of identifiers for the given namespace. All declarations and type references in the same
+    namespace reference the same tuple instead of holding a copy of it.
+    """
+    key = tuple(namespace)
+    interned = _namespaces.get(key)
+    if interned is None:
+        interned = _namespaces.setdefault(key, tuple(IdentifierType(identifier) for identifier in key))
+    return interned
+
+
+NamespaceIdentifiers = Annotated[
+    tuple[str, ...],
+    AfterValidator(intern_namespace),
+]
 
 Namespace = Annotated[
     str,
-    AfterValidator(lambda x: [Identifier(i) for i in x.split('.')]),
+    AfterValidator(lambda x: intern_namespace(x.split('.'))),
     PlainSerializer(lambda x: '.'.join(x), return_type=str),
     WithJsonSchema({'type': 'string', 'pattern': r"[_\.\w]+"}, mode='validation')
 ]
@@ -0,0 +1,189 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import logging
+import os
+import pickle
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from importlib_metadata import PackageNotFoundError, version
+
+from pydjinni.exceptions import ApplicationException
+from pydjinni.position import Position
+from .ast import Namespace
+from .base_models import BaseType, TypeReference, BaseField
+from .grammar.IdlParser import serializedATN
+
+CACHE_FORMAT_VERSION = 2
+
+logger = logging.getLogger(__name__)
+
+
+def _source_fingerprint() -> str:
+    """
+    Fingerprint of the PyDjinni sources, used in place of the version if no package metadata is available.
+    """
+    fingerprint = hashlib.sha256()
+    package_directory = Path(__file__).parent.parent
+    for file in sorted(package_directory.rglob("*.py")):
+        fingerprint.update(file.relative_to(package_directory).as_posix().encode())
+        fingerprint.update(b"\0")
+        fingerprint.update(file.read_bytes())
+    return fingerprint.hexdigest()
+
+
+@cache
+def grammar_version() -> str:
+    """
+    Fingerprint of the IDL grammar and the PyDjinni version. Cache entries are invalidated whenever one of them changes.
+    When running from a source checkout without package metadata, the sources are fingerprinted instead of the version.
+    """
+    try:
+        pydjinni_version = version('pydjinni')
+    except PackageNotFoundError:
+        pydjinni_version = _source_fingerprint()
+    return hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{pydjinni_version}:{serializedATN()}".encode()).hexdigest()
+
+
+class ParseCache:
+    """
+    Persistent cache for the syntax analysis results of IDL files.
+
+    Entries are keyed by the content of the IDL file, the grammar version and all configuration values that influence
+    the parsing result. `@import` and `@extern` directives are stored as `Load` entries and are processed again when an
+    entry is restored, so that changes in the included files are always picked up.
+
+    The cache is size bounded. Once the configured limit is exceeded, the least recently used entries are evicted.
+    """
+
+    @dataclass
+    class Load:
+        class Kind(StrEnum):
+            import_def = "import"
+            extern = "extern"
+
+        kind: Kind
+        path: Path
+        path_position: Position
+        position: Position
+
+    @dataclass
+    class Entry:
+        ast: list[BaseType | Namespace]
+        type_decls: list[BaseType]
+        declared_types: list[BaseType]
+        type_refs: list[TypeReference]
+        field_decls: list[BaseField]
+        loads: list["ParseCache.Load"]
+        syntax_errors: list[ApplicationException]
+        content_errors: list[ApplicationException]
+
+    def __init__(self, directory: Path, max_size: int):
+        self._directory = directory
+        self._max_size = max_size
+
+    def key(self, content: str, *config: Any) -> str:
+        fingerprint = hashlib.sha256(grammar_version().encode())
+        fingerprint.update(content.encode())
+        for item in config:
+            fingerprint.update(b"\0")
+            fingerprint.update(repr(item).encode())
+        return fingerprint.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self._directory / f"{key}.pickle"
+
+    def load(self, key: str) -> Entry | None:
+        """
+        Returns:
+            the cached entry, or `None` if there is no usable entry. Entries that can't be read are treated as missing,
+            entries that can't be unpickled are deleted.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            data = entry_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.debug(f"Unable to read parse cache entry {entry_path}: {e}")
+            return None
+        try:
+            entry = pickle.loads(data)
+        except Exception as e:
+            # a corrupted or outdated entry may fail in many ways while being unpickled
+            logger.debug(f"Discarding invalid parse cache entry {entry_path}: {e!r}")
+            self._unlink(entry_path)
+            return None
+        if not isinstance(entry, ParseCache.Entry):
+            logger.debug(f"Discarding invalid parse cache entry {entry_path}")
+            self._unlink(entry_path)
+            return None
+        try:
+            os.utime(entry_path)
+        except OSError as e:
+            logger.debug(f"Unable to update the access time of parse cache entry {entry_path}: {e}")
+        return entry
+
+    def store(self, key: str, entry: Entry):
+        """
+        Stores the entry. Failing to write the cache is not an error, the entry is skipped instead.
+        """
+        try:
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # results that reference objects which are not serializable (e.g. in-memory documents) are not cached
+            return
+        temporary_path = self._entry_path(key).with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            temporary_path.write_bytes(data)
+            temporary_path.replace(self._entry_path(key))
+        except OSError as e:
+            logger.debug(f"Unable to write parse cache entry {self._entry_path(key)}: {e}")
+            self._unlink(temporary_path)
+
+    def prune(self):
+        """
+        Evicts the least recently used entries until the total size of the cache is below the configured limit.
+        Entries that are removed concurrently, or that can't be accessed, are skipped.
+        """
+        try:
+            entry_paths = list(self._directory.glob("*.pickle"))
+        except OSError as e:
+            logger.debug(f"Unable to list the parse cache entries in {self._directory}: {e}")
+            return
+        entries = []
+        for entry_path in entry_paths:
+            try:
+                entries.append((entry_path, entry_path.stat()))
+            except OSError as e:
+                logger.debug(f"Unable to access parse cache entry {entry_path}: {e}")
+        total_size = sum(stat.st_size for _, stat in entries)
+        for entry_path, stat in sorted(entries, key=lambda item: item[1].st_mtime):
+            if total_size <= self._max_size:
+                break
+            self._unlink(entry_path)
+            total_size -= stat.st_size
+
+    @staticmethod
+    def _unlink(path: Path):
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Unable to remove {path} from the parse cache: {e}")
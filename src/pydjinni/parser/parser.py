@@ -12,12 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from antlr4 import InputStream, CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
 from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
 from antlr4.tree.Tree import ErrorNode
-from mistune import BlockState
+from pydjinni.config.types import ParserEngine
 from pydjinni.exceptions import (
     ApplicationException,
     FileNotFoundException,
@@ -28,16 +34,23 @@ from pydjinni.file.file_reader_writer import FileReaderWriter
 from pydjinni.generator.cpp.cpp.generator import CppGenerator
 from pydjinni.generator.target import Target
 from pydjinni.position import Position, Cursor
+from pydjinni.profiler import profiled
 from .ast import Record, Interface, Enum, Flags, Parameter, Function, ErrorDomain, Namespace
 from .base_models import BaseType, TypeReference, BaseField, BaseExternalType, DataField, FileReference
-from .comment_processor import ParserCommentProcessor
+from .comment_processor import process_comment_commands
+from .fast_parser import FastParser, SyntaxNode
 from .grammar.IdlLexer import IdlLexer
 from .grammar.IdlParser import IdlParser
 from .grammar.IdlVisitor import IdlVisitor
 from .identifier import IdentifierType as Identifier
-from .markdown_parser import MarkdownParser
+from .markdown_parser import DeferredComment, MarkdownParser
+from .namespace import intern_namespace
+from .parse_cache import ParseCache
 from .resolver import Resolver
 
+if TYPE_CHECKING:
+    from mistune import BlockState
+
 
 def unpack(list_input: []):
     return list_input[0] if list_input else None
@@ -54,6 +67,9 @@ class Parser(IdlVisitor):
         file_reader: FileReaderWriter,
         idl: Path,
         position: Position = None,
+        import_cache: "Parser.ImportCache" = None,
+        parse_cache: ParseCache | None = None,
+        engine: ParserEngine = ParserEngine.antlr,
     ):
         self.resolver = resolver
         self.targets = targets
@@ -67,10 +83,100 @@ class Parser(IdlVisitor):
         self.field_decls: list[BaseField] = []
         self.type_refs: list[TypeReference] = []
         self.file_imports: list[FileReference] = []
-        self.current_namespace: list[Identifier] = []
+        self.current_namespace: tuple[Identifier, ...] = ()
         self.current_namespace_stack_size: list[int] = []
         self.errors: list[ApplicationException] = []
         self.markdown_parser = MarkdownParser(self.type_refs)
+        self.import_cache = import_cache if import_cache is not None else Parser.ImportCache()
+        self.parse_cache = parse_cache
+        self.engine = engine
+        self.loads: list[ParseCache.Load] = []
+        self.declared_types: list[BaseType] = []
+        self._syntax_errors_end = 0
+        self._content_errors_start = 0
+        self.imports: list[Path] = []
+        self.imported_type_decls: list[BaseType] = []
+        self.imported_type_refs: list[TypeReference] = []
+        self._merged_imports: set[Path] = set()
+        self.externals: list[BaseExternalType] = []
+        self.stamps: dict[Path, tuple[int, int] | None] = {}
+        self._import_errors: set[int] = set()
+
+    class ImportCache:
+        """
+        Cache of imported IDL files. Each file is only parsed once, no matter how often it is imported.
+        The files that are currently being parsed are tracked to detect circular imports.
+        All files are identified by their normalized absolute path.
+
+        The cache can be kept across multiple parse runs of the same configured context (e.g. by the language server).
+        `refresh()` has to be called before each run. It drops all entries of files that have changed on disk since
+        they have been parsed, together with all entries that (transitively) import them. The remaining entries are
+        re-registered in the resolver when they are imported again, without parsing the files again.
+        """
+
+        @dataclass
+        class Entry:
+            type_decls: list[BaseType]
+            declared_types: list[BaseType]
+            type_refs: list[TypeReference]
+            field_decls: list[BaseField]
+            imports: list[Path]
+            externals: list[BaseExternalType]
+            errors: list[ApplicationException]
+            stamps: dict[Path, tuple[int, int] | None]
+
+            def up_to_date(self) -> bool:
+                return all(
+                    stamp is not None and stamp == Parser.ImportCache.stamp(path) for path, stamp in self.stamps.items()
+                )
+
+        def __init__(self):
+            self.entries: dict[Path, Parser.ImportCache.Entry] = {}
+            self.parsing: list[Path] = []
+            self.registered: set[Path] = set()
+            self.roots: list[Path] = []
+            self.external_type_defs: list[BaseExternalType] | None = None
+
+        @staticmethod
+        def key(path: Path) -> Path:
+            return Path(os.path.normpath(path.absolute()))
+
+        @staticmethod
+        def stamp(path: Path) -> tuple[int, int] | None:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            return stat.st_mtime_ns, stat.st_size
+
+        def refresh(self):
+            """
+            Prepares the cache for a new parse run. Entries of the root files of the previous run are always dropped,
+            as their content may not match the file on disk (e.g. unsaved changes in an editor).
+            """
+            self.invalidate(
+                {path for path, entry in self.entries.items() if path in self.roots or not entry.up_to_date()}
+            )
+            self.parsing = []
+            self.registered = set()
+            self.roots = []
+
+        def invalidate(self, paths: set[Path]):
+            """
+            Drops the entries of the given files and of all files that (transitively) import one of them.
+            """
+            stale = set(paths)
+            while True:
+                dependents = {
+                    path
+                    for path, entry in self.entries.items()
+                    if path not in stale and any(imported in stale for imported in entry.imports)
+                }
+                if not dependents:
+                    break
+                stale |= dependents
+            for path in stale:
+                self.entries.pop(path, None)
 
     class ParsingException(ApplicationException, code=150):
         """IDL Parsing error"""
@@ -109,12 +215,18 @@ class Parser(IdlVisitor):
 
     def visitIdl(self, ctx: IdlParser.IdlContext):
         [self.visit(load) for load in ctx.load()]
+        self._content_errors_start = len(self.errors)
         return [self.visit(content) for content in ctx.namespaceContent()]
 
-    def visitComment(self, ctx: IdlParser.CommentContext) -> tuple[str, tuple[list, BlockState]]:
+    def visitComment(
+        self, ctx: IdlParser.CommentContext
+    ) -> tuple[str, tuple[list, "BlockState"] | DeferredComment | None]:
         raw_comment = "\n".join([line.getText()[1:] for line in ctx.COMMENT()])
         comment = "\n".join([line.getText()[1:].strip() for line in ctx.COMMENT()])
-        return (comment, self.markdown_parser.parse(raw_comment, self.current_namespace, self._position(ctx)))
+        return (
+            comment,
+            self.markdown_parser.parse_deferred(raw_comment, self.current_namespace, self._position(ctx))
+        )
 
     def visitTypeDecl(self, ctx: IdlParser.TypeDeclContext):
         type_decl_context = (
@@ -124,6 +236,7 @@ class Parser(IdlVisitor):
             type_decl: BaseType = self.visit(type_decl_context)
             self.resolver.register(type_decl)
             self.type_decls.append(type_decl)
+            self.declared_types.append(type_decl)
             return type_decl
         else:
             self.errors.append(
@@ -477,8 +590,8 @@ class Parser(IdlVisitor):
     def visitNamespace(self, ctx: IdlParser.NamespaceContext):
         comment, parsed_comment = self.visit(ctx.comment()) if ctx.comment() else (None, None)
         name = Identifier(self.visit(ctx.nsIdentifier()))
-        namespace: list[Identifier] = [Identifier(identifier) for identifier in name.split(".")]
-        self.current_namespace += namespace
+        namespace = name.split(".")
+        self.current_namespace = intern_namespace(self.current_namespace + tuple(namespace))
         self.current_namespace_stack_size.append(len(namespace))
 
         last_namespace_identifier = name.rsplit(".", 1)[-1]
@@ -492,69 +605,135 @@ class Parser(IdlVisitor):
             children=list(filter(None, [self.visit(content) for content in ctx.namespaceContent()])),
         )
         result._parsed_comment = parsed_comment
-        for _ in range(self.current_namespace_stack_size.pop()):
-            self.current_namespace.pop()
+        self.current_namespace = intern_namespace(
+            self.current_namespace[:len(self.current_namespace) - self.current_namespace_stack_size.pop()]
+        )
         return result
 
-    def visitFilepath(self, ctx: IdlParser.FilepathContext) -> FileReference | None:
-        node = ctx.FILEPATH()
+    def _load(self, kind: ParseCache.Load.Kind, ctx: IdlParser.ImportDefContext | IdlParser.ExternContext):
+        node = ctx.filepath().FILEPATH()
         if not isinstance(node, ErrorNode):
-            path = Path(node.getText()[1:-1])
-            search_paths = [self.idl.parent / path] + [include_dir / path for include_dir in self.include_dirs]
-            for search_path in search_paths:
-                if search_path.exists() and not search_path.is_dir():
-                    if search_path == self.idl:
-                        self.errors.append(
-                            Parser.ParsingException(
-                                f"Circular import detected: file {self.idl} directly references itself!",
-                                position=self._position(ctx),
-                            )
+            self._process_load(
+                ParseCache.Load(
+                    kind=kind,
+                    path=Path(node.getText()[1:-1]),
+                    path_position=self._position(ctx.filepath()),
+                    position=self._position(ctx),
+                )
+            )
+
+    def _process_load(self, load: ParseCache.Load):
+        self.loads.append(load)
+        file_reference = self._file_reference(load.path, load.path_position)
+        if file_reference:
+            match load.kind:
+                case ParseCache.Load.Kind.import_def:
+                    self._import(file_reference.path, load.position)
+                case ParseCache.Load.Kind.extern:
+                    self._extern(file_reference.path)
+
+    def _file_reference(self, path: Path, position: Position) -> FileReference | None:
+        search_paths = [self.idl.parent / path] + [include_dir / path for include_dir in self.include_dirs]
+        for search_path in search_paths:
+            if search_path.exists() and not search_path.is_dir():
+                if search_path == self.idl:
+                    self.errors.append(
+                        Parser.ParsingException(
+                            f"Circular import detected: file {self.idl} directly references itself!",
+                            position=position,
                         )
-                        return None
-                    position = self._position(ctx)
-                    path = FileReference(
-                        path=search_path.absolute(),
-                        position=position,
-                        identifier_position=position.with_offset(start=Cursor(col=1), end=Cursor(col=-1)),
                     )
-                    self.file_imports.append(path)
-                    return path
-            self.errors.append(FileNotFoundException(path, self._position(ctx)))
+                    return None
+                file_reference = FileReference(
+                    path=search_path.absolute(),
+                    position=position,
+                    identifier_position=position.with_offset(start=Cursor(col=1), end=Cursor(col=-1)),
+                )
+                self.file_imports.append(file_reference)
+                return file_reference
+        self.errors.append(FileNotFoundException(path, position))
 
     def visitExtern(self, ctx: IdlParser.ExternContext):
-        extern_path = self.visit(ctx.filepath())
-        if extern_path:
-            try:
-                self.resolver.load_external(extern_path.path)
-            except InputParsingException as e:
-                self.errors.append(e)
+        self._load(ParseCache.Load.Kind.extern, ctx)
+
+    def _extern(self, path: Path):
+        self.stamps[Parser.ImportCache.key(path)] = Parser.ImportCache.stamp(path)
+        try:
+            self.externals += self.resolver.load_external(path)
+        except InputParsingException as e:
+            self.errors.append(e)
 
     def visitImportDef(self, ctx: IdlParser.ImportDefContext):
-        import_path = self.visit(ctx.filepath())
-        if import_path:
+        self._load(ParseCache.Load.Kind.import_def, ctx)
+
+    def _import(self, path: Path, position: Position):
+        path = Parser.ImportCache.key(path)
+        if path in self.import_cache.parsing:
+            self.errors.append(
+                Parser.ParsingException(f"Circular import detected: file {path} indirectly imports itself!", position)
+            )
+            return
+        if path in self.import_cache.entries:
+            if path not in self.import_cache.registered:
+                self._register_import(path)
+        else:
             try:
-                imported_type_decls, type_refs, _, _, _ = Parser(
+                Parser(
                     resolver=self.resolver,
                     targets=self.targets,
                     supported_target_keys=self.target_keys,
                     include_dirs=self.include_dirs,
                     default_deriving=self.default_deriving,
                     file_reader=self.file_reader,
-                    idl=import_path.path,
-                    position=self._position(ctx),
+                    idl=path,
+                    position=position,
+                    import_cache=self.import_cache,
+                    parse_cache=self.parse_cache,
+                    engine=self.engine,
                 ).parse()
-                self.type_decls += imported_type_decls
-                self.type_refs += type_refs
             except Parser.ParsingExceptionList as e:
-                self.type_decls += e.type_defs
-                self.type_refs += e.type_refs
+                self._import_errors |= {id(error) for error in e.items}
                 self.errors += e.items
+        self.imports.append(path)
+        self._merge_import(path)
+
+    def _register_import(self, path: Path):
+        """
+        Registers the types of an import that has been parsed in a previous run, including all of its transitive
+        imports, without parsing the files again.
+        """
+        self.import_cache.registered.add(path)
+        entry = self.import_cache.entries[path]
+        for transitive_import in entry.imports:
+            if transitive_import not in self.import_cache.registered:
+                self._register_import(transitive_import)
+        self._import_errors |= {id(error) for error in entry.errors}
+        self.errors += entry.errors
+        for type_def in entry.externals + entry.declared_types:
+            try:
+                self.resolver.register(type_def)
+            except Resolver.TypeResolvingException as e:
+                self._import_errors.add(id(e))
+                self.errors.append(e)
+
+    def _merge_import(self, path: Path):
+        """
+        Adds the cached results of an imported file and all of its transitive imports.
+        Files that are reachable through multiple imports are only added once.
+        """
+        if path not in self._merged_imports:
+            self._merged_imports.add(path)
+            entry = self.import_cache.entries[path]
+            for transitive_import in entry.imports:
+                self._merge_import(transitive_import)
+            self.imported_type_decls += entry.type_decls
+            self.imported_type_refs += entry.type_refs
 
     def _position(self, ctx) -> Position:
         return Position(
-            start=Cursor(line=ctx.start.line - 1, col=ctx.start.column),
-            end=Cursor(line=ctx.stop.line - 1, col=ctx.stop.column + len(ctx.stop.text)),
-            file=self.idl,
+            Cursor(ctx.start.line - 1, ctx.start.column),
+            Cursor(ctx.stop.line - 1, ctx.stop.column + len(ctx.stop.text)),
+            self.idl,
         )
 
     def _dependencies(self, type_refs: list[TypeReference]) -> list[TypeReference]:
@@ -564,24 +743,106 @@ class Parser(IdlVisitor):
             output += self._dependencies(type_ref.parameters)
         return output
 
+    def _analyze(self, content: str) -> list[BaseType | Namespace]:
+        """
+        Syntax analysis of the IDL file. Runs the lexer and parser and builds the AST from the resulting parse tree.
+        """
+        tree = self._syntax_tree(content)
+        self._syntax_errors_end = len(self.errors)
+        ast = self.visit(tree)
+        for decl in self.type_decls + self.field_decls:
+            if decl.comment:
+                process_comment_commands(decl)
+        return ast
+
+    def _syntax_tree(self, content: str) -> IdlParser.IdlContext | SyntaxNode:
+        """
+        Parses the content with the configured engine. The fast engine has no error recovery, input with syntax errors
+        is therefore always parsed again by the ANTLR parser, which reports the errors.
+        """
+        if self.engine == ParserEngine.fast:
+            try:
+                return FastParser(content).parse()
+            except FastParser.UnexpectedToken:
+                pass
+        input_stream = InputStream(content)
+        lexer = IdlLexer(input_stream)
+        lexer.removeErrorListeners()
+        lexer.addErrorListener(Parser.ParsingErrorListener(self.idl, self.errors))
+        return self._antlr_syntax_tree(CommonTokenStream(lexer))
+
+    def _antlr_syntax_tree(self, stream: CommonTokenStream) -> IdlParser.IdlContext:
+        """
+        Parses the token stream in two stages: The fast SLL prediction mode is sufficient for virtually all valid
+        input. Only if it fails, the input is parsed again with full LL prediction and the default error recovery,
+        which reports the exact same syntax errors as a single LL parse.
+
+        The DFA of the generated parser is shared between all instances, so that predictions from previous parses
+        are reused.
+        """
+        parser = IdlParser(stream)
+        parser.removeErrorListeners()
+        parser._interp.predictionMode = PredictionMode.SLL
+        parser._errHandler = BailErrorStrategy()
+        try:
+            return parser.idl()
+        except ParseCancellationException:
+            parser.reset()
+            parser.addErrorListener(Parser.ParsingErrorListener(self.idl, self.errors))
+            parser._interp.predictionMode = PredictionMode.LL
+            parser._errHandler = DefaultErrorStrategy()
+            return parser.idl()
+
+    def _snapshot(self, ast: list[BaseType | Namespace]) -> ParseCache.Entry:
+        return ParseCache.Entry(
+            ast=ast,
+            type_decls=self.type_decls,
+            declared_types=self.declared_types,
+            type_refs=self.type_refs,
+            field_decls=self.field_decls,
+            loads=self.loads,
+            syntax_errors=self.errors[: self._syntax_errors_end],
+            content_errors=self.errors[self._content_errors_start :],
+        )
+
+    def _restore(self, cached: ParseCache.Entry) -> list[BaseType | Namespace]:
+        """
+        Restores the syntax analysis result from the cache. Imports and externs are processed again, so that changes in
+        the loaded files are picked up.
+        """
+        self.errors += cached.syntax_errors
+        for load in cached.loads:
+            self._process_load(load)
+        for type_decl in cached.declared_types:
+            self.resolver.register(type_decl)
+        self.type_decls = cached.type_decls
+        self.declared_types = cached.declared_types
+        self.type_refs = cached.type_refs
+        self.field_decls = cached.field_decls
+        self.errors += cached.content_errors
+        return cached.ast
+
+    @profiled("parse", lambda self: {"name": self.idl.name, "file": self.idl})
     def parse(
         self,
     ) -> tuple[list[BaseType], list[TypeReference], list[FileReference], list[BaseField], list[BaseType | Namespace]]:
         ast: list[BaseType | Namespace] = []
+        self.import_cache.parsing.append(Parser.ImportCache.key(self.idl))
+        self.stamps[Parser.ImportCache.key(self.idl)] = Parser.ImportCache.stamp(self.idl)
         try:
-            input_stream = InputStream(self.file_reader.read_idl(self.idl))
-            lexer = IdlLexer(input_stream)
-            lexer.removeErrorListeners()
-            lexer.addErrorListener(Parser.ParsingErrorListener(self.idl, self.errors))
-            stream = CommonTokenStream(lexer)
-            parser = IdlParser(stream)
-            parser.removeErrorListeners()
-            parser.addErrorListener(Parser.ParsingErrorListener(self.idl, self.errors))
-            tree = parser.idl()
-            ast = self.visit(tree)
-            for decl in self.type_decls + self.field_decls:
-                if decl._parsed_comment:
-                    ParserCommentProcessor(decl).render_tokens(*decl._parsed_comment)
+            content = self.file_reader.read_idl(self.idl)
+            cache_key = (
+                self.parse_cache.key(content, self.idl, sorted(self.target_keys), sorted(self.default_deriving))
+                if self.parse_cache
+                else None
+            )
+            cached = self.parse_cache.load(cache_key) if self.parse_cache else None
+            if cached:
+                ast = self._restore(cached)
+            else:
+                ast = self._analyze(content)
+                if self.parse_cache:
+                    self.parse_cache.store(cache_key, self._snapshot(ast))
             for type_ref in self.type_refs:
                 if not type_ref.type_def:
                     try:
@@ -606,6 +867,13 @@ class Parser(IdlVisitor):
                                 type_ref.position,
                             )
                         )
+            for decl in self.type_decls:
+                if decl.dependencies:
+                    # declarations only need each distinct dependency once, positions are kept in `type_refs`
+                    decl.dependencies = list(
+                        {id(canonical): canonical for canonical in map(self.resolver.canonical, decl.dependencies)}
+                        .values()
+                    )
             for target in self.targets:
                 target.marshal(self.type_decls, self.field_decls)
             for decl in self.type_decls:
@@ -695,14 +963,23 @@ class Parser(IdlVisitor):
                                 )
         except FileNotFoundError as e:
             raise FileNotFoundException(Path(e.filename))
-        except RecursionError:
-            self.errors.append(
-                Parser.ParsingException(
-                    f"Circular import detected: file {self.idl} indirectly imports itself!", self.position
-                )
-            )
+        finally:
+            self.import_cache.parsing.remove(Parser.ImportCache.key(self.idl))
+        self.import_cache.entries[Parser.ImportCache.key(self.idl)] = Parser.ImportCache.Entry(
+            type_decls=self.type_decls,
+            declared_types=self.declared_types,
+            type_refs=self.type_refs,
+            field_decls=self.field_decls,
+            imports=self.imports,
+            externals=self.externals,
+            errors=[error for error in self.errors if id(error) not in self._import_errors],
+            stamps=self.stamps,
+        )
+        self.import_cache.registered.add(Parser.ImportCache.key(self.idl))
+        type_decls = self.imported_type_decls + self.type_decls
+        type_refs = self.imported_type_refs + self.type_refs
         if self.errors:
             raise Parser.ParsingExceptionList(
-                self.errors, self.type_decls, self.type_refs, self.file_imports, self.field_decls, ast
+                self.errors, type_decls, type_refs, self.file_imports, self.field_decls, ast
             )
-        return self.type_decls, self.type_refs, self.file_imports, self.field_decls, ast
+        return type_decls, type_refs, self.file_imports, self.field_decls, ast
@@ -12,18 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
+import os
 from pathlib import Path
 
 import pydantic
 import yaml
-import re
+from yaml.nodes import MappingNode, Node, ScalarNode
+
+try:
+    # libyaml bindings are not available on all platforms
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 from pydjinni.exceptions import InputParsingException, FileNotFoundException, ApplicationException
 from pydjinni.parser.ast import TypeReference, BaseType
 from pydjinni.parser.base_models import BaseExternalType, CommentTypeReference
 from pydjinni.parser.markdown_parser import MarkdownParser
-from pydjinni.position import Position
+from pydjinni.position import Cursor, Position
+from pydjinni.profiler import profiled
 
 
 class Resolver:
@@ -33,49 +40,119 @@ class Resolver:
     def __init__(self, external_types_model: type[BaseExternalType]):
         self.registry: dict[str, BaseExternalType] = {}
         self._external_types_model = external_types_model
+        # registry key prefixes of all enclosing scopes of a namespace, from the innermost to the global scope
+        self._scope_chains: dict[tuple[str, ...], tuple[str, ...]] = {}
+        # resolved relative references by name and namespace of the reference
+        self._resolved: dict[str, dict[tuple[str, ...], BaseExternalType | None]] = {}
+        # canonical type references by type definition, optionality and canonical generic parameters
+        self._canonical: dict[tuple[int, ...], TypeReference] = {}
+        # loaded external types by file, together with the modification time and size of the file when it was loaded
+        self._externals: dict[Path, tuple[tuple[int, int], list[BaseExternalType]]] = {}
+
+    @profiled("extern", lambda self, path: {"name": path.name, "file": path})
+    def load_external(self, path: Path) -> list[BaseExternalType]:
+        """
+        Loads and registers all external types that are defined in the given YAML file.
+
+        The loaded types are kept until the file is modified, so that loading the same file again after a `reset()`
+        only registers the types again.
+
+        Returns:
+            the registered external types
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundException(path)
+        key = Path(os.path.normpath(path.absolute()))
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._externals.get(key)
+        if cached is not None and cached[0] == stamp:
+            loaded_types = cached[1]
+        else:
+            loaded_types = self._load_external_file(path)
+            self._externals[key] = (stamp, loaded_types)
+        for loaded_type in loaded_types:
+            self.register(loaded_type)
+        return list(loaded_types)
 
-    def load_external(self, path: Path):
+    def _load_external_file(self, path: Path) -> list[BaseExternalType]:
+        loaded_types: list[BaseExternalType] = []
         try:
-            content = path.read_text()
-            types_dict = yaml.safe_load_all(content)
-            for type_dict in types_dict:
-                if type_dict is not None:
-                    types_type = self._external_types_model.model_validate(type_dict)
-                    types_type._parsed_comment = MarkdownParser().parse(types_type.comment, namespace=types_type.namespace)
-                    pattern = re.compile(r'^name: *(' + types_type.name + ')$', re.MULTILINE)
-                    match = pattern.search(content)
-                    if match:
-                        types_type.position = Position.from_match(content, path, match)
-                    else:
-                        types_type.position = Position(file=path)
-                    types_type.identifier_position = types_type.position
-                    self.register(types_type)
+            with path.open() as stream:
+                loader = SafeLoader(stream)
+                try:
+                    while loader.check_node():
+                        node = loader.get_node()
+                        type_dict = loader.construct_document(node)
+                        if type_dict is not None:
+                            types_type = self._external_types_model.model_validate(type_dict)
+                            types_type._parsed_comment = MarkdownParser().parse_deferred(
+                                types_type.comment, namespace=types_type.namespace
+                            )
+                            types_type.position = self._name_position(node, path)
+                            types_type.identifier_position = types_type.position
+                            loaded_types.append(types_type)
+                finally:
+                    loader.dispose()
         except pydantic.ValidationError as e:
             raise InputParsingException.from_pydantic_error(e, file=path)
         except yaml.MarkedYAMLError as e:
             raise InputParsingException.from_yaml_error(e)
         except FileNotFoundError:
             raise FileNotFoundException(path)
+        return loaded_types
+
+    @staticmethod
+    def _name_position(node: Node, path: Path) -> Position:
+        """
+        Position of the value of the `name` key in the YAML document, as recorded by the YAML parser.
+        """
+        if isinstance(node, MappingNode):
+            for key_node, value_node in node.value:
+                if key_node.value == "name" and isinstance(value_node, ScalarNode):
+                    return Position(
+                        file=path,
+                        start=Cursor(line=value_node.start_mark.line, col=value_node.start_mark.column),
+                        end=Cursor(line=value_node.end_mark.line, col=value_node.end_mark.column)
+                    )
+        return Position(file=path)
 
     def register(self, datatype: BaseExternalType):
-        registry_name = ".".join(datatype.namespace + [datatype.name])
+        registry_name = ".".join((*datatype.namespace, datatype.name))
         if registry_name in self.registry:
             raise Resolver.TypeResolvingException(f"Type '{datatype.name}' already exists", datatype.position)
         else:
             self.registry[registry_name] = datatype
+            # the new type may shadow types that previously have been resolved for any reference that could match it
+            parts = registry_name.split(".")
+            for index in range(len(parts)):
+                self._resolved.pop(".".join(parts[index:]), None)
+
+    def _scope_chain(self, namespace: tuple[str, ...]) -> tuple[str, ...]:
+        scope_chain = self._scope_chains.get(namespace)
+        if scope_chain is None:
+            scope_chain = tuple(
+                "".join(f"{part}." for part in namespace[:depth]) for depth in range(len(namespace), -1, -1)
+            )
+            self._scope_chains[namespace] = scope_chain
+        return scope_chain
 
     def resolve(self, type_reference: TypeReference) -> BaseType:
         type_def: BaseExternalType | None = None
         if type_reference.name.startswith('.'):  # absolute reference. No need to search for the type
             type_def = self.registry.get(type_reference.name[1:])
         else:  # relative type. Search in current and all above namespaces until a matching type is found
-            namespace_copy = copy.deepcopy(type_reference.namespace)
-            while type_def is None:
-                type_def = self.registry.get('.'.join(namespace_copy + [type_reference.name]))
-                if namespace_copy:
-                    namespace_copy.pop()
-                else:
-                    break
+            namespace = tuple(type_reference.namespace)
+            resolved = self._resolved.setdefault(type_reference.name, {})
+            if namespace in resolved:
+                type_def = resolved[namespace]
+            else:
+                for prefix in self._scope_chain(namespace):
+                    type_def = self.registry.get(prefix + type_reference.name)
+                    if type_def is not None:
+                        break
+                resolved[namespace] = type_def
 
         if type_def is None and not isinstance(type_reference, CommentTypeReference):
             raise Resolver.TypeResolvingException(
@@ -84,6 +161,29 @@ class Resolver:
             )
         return type_def
 
+    def canonical(self, type_reference: TypeReference) -> TypeReference:
+        """
+        Returns the canonical form of a resolved type reference. All structurally identical references, with the same
+        type definition, generic parameters and optionality, share one canonical reference that has no source
+        position. Unresolved references are returned unchanged.
+        """
+        if type_reference.type_def is None:
+            return type_reference
+        parameters = [self.canonical(parameter) for parameter in type_reference.parameters]
+        key = (id(type_reference.type_def), type_reference.optional, *[id(parameter) for parameter in parameters])
+        canonical = self._canonical.get(key)
+        if canonical is None:
+            type_def = type_reference.type_def
+            canonical = TypeReference.model_construct(
+                name=".".join(("", *type_def.namespace, type_def.name)),
+                parameters=parameters,
+                optional=type_reference.optional,
+                type_def=type_def,
+            )
+            self._canonical[key] = canonical
+        return canonical
 
     def reset(self):
         self.registry = dict()
+        self._resolved = dict()
+        self._canonical = dict()
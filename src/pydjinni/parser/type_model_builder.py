@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import cache
+
 from pydantic import create_model, BaseModel
 
 
 class TypeModelBuilder:
     """
-    Create the BaseModel for (external) type validation from all loaded generator modules
+    Create the BaseModel for (external) type validation from all loaded generator modules.
+
+    Built models are memoized per process, keyed on the base model and the registered field models.
     """
 
     def __init__(self, model_base: type[BaseModel]):
@@ -28,9 +32,14 @@ class TypeModelBuilder:
         self._models[field_name] = model
 
     def build(self):
-        field_kwargs = {key: (model, None) for key, model in self._models.items()}
+        return self._build(self._model_base, tuple(self._models.items()))
+
+    @staticmethod
+    @cache
+    def _build(model_base: type[BaseModel], models: tuple[tuple[str, type[BaseModel]], ...]):
+        field_kwargs = {key: (model, None) for key, model in models}
         return create_model(
-            self._model_base.__name__,
-            __base__=self._model_base,
+            model_base.__name__,
+            __base__=model_base,
             **field_kwargs
         )
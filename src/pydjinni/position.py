@@ -14,27 +14,141 @@
 
 from pathlib import Path
 from re import Match
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic_core import core_schema
 
 
-class Cursor(BaseModel):
+class Cursor(NamedTuple):
     line: int = 0
     col: int = 0
 
 
-class Position(BaseModel):
-    start: Cursor | None = None
-    end: Cursor | None = None
-    file: Path | None = None
+_files: dict[Path, Path] = {}
+
+
+def _intern_file(file: Path | str | None) -> Path | None:
+    """
+    Returns the shared instance of the given file path, so that all positions in a file reference the same object.
+    """
+    if file is None:
+        return None
+    try:
+        return _files[file]
+    except KeyError:
+        if not isinstance(file, Path):
+            file = Path(file)
+        return _files.setdefault(file, file)
+
+
+def reset_files():
+    """
+    Forgets all interned file paths. Paths can't be referenced weakly, so the interned paths are reset at the start of
+    each parse to keep long-running processes like the language server from collecting every path they have seen.
+    """
+    _files.clear()
+
+
+def _cursor(value: Cursor | dict | list | None) -> Cursor | None:
+    if value is None:
+        return None
+    return Cursor(**value) if isinstance(value, dict) else Cursor(*value)
+
+
+class Position:
+    """
+    Immutable span in a source file.
+
+    Positions are created for every node of the AST, so they are kept as small as possible: the cursors are tuples
+    and the file path is shared between all positions of the same file.
+    """
+    __slots__ = ("start", "end", "file")
+
+    start: Cursor | None
+    end: Cursor | None
+    file: Path | None
+
+    def __init__(self, start: Cursor | None = None, end: Cursor | None = None, file: Path | None = None):
+        object.__setattr__(self, "start", start)
+        object.__setattr__(self, "end", end)
+        object.__setattr__(self, "file", _intern_file(file))
+
+    def __setattr__(self, key: str, value: Any):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, key: str):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.start == other.start and self.end == other.end and self.file == other.file
+
+    def __hash__(self) -> int:
+        return hash((self.start, self.end, self.file))
+
+    def __repr__(self) -> str:
+        return f"Position(start={self.start!r}, end={self.end!r}, file={self.file!r})"
+
+    def __reduce__(self):
+        return Position, (self.start, self.end, self.file)
+
+    def model_dump(self, mode: str = "python") -> dict[str, Any]:
+        return {
+            "start": self.start._asdict() if self.start else None,
+            "end": self.end._asdict() if self.end else None,
+            "file": str(self.file) if mode == "json" and self.file else self.file,
+        }
+
+    @classmethod
+    def model_validate(cls, value: Any) -> "Position":
+        if isinstance(value, Position):
+            return value
+        if isinstance(value, dict):
+            return Position(
+                start=_cursor(value.get("start")),
+                end=_cursor(value.get("end")),
+                file=value.get("file"),
+            )
+        raise ValueError(f"Cannot convert '{type(value).__name__}' to a Position")
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.union_schema(
+            [core_schema.is_instance_schema(cls), core_schema.no_info_plain_validator_function(cls.model_validate)],
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda position, info: position.model_dump(mode=info.mode), info_arg=True
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler):
+        cursor = {
+            "anyOf": [
+                {
+                    "type": "object",
+                    "properties": {"line": {"type": "integer"}, "col": {"type": "integer"}},
+                },
+                {"type": "null"},
+            ]
+        }
+        return {
+            "type": "object",
+            "properties": {
+                "start": cursor,
+                "end": cursor,
+                "file": {"anyOf": [{"type": "string", "format": "path"}, {"type": "null"}]},
+            },
+        }
 
     @staticmethod
     def from_match(content: str, file: Path, match: Match, group: str | int = 1):
-        line_start = content[:match.start(group)].count('\n')
-        line_end = content[:match.end(group)].count('\n')
+        line_start = content.count('\n', 0, match.start(group))
+        line_end = line_start + content.count('\n', match.start(group), match.end(group))
         col_start = match.start(group) - content.rfind('\n', 0, match.start(group)) - 1
         col_end = match.end(group) - content.rfind('\n', 0, match.end(group)) - 1
-        return Position(file=file, start=Cursor(line=line_start, col=col_start), end=Cursor(line=line_end, col=col_end))
+        return Position(file=file, start=Cursor(line_start, col_start), end=Cursor(line_end, col_end))
     
     def relative_to(self, base: 'Position', column_offset: int = 0):
         """
@@ -43,16 +157,11 @@ class Position(BaseModel):
         :param base: the base Position object
         :param column_offset: additional offset for the column
         """
+        line, col = base.start
         return Position(
-            start=Cursor(
-                line=base.start.line + self.start.line,
-                col=base.start.col + self.start.col + column_offset
-            ), 
-            end=Cursor(
-                line=base.start.line + self.end.line,
-                col=base.start.col + self.end.col + column_offset
-            ),
-            file=self.file
+            Cursor(line + self.start.line, col + self.start.col + column_offset),
+            Cursor(line + self.end.line, col + self.end.col + column_offset),
+            self.file
         )
     
     def with_offset(self, start: Cursor = Cursor(), end: Cursor = Cursor()):
@@ -63,7 +172,7 @@ class Position(BaseModel):
         :param end: the end offset
         """
         return Position(
-            start=Cursor(line=self.start.line + start.line, col=self.start.col + start.col),
-            end=Cursor(line=self.end.line + end.line, col=self.end.col + end.col),
-            file=self.file
+            Cursor(self.start.line + start.line, self.start.col + start.col),
+            Cursor(self.end.line + end.line, self.end.col + end.col),
+            self.file
         )
@@ -0,0 +1,250 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterator
+
+
+class Profiler:
+    """
+    Records the time spent in the phases of a run, e.g. parsing, marshalling, rendering and writing.
+
+    Phases are recorded by the `profiled` decorator and the `span` context manager. Both are no-ops unless a profiler
+    is active:
+
+    ```python
+    with Profiler() as profiler:
+        API().configure("pydjinni.yaml").parse("input.pydjinni").generate("cpp")
+    print(profiler.totals(lambda span: span.category))
+    profiler.write_trace(Path("trace.json"))
+    ```
+    """
+
+    @dataclass
+    class Span:
+        name: str
+        category: str
+        start: int
+        """Start time in nanoseconds, relative to the start of the profiler"""
+        thread: int
+        target: str | None = None
+        args: dict[str, Any] = field(default_factory=dict)
+        duration: int = 0
+        """Total duration in nanoseconds"""
+        self_duration: int = 0
+        """Duration in nanoseconds without the time spent in nested spans"""
+
+    def __init__(self):
+        self.spans: list[Profiler.Span] = []
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._target: str | None = None
+        self._previous: Profiler | None = None
+        self.counters: dict[tuple[str, str], dict[str, int]] = {}
+        """Counters by category and name, e.g. the hits and misses of a cache"""
+
+    def __enter__(self) -> "Profiler":
+        global _active
+        self._previous, _active = _active, self
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        _active = self._previous
+
+    @contextmanager
+    def span(self, name: str, category: str, target: str | None = None, **args) -> Iterator["Profiler.Span"]:
+        """
+        Records a span. Nested spans of the same thread are subtracted from the self duration of the enclosing span.
+
+        Args:
+            name: name of the span, e.g. the processed file or type.
+            category: the phase that the span belongs to.
+            target: the target that the span belongs to. If not given, the target of the enclosing span is used.
+                    The target is shared across threads, targets must therefore not be processed concurrently.
+            args: additional information about the span.
+        """
+        stack: list[Profiler.Span] = self._local.__dict__.setdefault("stack", [])
+        previous_target = self._target
+        if target is not None:
+            self._target = target
+        start = time.perf_counter_ns() - self._origin
+        current = Profiler.Span(
+            name=name,
+            category=category,
+            start=start,
+            thread=threading.get_ident(),
+            target=self._target,
+            args=args
+        )
+        stack.append(current)
+        try:
+            yield current
+        finally:
+            current.duration = time.perf_counter_ns() - self._origin - start
+            current.self_duration += current.duration
+            stack.pop()
+            if stack:
+                stack[-1].self_duration -= current.duration
+            self._target = previous_target
+            with self._lock:
+                self.spans.append(current)
+
+    def count(self, name: str, category: str, **values: int):
+        """
+        Adds the given values to the counters of the given name, e.g. the hits and misses of a cache.
+
+        Args:
+            name: name of the counters, e.g. the target that the cache belongs to.
+            category: the kind of counters, e.g. the name of the cache.
+            values: the amounts that are added to each counter.
+        """
+        with self._lock:
+            counters = self.counters.setdefault((category, name), {})
+            for key, value in values.items():
+                counters[key] = counters.get(key, 0) + value
+
+    def totals(self, key: Callable[["Profiler.Span"], Hashable | None]) -> dict[Hashable, tuple[float, int]]:
+        """
+        Sums up the self duration of all spans by the given key. Spans with the key `None` are ignored.
+
+        Returns:
+            the total duration in seconds and the number of spans for each key, sorted by duration in descending order.
+        """
+        totals: dict[Hashable, list] = defaultdict(lambda: [0, 0])
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            group = key(span)
+            if group is not None:
+                totals[group][0] += span.self_duration
+                totals[group][1] += 1
+        return {
+            group: (duration / 1e9, count)
+            for group, (duration, count) in sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+        }
+
+    @property
+    def duration(self) -> float:
+        """Total duration of all top-level spans in seconds"""
+        with self._lock:
+            return sum(span.self_duration for span in self.spans) / 1e9
+
+    def trace(self) -> dict:
+        """
+        Returns:
+            all recorded spans in the Chrome trace event format. Can be viewed with `chrome://tracing` or Perfetto.
+        """
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+        threads = sorted({span.thread for span in spans})
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread,
+                "args": {"name": "main" if thread == threading.main_thread().ident else f"worker-{index}"},
+            }
+            for index, thread in enumerate(threads)
+        ]
+        for span in sorted(spans, key=lambda span: span.start):
+            args = {key: str(value) for key, value in span.args.items()}
+            if span.target is not None:
+                args["target"] = span.target
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start / 1e3,
+                "dur": span.duration / 1e3,
+                "pid": pid,
+                "tid": span.thread,
+                "args": args,
+            })
+        with self._lock:
+            counters = list(self.counters.items())
+        end = max((span.start + span.duration for span in spans), default=0)
+        for (category, name), values in counters:
+            events.append({
+                "name": name,
+                "cat": category,
+                "ph": "C",
+                "ts": end / 1e3,
+                "pid": pid,
+                "args": dict(values),
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.trace()))
+
+
+_active: Profiler | None = None
+
+
+def span(name: str, category: str, target: str | None = None, **args):
+    """
+    Records a span with the active profiler. Does nothing if no profiler is active.
+    See `Profiler.span` for the arguments.
+    """
+    profiler = _active
+    if profiler is None:
+        return nullcontext()
+    return profiler.span(name, category, target, **args)
+
+
+def count(name: str, category: str, **values: int):
+    """
+    Adds the given values to the counters of the active profiler. Does nothing if no profiler is active.
+    See `Profiler.count` for the arguments.
+    """
+    profiler = _active
+    if profiler is not None:
+        profiler.count(name, category, **values)
+
+
+def profiled(category: str, describe: Callable[..., dict[str, Any]]):
+    """
+    Decorator that records each call of the decorated function as a span with the active profiler.
+
+    Args:
+        category: the phase that the span belongs to.
+        describe: called with the arguments of the decorated function, only if a profiler is active. Returns the
+                  arguments of the span, at least the `name`.
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return function(*args, **kwargs)
+            with profiler.span(category=category, **describe(*args, **kwargs)):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 from pathlib import Path
 from typing import AsyncGenerator
 from urllib.parse import unquote
@@ -12,7 +13,8 @@ from pydjinni.parser.parser import Parser
 from pydjinni.position import Cursor, Position
 from pydjinni_language_server.models import Configuration, Diagnostics, GeneratedSource, ReferenceLocationLink
 from pydjinni_language_server.text_document_path import TextDocumentPath
-from pydjinni_language_server.util import to_hover_cache
+from pydjinni_language_server.util import HoverIndex
+from pydjinni_language_server.validation_scheduler import ValidationScheduler
 
 
 class Workspace:
@@ -23,14 +25,17 @@ class Workspace:
         self.api = API(root_path=self.root_path)
         self.ast_cache: dict[str, list[BaseType | Namespace]] = {}
         self.type_def_cache: dict[str, list[BaseType]] = {}
-        self.hover_cache: dict[
-            str, dict[int, dict[int, TypeReference | FileReference | BaseField | Namespace | BaseType]]
-        ] = {}
+        self.hover_cache: dict[str, HoverIndex] = {}
         self.dependency_cache: dict[str, set[str]] = {}
+        self.registry_cache: dict[str, list[BaseExternalType]] = {}
         self.configuration = Configuration()
         self.configured_event = asyncio.Event()
         self.generate_context: dict[str, API.ConfiguredContext.GenerateContext] = {}
         self.validated_event = asyncio.Event()
+        self.import_cache = Parser.ImportCache()
+        self.validation_scheduler = ValidationScheduler()
+        # parsing and generating run in worker threads, but share the state of the configured context
+        self._processing_lock = threading.Lock()
 
     def configure(self, configuration: Configuration | None = None):
         if configuration:
@@ -44,6 +49,7 @@ class Workspace:
             self.configured_context = self.api.configure(path=absolute_config)
         else:
             self.configured_context = self.api.configure(options={"generate": {}})
+        self.import_cache = Parser.ImportCache()
         self.configured_event.set()
 
     def reset_cache(self, uri: str):
@@ -53,22 +59,38 @@ class Workspace:
         self.ast_cache.pop(uri)
         self.type_def_cache.pop(uri)
         self.generate_context.pop(uri)
+        self.registry_cache.pop(uri)
+        self.validation_scheduler.cancel(uri)
         for cache in self.dependency_cache.values():
             if uri in cache:
                 cache.remove(uri)
 
+    def _parse(
+        self, configured_context: API.ConfiguredContext, import_cache: Parser.ImportCache, document: TextDocumentPath
+    ) -> tuple[API.ConfiguredContext.GenerateContext | Parser.ParsingExceptionList, list[BaseExternalType]]:
+        with self._processing_lock:
+            results: API.ConfiguredContext.GenerateContext | Parser.ParsingExceptionList
+            try:
+                results = configured_context.parse(document, use_cache=False, import_cache=import_cache)
+            except Parser.ParsingExceptionList as e:
+                results = e
+            return results, list(configured_context.resolver.registry.values())
+
     async def validate(self, document: TextDocumentPath) -> Diagnostics:
+        """
+        Parses the document in a worker thread and updates all caches of the document with the results.
+        """
         await self.configured_event.wait()
         errors: list[Diagnostics.DiagnosticItem] = []
         warnings: list[Diagnostics.DiagnosticItem] = []
-        results: API.ConfiguredContext.GenerateContext | Parser.ParsingExceptionList
         uri = document.as_uri()
-        try:
-            results = self.configured_context.parse(document)
+        results, self.registry_cache[uri] = await asyncio.to_thread(
+            self._parse, self.configured_context, self.import_cache, document
+        )
+        if isinstance(results, API.ConfiguredContext.GenerateContext):
             self.generate_context[uri] = results
-        except Parser.ParsingExceptionList as e:
-            results = e
-            for error in e.items:
+        else:
+            for error in results.items:
                 if error.position.file.as_uri() == uri:
                     errors.append(
                         Diagnostics.DiagnosticItem(definition=error, message=f"{error.__doc__}: {error.description}")
@@ -85,7 +107,7 @@ class Workspace:
                 if isinstance(type_ref.type_def.deprecated, str):
                     message += f": {type_ref.type_def.deprecated}"
                 warnings.append(Diagnostics.DiagnosticItem(type_ref, message))
-        self.hover_cache[uri] = to_hover_cache(
+        self.hover_cache.setdefault(uri, HoverIndex()).replace(
             [
                 ref
                 for ref in results.type_refs + results.file_imports + results.fields + results.ast
@@ -110,11 +132,11 @@ class Workspace:
         self, row: int, col: int, uri: str
     ) -> TypeReference | FileReference | BaseField | Namespace | BaseType | None:
         await self.validated_event.wait()
-        return self.hover_cache[unquote(uri)].get(row, {}).get(col)
+        return self.hover_cache[unquote(uri)].get(row, col)
 
     async def get_definitions(self, row: int, col: int, uri: str) -> AsyncGenerator[ReferenceLocationLink]:
         await self.validated_event.wait()
-        cache_entry = self.hover_cache[unquote(uri)].get(row, {}).get(col)
+        cache_entry = self.hover_cache[unquote(uri)].get(row, col)
         if cache_entry:
             if isinstance(cache_entry, FileReference):
                 yield ReferenceLocationLink(
@@ -155,21 +177,15 @@ class Workspace:
         a list of all known type_defs except of error types and anonymous function types
         """
         await self.validated_event.wait()
-        resolver = (
-            self.generate_context[uri].resolver if uri in self.generate_context else self.configured_context.resolver
-        )
         return [
             type_def
-            for type_def in resolver.registry.values()
+            for type_def in self.registry_cache.get(unquote(uri), [])
             if (not isinstance(type_def, Function) or not type_def.anonymous) and not isinstance(type_def, ErrorDomain)
         ]
 
     async def get_all_error_domains(self, uri: str) -> list[ErrorDomain]:
         await self.validated_event.wait()
-        resolver = (
-            self.generate_context[uri].resolver if uri in self.generate_context else self.configured_context.resolver
-        )
-        return [type_def for type_def in resolver.registry.values() if isinstance(type_def, ErrorDomain)]
+        return [type_def for type_def in self.registry_cache.get(unquote(uri), []) if isinstance(type_def, ErrorDomain)]
 
     def get_all_target_languages(self) -> list[Target]:
         return [value for value in self.api.generation_targets.values() if not value.internal]
@@ -177,8 +193,13 @@ class Workspace:
     async def generate_on_save(self, document: TextDocumentPath):
         await self.validated_event.wait()
         if self.configuration.generate_on_save and self.generate_context:
-            generate_context = self.generate_context[document.as_uri()]
-            for target in self.configured_context.configured_targets:
+            await asyncio.to_thread(
+                self._generate, self.generate_context[document.as_uri()], self.configured_context.configured_targets
+            )
+
+    def _generate(self, generate_context: API.ConfiguredContext.GenerateContext, targets: list[Target]):
+        with self._processing_lock:
+            for target in targets:
                 generate_context.generate(target.key, clean=True)
 
     async def get_generated_sources(self, uri: str) -> AsyncGenerator[GeneratedSource]:
@@ -16,6 +16,7 @@ from traceback import TracebackException
 
 from lsprotocol.types import *
 from pygls.server import LanguageServer, ServerErrors
+from pygls.workspace import TextDocument
 from pydjinni_language_server.api import Workspace
 from .text_document_path import TextDocumentPath
 
@@ -61,4 +62,13 @@ class PyDjinniLanguageServer(LanguageServer):
             self.lsp.send_request(WORKSPACE_CODE_LENS_REFRESH)
 
     def get_text_document_path(self, uri: str):
-        return TextDocumentPath(self.workspace.get_text_document(uri))
+        """
+        Returns:
+            a snapshot of the current document content, that is not affected by subsequent changes
+        """
+        document = self.workspace.get_text_document(uri)
+        return TextDocumentPath(
+            TextDocument(
+                uri=document.uri, source=document.source, version=document.version, language_id=document.language_id
+            )
+        )
@@ -13,6 +13,7 @@ from pydjinni.position import Position
 class Configuration(BaseModel, alias_generator=to_camel):
     config: Path = DEFAULT_CONFIG_PATH
     generate_on_save: bool = False
+    validation_delay: float = 0.3
 
     @staticmethod
     def from_response(responses: list[dict[str, Any]]) -> list["Configuration"]:
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import re
 from typing import cast
 import uuid
 from importlib.metadata import version
 from urllib.parse import unquote
+from pygls.exceptions import FeatureNotificationError
 from pygls.workspace.text_document import TextDocument
 from lsprotocol.types import *
 from pydjinni.parser.base_models import TypeReference, FileReference
@@ -43,6 +45,26 @@ server = PyDjinniLanguageServer(
 )
 
 
+def schedule_validation(ls: PyDjinniLanguageServer, uri: str, delay: float = 0.0):
+    """
+    Schedules the validation of a document. Replaces any pending or running validation of the same document.
+    The diagnostics are only published if the document has not been changed again in the meantime.
+    """
+    workspace = api.get_workspace(uri)
+    document = ls.get_text_document_path(uri)
+
+    async def validate():
+        try:
+            diagnostics = await workspace.validate(document)
+        except Exception as e:
+            ls.report_server_error(e, FeatureNotificationError)
+            return
+        if ls.workspace.get_text_document(uri).version == document.version:
+            ls.publish_diagnostics(uri=uri, diagnostics=to_diagnostics(diagnostics), version=document.version)
+
+    return workspace.validation_scheduler.schedule(uri, validate, delay)
+
+
 async def configure(ls: PyDjinniLanguageServer, configurations: list[Configuration]):
     for workspace, configuration in zip(api.workspaces, configurations):
         workspace.configure(configuration)
@@ -126,9 +148,9 @@ async def did_change_configuration(ls: PyDjinniLanguageServer, params: DidChange
     else:
         configurations = Configuration.from_response([cast(dict, params.settings)["pydjinni"]])
         await configure(ls, configurations)
-    for uri in ls.workspace.documents.keys():
-        diagnostics = await api.get_workspace(uri).validate(ls.get_text_document_path(uri))
-        ls.publish_diagnostics(uri=uri, diagnostics=to_diagnostics(diagnostics))
+    await asyncio.gather(
+        *[schedule_validation(ls, uri) for uri in ls.workspace.documents.keys()], return_exceptions=True
+    )
 
     ls.request_code_lens_refresh()
 
@@ -136,14 +158,8 @@ async def did_change_configuration(ls: PyDjinniLanguageServer, params: DidChange
 @server.feature(TEXT_DOCUMENT_DID_CHANGE)
 async def did_change(ls: PyDjinniLanguageServer, params: DidChangeTextDocumentParams):
     ls.show_message_log(f"[{TEXT_DOCUMENT_DID_CHANGE}] {params.text_document.uri}")
-    diagnostics = await api.get_workspace(params.text_document.uri).validate(
-        ls.get_text_document_path(params.text_document.uri)
-    )
-    ls.publish_diagnostics(
-        uri=params.text_document.uri,
-        diagnostics=to_diagnostics(diagnostics),
-        version=params.text_document.version,
-    )
+    workspace = api.get_workspace(params.text_document.uri)
+    schedule_validation(ls, params.text_document.uri, delay=workspace.configuration.validation_delay)
 
 
 @server.feature(TEXT_DOCUMENT_DID_CLOSE)
@@ -155,14 +171,7 @@ def did_close(ls: PyDjinniLanguageServer, params: DidCloseTextDocumentParams):
 @server.feature(TEXT_DOCUMENT_DID_OPEN)
 async def did_open(ls: PyDjinniLanguageServer, params: DidOpenTextDocumentParams):
     ls.show_message_log(f"[{TEXT_DOCUMENT_DID_OPEN}] {params.text_document.uri}")
-    diagnostics = await api.get_workspace(params.text_document.uri).validate(
-        ls.get_text_document_path(params.text_document.uri)
-    )
-    ls.publish_diagnostics(
-        uri=params.text_document.uri,
-        diagnostics=to_diagnostics(diagnostics),
-        version=params.text_document.version,
-    )
+    schedule_validation(ls, params.text_document.uri)
 
 
 @server.feature(TEXT_DOCUMENT_DID_SAVE)
@@ -188,8 +197,7 @@ async def did_change_watched_files(ls: PyDjinniLanguageServer, params: DidChange
             ls.request_code_lens_refresh()
         for uri, dependencies in workspace.dependency_cache.items():
             if change_uri in dependencies:
-                diagnostics = await workspace.validate(ls.get_text_document_path(uri))
-                ls.publish_diagnostics(uri=uri, diagnostics=to_diagnostics(diagnostics))
+                schedule_validation(ls, uri)
 
 
 @server.feature(TEXT_DOCUMENT_HOVER)
@@ -326,7 +334,7 @@ async def completion(ls: PyDjinniLanguageServer, params: CompletionParams) -> li
             )
             result = []
             for type_def in await type_defs:
-                label = ".".join(type_def.namespace + [type_def.name])
+                label = ".".join((*type_def.namespace, type_def.name))
                 text_edit = label
                 if type_def.params:
                     label += f"<{','.join(type_def.params)}>"
@@ -27,6 +27,10 @@ class TextDocumentPath(Path):
     def read_text(self, encoding: str | None = None, errors: str | None = None, newline: str | None = None):
         return self.document.source
 
+    @property
+    def version(self) -> int | None:
+        return self.document.version
+
     def as_uri(self):
         return unquote(self.document.uri)
     
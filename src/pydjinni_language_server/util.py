@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from bisect import bisect_left, bisect_right
+
 from lsprotocol.types import (
     DocumentSymbol,
     SymbolKind,
@@ -56,27 +58,79 @@ def to_diagnostics(diagnostics: Diagnostics):
     return error_diagnostics + warning_diagnostics
 
 
-def to_hover_cache(
-    items: list[TypeReference | FileReference | BaseField | Namespace | BaseType],
-) -> dict[int, dict[int, TypeReference | FileReference | BaseField | Namespace | BaseType]]:
-    cache: dict[int, dict[int, TypeReference | FileReference | BaseField | Namespace | BaseType]] = {}
+HoverItem = TypeReference | FileReference | BaseField | Namespace | BaseType
+
+
+class HoverIndex:
+    """
+    Maps cursor positions of a document to the item whose identifier is at that position.
+
+    Each line holds a sorted list of non-overlapping column intervals that is searched with bisect. Items that are
+    added later take precedence over previously added items in the columns where they overlap, e.g. the children of a
+    namespace over the namespace itself.
+    """
+
+    class Line:
+        def __init__(self):
+            self.starts: list[int] = []
+            self.ends: list[int] = []
+            self.items: list[HoverItem] = []
+
+        def insert(self, start: int, end: int, item: HoverItem):
+            if start >= end:
+                return
+            first = bisect_right(self.ends, start)
+            last = bisect_left(self.starts, end)
+            starts, ends, items = [start], [end], [item]
+            if first < last and self.starts[first] < start:
+                starts.insert(0, self.starts[first])
+                ends.insert(0, start)
+                items.insert(0, self.items[first])
+            if first < last and self.ends[last - 1] > end:
+                starts.append(end)
+                ends.append(self.ends[last - 1])
+                items.append(self.items[last - 1])
+            self.starts[first:last] = starts
+            self.ends[first:last] = ends
+            self.items[first:last] = items
+
+        def get(self, col: int) -> HoverItem | None:
+            index = bisect_right(self.starts, col) - 1
+            if index >= 0 and col < self.ends[index]:
+                return self.items[index]
+            return None
+
+    def __init__(self, items: list[HoverItem] | None = None):
+        self._lines: dict[int, HoverIndex.Line] = {}
+        for item in items or []:
+            self.add(item)
+
+    def add(self, item: HoverItem):
+        """
+        Adds an item and all items nested in it (generic parameters and namespace children) to the index.
+        """
+        if item.identifier_position and item.identifier_position.start:
+            line = item.identifier_position.start.line
+            if line not in self._lines:
+                self._lines[line] = HoverIndex.Line()
+            self._lines[line].insert(item.identifier_position.start.col, item.identifier_position.end.col, item)
+            if isinstance(item, TypeReference):
+                for parameter_ref in item.parameters:
+                    self.add(parameter_ref)
+            elif isinstance(item, Namespace):
+                for child in item.children:
+                    self.add(child)
 
-    def cache_ref(ref: TypeReference | FileReference | BaseField | Namespace | BaseType):
-        if ref.identifier_position and ref.identifier_position.start:
-            if not cache.get(ref.identifier_position.start.line):
-                cache[ref.identifier_position.start.line] = {}
-            for i in range(ref.identifier_position.start.col, ref.identifier_position.end.col):
-                cache[ref.identifier_position.start.line][i] = ref
-            if isinstance(ref, TypeReference):
-                for parameter_ref in ref.parameters:
-                    cache_ref(parameter_ref)
-            elif isinstance(ref, Namespace):
-                for child in ref.children:
-                    cache_ref(child)
+    def replace(self, items: list[HoverItem]):
+        """
+        Replaces all items of the index, e.g. after the document has been validated again. The new index is built
+        before it is swapped in, so that lookups never observe a partially built index.
+        """
+        self._lines = HoverIndex(items)._lines
 
-    for ref in items:
-        cache_ref(ref)
-    return cache
+    def get(self, line: int, col: int) -> HoverItem | None:
+        indexed_line = self._lines.get(line)
+        return indexed_line.get(col) if indexed_line else None
 
 
 def type_range(definition: BaseField | BaseExternalType | Namespace | TypeReference | ApplicationException) -> Range:
@@ -0,0 +1,55 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Awaitable, Callable
+
+
+class ValidationScheduler:
+    """
+    Schedules the validation of documents, at most one per document at a time.
+
+    Scheduling a validation cancels the pending or running validation of the same document. Validations can be delayed,
+    so that a quick series of edits only results in one validation once the user stops typing.
+    """
+
+    def __init__(self):
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def schedule(self, uri: str, validation: Callable[[], Awaitable[None]], delay: float = 0.0) -> asyncio.Task:
+        """
+        Args:
+            uri: the document that should be validated
+            validation: coroutine function that validates the document and publishes the results
+            delay: time in seconds to wait before the validation is started
+
+        Returns:
+            the task that runs the validation
+        """
+        self.cancel(uri)
+        task = asyncio.create_task(self._run(validation, delay))
+        self._tasks[uri] = task
+        task.add_done_callback(lambda done: self._tasks.pop(uri) if self._tasks.get(uri) is done else None)
+        return task
+
+    def cancel(self, uri: str):
+        task = self._tasks.get(uri)
+        if task:
+            task.cancel()
+
+    @staticmethod
+    async def _run(validation: Callable[[], Awaitable[None]], delay: float):
+        if delay:
+            await asyncio.sleep(delay)
+        await validation()
@@ -0,0 +1,68 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+from pydjinni.position import Position, Cursor
+from pydjinni_language_server.util import HoverIndex
+
+
+def given_item(line: int, start: int, end: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        identifier_position=Position(start=Cursor(line=line, col=start), end=Cursor(line=line, col=end))
+    )
+
+
+def test_hover_index_lookup():
+    # GIVEN an index with multiple items on the same line
+    foo = given_item(line=1, start=0, end=3)
+    bar = given_item(line=1, start=10, end=13)
+    index = HoverIndex([bar, foo])
+
+    # WHEN looking up positions
+    # THEN the item that covers the position should be returned
+    assert index.get(1, 0) is foo
+    assert index.get(1, 2) is foo
+    assert index.get(1, 12) is bar
+
+    # THEN positions that are not covered by any item should return nothing
+    assert index.get(1, 3) is None
+    assert index.get(1, 9) is None
+    assert index.get(1, 13) is None
+    assert index.get(0, 1) is None
+
+
+def test_hover_index_overlapping_items():
+    # GIVEN an item that contains a nested item that is added later
+    outer = given_item(line=0, start=0, end=10)
+    inner = given_item(line=0, start=4, end=6)
+    index = HoverIndex([outer, inner])
+
+    # WHEN looking up positions
+    # THEN the nested item should take precedence, the outer item should still cover the remaining columns
+    assert [index.get(0, col) for col in range(0, 11)] == [outer] * 4 + [inner] * 2 + [outer] * 4 + [None]
+
+
+def test_hover_index_replace():
+    # GIVEN an index with an item
+    foo = given_item(line=1, start=0, end=3)
+    index = HoverIndex([foo])
+
+    # WHEN replacing the content of the index
+    bar = given_item(line=2, start=0, end=3)
+    index.replace([bar])
+
+    # THEN only the new items should be found
+    assert index.get(1, 1) is None
+    assert index.get(2, 1) is bar
@@ -0,0 +1,44 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from pytest_lsp import LanguageClient
+from lsprotocol.types import *
+from test_language_server import (
+    assert_diagnostics,
+    when_did_open,
+    client,
+)
+
+
+async def test_validation_of_rapid_changes(client: LanguageClient, tmp_path: Path):
+    # GIVEN an opened document
+    uri = (tmp_path / "record.pydjinni").as_uri()
+    await when_did_open(client, uri, "foo = record { a: i8; }")
+    await assert_diagnostics(client, uri, [])
+
+    # WHEN the document is changed multiple times in quick succession
+    for version, text in enumerate(["foo = record { a: i8 }", "foo = record { a: i }", "foo = record { a: i16 }"], 2):
+        client.text_document_did_change(
+            DidChangeTextDocumentParams(
+                text_document=VersionedTextDocumentIdentifier(uri=uri, version=version),
+                content_changes=[TextDocumentContentChangeEvent_Type2(text=text)],
+            )
+        )
+
+    # THEN the diagnostics should only be published for the latest version
+    diagnostics = await client.wait_for_notification(TEXT_DOCUMENT_PUBLISH_DIAGNOSTICS)
+    assert diagnostics.version == 4
+    assert len(diagnostics.diagnostics) == 1
+    assert "IDL Parsing error: missing ';' at '}'" in diagnostics.diagnostics[0].message
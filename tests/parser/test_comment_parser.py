@@ -11,11 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import pickle
 from pathlib import Path
 from textwrap import dedent
+from unittest.mock import patch
 
+from pydjinni.parser.ast import Record
 from pydjinni.parser.base_models import TypeReference, CommentTypeReference
-from pydjinni.parser.markdown_parser import MarkdownParser
+from pydjinni.parser.markdown_parser import CommentCommands, DeferredComment, MarkdownParser
 from pydjinni.position import Position, Cursor
 
 
@@ -82,3 +85,66 @@ def test_markdown_plugins():
     assert len(type_references) == 2
     assert type_references[0].name == "baz"
     assert type_references[1].name == "type_reference"
+
+
+def test_comment_commands_scan():
+    # GIVEN a comment with semantic commands, including commands in a code block and in the text of other commands
+    comment = dedent(
+        """
+        hello world
+        @param foo bar
+        continued
+        @param bar
+        @deprecated because
+        of something
+
+        ```
+        @deprecated in code
+        @param foo in code
+        ```
+        @returns the result and not a \\deprecated command
+        """
+    )
+
+    # WHEN scanning the comment for commands
+    commands = CommentCommands.scan(comment)
+
+    # THEN the description of each parameter should be extracted
+    assert commands.params == {"foo": "bar\ncontinued", "bar": ""}
+
+    # THEN the last deprecation outside of code and other commands should be extracted
+    assert commands.deprecated == "because\nof something"
+
+    # THEN a deprecation without reason should be reported as `True`
+    assert CommentCommands.scan("@deprecated").deprecated is True
+    assert CommentCommands.scan("hello world").deprecated is False
+
+
+def test_comment_parsing_is_deferred():
+    # GIVEN a Markdown parser instance
+    type_references: list[TypeReference] = []
+    parser = MarkdownParser(type_references)
+    position = Position(start=Cursor(line=0, col=0), end=Cursor(line=1, col=11), file=Path("test.pydjinni"))
+
+    # WHEN parsing comments with and without type references
+    with patch.object(MarkdownParser, "parse", autospec=True, side_effect=MarkdownParser.parse) as parse_mock:
+        plain = parser.parse_deferred("hello *world*", namespace=[], position=position)
+        referencing = parser.parse_deferred("hello ``world``", namespace=[], position=position)
+
+        # THEN only the comment with type references should be parsed immediately
+        assert isinstance(plain, DeferredComment)
+        assert not isinstance(referencing, DeferredComment)
+        assert parse_mock.call_count == 1
+        assert len(type_references) == 1
+
+        # WHEN the tokens of the deferred comment are requested by a consumer
+        record = Record(name="foo", namespace=[], position=position, fields=[])
+        record._parsed_comment = pickle.loads(pickle.dumps(plain))
+        tokens, _ = record._parsed_comment
+        tokens_again, _ = record._parsed_comment
+
+    # THEN the comment should be parsed exactly once
+    assert parse_mock.call_count == 2
+    assert tokens is tokens_again
+    assert tokens[0]["children"][1]["type"] == "emphasis"
+    assert len(type_references) == 1
@@ -0,0 +1,150 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pydjinni import API
+from pydjinni.config.types import ParserEngine
+from pydjinni.parser.fast_parser import FastParser
+from pydjinni.parser.grammar.IdlParser import IdlParser
+from pydjinni.parser.parser import Parser
+
+INTEGRATION_TESTS = Path(__file__).parents[2] / "src" / "pydjinni" / "generator" / "it"
+
+IDL_INPUTS = [
+    """
+    # Documented enum
+    foo = enum {
+        # first item
+        # with two comment lines
+        a;
+        b;
+    }
+    bar = flags { a; b; all = all; none = none; invalid = foo; }
+    """,
+    """
+    @extern "missing.yaml"
+    namespace a.b {
+        # [foo]
+        foo = record +cpp -java {
+            a: i8?;
+            b: list<map<string, .a.b.bar>>;
+            c: (x: i8) -> bool;
+        } deriving (eq, ord, unknown)
+        bar = record {}
+    }
+    namespace c { namespace d {} }
+    """,
+    """
+    foo = interface +cpp {
+        static const method(a: i8, b: list<i32>) throws err, .other.err -> string;
+        async other();
+        property prop: f32;
+        callback(cb: function +cpp (a: i8) throws err -> i8, b: (c: i8) throws err, other_err, d: i32);
+    }
+    err = error {
+        simple;
+        # with parameters
+        complex(a: i32 b: string);
+    }
+    bar = main interface -java { bar(); }
+    named = function +unknown (a: binary) throws err -> (b: i8) -> i8;
+    anonymous = () throws;
+    """,
+    # function types in `throws` lists are ambiguous and left to the ANTLR parser
+    "foo = () throws () throws a, b, c;",
+    # syntax errors
+    """
+    foo = record {
+        a: i8
+    }
+    # @deprecated
+    bar = interface {
+    """,
+    "foo = enum { a b; }",
+    "foo = record { a: i8; } \n @import \"late.pydjinni\"",
+    "namespace foo..bar {}",
+    "foo = record { a: 8i; }",
+    "foo = record { a: i8; } ##",
+    "****",
+]
+
+
+def when_parsing(tmp_path: Path, idl: Path, engine: ParserEngine) -> tuple[list, list, list, list]:
+    api = API().configure(options={"generate": {"parser_engine": engine, "cpp": {"out": tmp_path / "out"}}})
+    try:
+        context = api.parse(idl, use_cache=False)
+        return context.ast, context.type_refs, context.fields, []
+    except Parser.ParsingExceptionList as e:
+        return e.ast, e.type_refs, e.fields, [(error.description, error.position) for error in e.items]
+
+
+def assert_same_result(tmp_path: Path, idl: Path):
+    # WHEN parsing the input with both engines
+    antlr_result = when_parsing(tmp_path, idl, ParserEngine.antlr)
+    fast_result = when_parsing(tmp_path, idl, ParserEngine.fast)
+
+    # THEN the AST, the type references, the fields and all errors should be identical, including all positions
+    for antlr, fast in zip(antlr_result, fast_result):
+        assert repr(fast) == repr(antlr)
+
+
+@pytest.mark.parametrize("input_idl", IDL_INPUTS)
+def test_fast_parser_matches_antlr(tmp_path: Path, input_idl: str):
+    # GIVEN an input file
+    idl = tmp_path / "input.pydjinni"
+    idl.write_text(input_idl)
+
+    assert_same_result(tmp_path, idl)
+
+
+@pytest.mark.parametrize("idl", sorted(INTEGRATION_TESTS.glob("*/*.pydjinni")), ids=lambda idl: idl.name)
+def test_fast_parser_matches_antlr_on_integration_tests(tmp_path: Path, idl: Path):
+    assert_same_result(tmp_path, idl)
+
+
+def test_fast_parser_falls_back_to_antlr(tmp_path: Path):
+    # GIVEN a valid and an invalid input file
+    valid = tmp_path / "valid.pydjinni"
+    valid.write_text("foo = record { a: i8; }")
+    invalid = tmp_path / "invalid.pydjinni"
+    invalid.write_text("foo = record { a: i8 }")
+
+    with patch.object(IdlParser, "idl", autospec=True, side_effect=IdlParser.idl) as idl_mock:
+        # WHEN parsing the valid input with the fast engine
+        when_parsing(tmp_path, valid, ParserEngine.fast)
+
+        # THEN the ANTLR parser should not be used
+        idl_mock.assert_not_called()
+
+        # WHEN parsing the invalid input with the fast engine
+        _, _, _, errors = when_parsing(tmp_path, invalid, ParserEngine.fast)
+
+    # THEN the input should be parsed again by the ANTLR parser, which reports the syntax error
+    idl_mock.assert_called()
+    assert len(errors) == 1
+    assert errors[0][0].startswith("missing ';' at '}'")
+
+
+def test_fast_parser_unexpected_token():
+    # WHEN parsing invalid input
+    # THEN the position of the first unexpected token should be reported
+    with pytest.raises(FastParser.UnexpectedToken) as excinfo:
+        FastParser("foo = record {\n    a: i8\n}").parse()
+    assert excinfo.value.token.text == "}"
+    assert excinfo.value.token.line == 3
+    assert excinfo.value.token.column == 0
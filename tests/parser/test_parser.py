@@ -14,7 +14,7 @@
 import uuid
 from pathlib import Path
 from typing import TypeVar
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -23,6 +23,7 @@ from pydjinni.file.file_reader_writer import FileReaderWriter
 from pydjinni.file.processed_files_model_builder import ProcessedFiles
 from pydjinni.parser.ast import Record
 from pydjinni.parser.base_models import BaseType, BaseExternalType, DataField
+from pydjinni.parser.grammar.IdlParser import IdlParser
 from pydjinni.parser.parser import Parser
 from pydjinni.parser.resolver import Resolver
 
@@ -160,6 +161,44 @@ def test_import(tmp_path: Path):
     assert_field(fields[0], name="bar", typename="i8")
 
 
+def test_diamond_import(tmp_path: Path):
+    # GIVEN an idl file that imports two files which both import the same file
+    parser, _ = given(
+        tmp_path=tmp_path,
+        input_idl="""
+                @import "foo.pydjinni"
+                @import "bar.pydjinni"
+                """,
+    )
+    (tmp_path / "foo.pydjinni").write_text(
+        """
+        @import "common.pydjinni"
+        foo = record { common: common; }
+        """
+    )
+    (tmp_path / "bar.pydjinni").write_text(
+        """
+        @import "common.pydjinni"
+        bar = record { common: common; }
+        """
+    )
+    common_file = tmp_path / "common.pydjinni"
+    common_file.write_text(
+        """
+        common = record { value: i8; }
+        """
+    )
+
+    # WHEN parsing the input file
+    type_decls, _, _, _, _ = parser.parse()
+
+    # THEN every type should be included exactly once
+    assert [type_decl.name for type_decl in type_decls] == ["common", "foo", "bar"]
+
+    # THEN the commonly imported file should only have been parsed once
+    assert parser.file_reader.processed_files.parsed.idl.count(common_file) == 1
+
+
 def test_missing_import(tmp_path: Path):
     # GIVEN an idl file that imports another idl file that does not exist
     parser, _ = given(
@@ -318,9 +357,12 @@ def test_namespace(tmp_path: Path):
     # THEN the type_defs should contain two types each labelled with their respective namespace
     assert len(defs) == 2
     assert defs[0].name == "foo"
-    assert defs[0].namespace == ["foo", "bar"]
+    assert defs[0].namespace == ("foo", "bar")
     assert defs[1].name == "bar"
-    assert defs[1].namespace == ["foo", "bar", "baz"]
+    assert defs[1].namespace == ("foo", "bar", "baz")
+
+    # THEN types in the same namespace should share the namespace
+    assert defs[0].namespace is BaseType(name="baz", namespace=["foo", "bar"]).namespace
 
     # THEN the ast should contain two nested namespaces
     assert len(ast) == 1
@@ -415,3 +457,25 @@ def test_multiple_errors(tmp_path: Path):
     bar_type = excinfo.value.type_defs[1]
     assert bar_type.name == "bar"
     assert bar_type.deprecated
+
+
+def test_parsing_falls_back_to_ll_prediction(tmp_path: Path):
+    # GIVEN a valid and an invalid input file
+    valid_parser, _ = given(tmp_path=tmp_path, input_idl="foo = record { a: i8; }")
+    invalid_parser, _ = given(tmp_path=tmp_path, input_idl="foo = record { a: i8 }")
+
+    with patch.object(IdlParser, "idl", autospec=True, side_effect=IdlParser.idl) as idl_mock:
+        # WHEN parsing the valid input
+        valid_parser.parse()
+
+        # THEN the input should only be parsed once, with SLL prediction
+        assert idl_mock.call_count == 1
+
+        # WHEN parsing the invalid input
+        with pytest.raises(Parser.ParsingExceptionList) as excinfo:
+            invalid_parser.parse()
+
+    # THEN the input should be parsed again with LL prediction, reporting the syntax error only once
+    assert idl_mock.call_count == 3
+    assert len(excinfo.value.items) == 1
+    assert excinfo.value.items[0].description.startswith("missing ';' at '}'")
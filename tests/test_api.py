@@ -13,8 +13,12 @@
 # limitations under the License.
 
 import json
+import os
+import subprocess
+import sys
 import uuid
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 import tomli_w
@@ -22,6 +26,7 @@ import yaml
 
 from pydjinni import API
 from pydjinni.exceptions import ConfigurationException, FileNotFoundException
+from pydjinni.parser.parser import Parser
 
 
 def given(tmp_path: Path, config: dict, input_idl: str) -> tuple[API.ConfiguredContext, Path]:
@@ -73,6 +78,229 @@ def test_API_generate(tmp_path: Path):
     assert str(input_file) in processed_files['parsed']['idl']
 
 
+def test_API_generate_multiple_idl_files(tmp_path: Path):
+    list_processed_files = tmp_path / 'processed-files.yaml'
+    cpp_out = tmp_path / 'out'
+
+    # GIVEN an API with a configuration
+    api = API().configure(options={
+        'generate': {
+            'list_processed_files': list_processed_files,
+            'cpp': {
+                'out': cpp_out
+            }
+        }
+    })
+
+    # AND GIVEN multiple IDL files that share a common import
+    common_file = tmp_path / "common.djinni"
+    common_file.write_text("common = enum { a; }")
+    foo_file = tmp_path / "foo.djinni"
+    foo_file.write_text('@import "common.djinni"\nfoo = record { common: common; }')
+    bar_file = tmp_path / "sub" / "bar.djinni"
+    bar_file.parent.mkdir()
+    bar_file.write_text('@import "../common.djinni"\nbar = record { common: common; }')
+
+    # WHEN parsing all IDL files at once and generating output
+    context = api.parse([foo_file, bar_file, common_file]).generate("cpp")
+    context.write_processed_files()
+
+    # THEN the shared import should only have been parsed once
+    processed_files = yaml.safe_load(list_processed_files.read_text())
+    assert processed_files['parsed']['idl'] == [str(foo_file), str(common_file), str(bar_file)]
+
+    # THEN each type should be contained in the result once
+    assert [type_def.name for type_def in context.type_defs] == ["common", "foo", "bar"]
+
+    # THEN the output of all IDL files should be reported
+    for name in ["common", "foo", "bar"]:
+        assert str(cpp_out / f"{name}.hpp") in processed_files['generated']['cpp']['header']
+
+
+def test_API_parse_multiple_idl_files_without_import(tmp_path: Path):
+    # GIVEN an API with a configuration
+    api = API().configure(options={'generate': {}})
+
+    # AND GIVEN an IDL file that uses a type of another IDL file without importing it
+    a_file = tmp_path / "a.djinni"
+    a_file.write_text("foo = enum { a; }")
+    b_file = tmp_path / "b.djinni"
+    b_file.write_text("bar = record { foo: foo; }")
+
+    # WHEN parsing both IDL files at once
+    # THEN the type should not be resolved from the other IDL file
+    with pytest.raises(Parser.ParsingExceptionList) as excinfo:
+        api.parse([a_file, b_file])
+    assert len(excinfo.value.items) == 1
+    error = excinfo.value.items[0]
+    assert error.description == "Unknown type 'foo'"
+    assert error.position.file == b_file
+
+
+def given_import_cache(tmp_path: Path) -> tuple[API.ConfiguredContext, Parser.ImportCache, Path, Path, Path]:
+    # GIVEN an API without any configured target
+    api = API().configure(options={'generate': {}})
+
+    # AND GIVEN an IDL file that imports another IDL file and an external type
+    imported_file = tmp_path / "imported.djinni"
+    imported_file.write_text("imported = enum { a; }")
+    extern_file = tmp_path / "extern.yaml"
+    extern_file.write_text(yaml.dump({'name': 'external', 'primitive': 'record'}))
+    input_file = tmp_path / "input.djinni"
+    input_file.write_text(
+        '@import "imported.djinni"\n@extern "extern.yaml"\nfoo = record { a: imported; b: external; }'
+    )
+
+    # AND GIVEN an import cache that has been populated by a previous parse run
+    import_cache = Parser.ImportCache()
+    api.parse(input_file, import_cache=import_cache)
+    return api, import_cache, input_file, imported_file, extern_file
+
+
+def test_API_parse_reuses_unchanged_imports(tmp_path: Path):
+    api, import_cache, input_file, imported_file, _ = given_import_cache(tmp_path)
+    imported_type = import_cache.entries[imported_file].declared_types[0]
+
+    # WHEN parsing the input again
+    with patch.object(Parser, "_analyze", autospec=True, side_effect=Parser._analyze) as analyze_mock:
+        context = api.parse(input_file, import_cache=import_cache)
+
+    # THEN only the input file itself should have been analyzed again
+    assert [call.args[0].idl for call in analyze_mock.call_args_list] == [input_file]
+
+    # THEN the references should be resolved to the previously parsed types
+    fields = context.type_defs[-1].fields
+    assert fields[0].type_ref.type_def is imported_type
+    assert fields[1].type_ref.type_def.name == "external"
+    assert api.resolver.registry["imported"] is imported_type
+
+
+@pytest.mark.parametrize("changed_file", ["imported.djinni", "extern.yaml"])
+def test_API_parse_reparses_changed_imports(tmp_path: Path, changed_file: str):
+    api, import_cache, input_file, imported_file, extern_file = given_import_cache(tmp_path)
+
+    # WHEN one of the loaded files changes
+    if changed_file == "imported.djinni":
+        imported_file.write_text("imported = flags { a; }")
+    else:
+        extern_file.write_text(yaml.dump({'name': 'external', 'primitive': 'enum'}))
+    os.utime(tmp_path / changed_file, ns=(0, 0))
+    context = api.parse(input_file, import_cache=import_cache)
+
+    # THEN the changes should be reflected in the result
+    fields = context.type_defs[-1].fields
+    assert fields[0].type_ref.type_def.primitive == ("flags" if changed_file == "imported.djinni" else "enum")
+    assert fields[1].type_ref.type_def.primitive == ("record" if changed_file == "imported.djinni" else "enum")
+
+
+def test_API_configure_only_imports_configured_targets(tmp_path: Path):
+    # GIVEN a fresh interpreter that loads the CLI and configures the cpp target only
+    script = f"""
+import sys
+import pydjinni.cli.cli
+from pydjinni import API
+API().configure(options={{"generate": {{"cpp": {{"out": {str(tmp_path)!r}}}}}}})
+print(",".join(sorted(sys.modules)))
+"""
+
+    # WHEN running the script
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, env={
+        key: value for key, value in os.environ.items() if not key.lower().startswith("pydjinni__")
+    })
+    modules = set(result.stdout.strip().split(","))
+
+    # THEN the configured target should have been loaded
+    assert "pydjinni.generator.cpp.cpp.generator" in modules
+
+    # AND THEN no other plugin, nor the dependencies that are only needed later, should have been imported
+    for module in [
+        "pydjinni.generator.java", "pydjinni.generator.objc", "pydjinni.generator.cppcli",
+        "pydjinni.packaging.swiftpackage", "pydjinni.packaging.aar", "pydjinni.packaging.nuget",
+        "pydjinni_language_server", "pygls", "mistune"
+    ]:
+        assert module not in modules
+
+
+def test_API_interface_default_targets_exclude_internal_targets(tmp_path: Path):
+    # GIVEN an API that is configured for the cpp target only
+    api, input_file = given(
+        tmp_path=tmp_path,
+        config={'generate': {'cpp': {'out': tmp_path / 'out'}}},
+        input_idl="""
+        foo = interface {}
+        bar = interface -yaml {}
+        """
+    )
+
+    # WHEN parsing interfaces with default targets and with an internal target excluded
+    foo, bar = api.parse(input_file).type_defs
+
+    # THEN the default targets should contain all language targets, but not the unconfigured yaml target
+    assert sorted(foo.targets) == ["cpp", "cppcli", "java", "objc"]
+
+    # AND THEN excluding the internal target should not change the targets
+    assert bar.targets == foo.targets
+
+
+def test_API_internal_target_flag_read_once():
+    # GIVEN an API without any loaded target
+    targets = API().generation_targets
+
+    # WHEN asking multiple times whether the targets are internal
+    plugins = {key: Mock(wraps=plugin) for key, plugin in targets._plugins.items()}
+    with patch.dict(targets._plugins, plugins):
+        internal = {key: targets.internal(key) for key in targets}
+        internal_again = {key: targets.internal(key) for key in targets}
+
+    # THEN only the yaml target should be internal
+    assert [key for key, value in internal.items() if value] == ["yaml"]
+    assert internal_again == internal
+
+    # AND THEN the class of each plugin should only have been loaded once, without initializing the plugin
+    for plugin in plugins.values():
+        plugin.load.assert_called_once()
+    assert targets.loaded == ()
+
+def test_API_configuration_model_loads_all_targets():
+    # GIVEN an API
+    api = API()
+
+    # WHEN requesting the configuration model
+    model = api.configuration_model
+
+    # THEN all available targets should have been loaded
+    assert set(api.generation_targets.loaded) == set(api.generation_targets)
+    assert set(api.package_targets.loaded) == set(api.package_targets)
+
+    # AND THEN the model should cover their configuration
+    generate_model = model.model_fields["generate"].annotation.__args__[0]
+    assert {"cpp", "java", "objc", "cppcli", "yaml"} <= set(generate_model.model_fields)
+
+
+def test_API_parse_reuses_metadata_model(tmp_path: Path):
+    # GIVEN an API with a configuration for the java target
+    api, input_file = given(
+        tmp_path=tmp_path,
+        config={'generate': {
+            'java': {'out': tmp_path / 'java', 'package': ['foo', 'bar']},
+            'jni': {'out': tmp_path / 'jni', 'namespace': 'foo::jni'}
+        }},
+        input_idl="foo = enum { bar; }"
+    )
+    generator = api._generate_targets["java"].generator_instances[0]
+
+    # WHEN parsing the input twice
+    api.parse(input_file)
+    first_metadata = generator.metadata
+    api.parse(input_file)
+
+    # THEN the metadata model should have been reused
+    assert type(generator.metadata) is type(first_metadata)
+
+    # AND THEN the metadata should have been derived from the configuration
+    assert generator.metadata.java.base_package == "foo.bar"
+
+
 def test_API_no_config():
     # WHEN giving no configuration
     # THEN a ConfigurationException should be raised
@@ -39,3 +39,27 @@ def test_add_generator_config():
     assert 'name' in config_model.model_fields['generate'].annotation.__args__[0].model_fields
     assert config_model.model_fields['generate'].annotation.__args__[0].model_fields['name'].annotation == GeneratorConfig
 
+
+
+def test_build_reuses_model():
+    # GIVEN a pydantic model
+    class GeneratorConfig(BaseModel):
+        """foo"""
+        foo: int = 1
+
+    # AND GIVEN two ConfigModelBuilders with the same generator config
+    builders = [ConfigModelBuilder(), ConfigModelBuilder()]
+    for builder in builders:
+        builder.add_generator_config("name", GeneratorConfig)
+
+    # WHEN building the config models
+    config_models = [builder.build() for builder in builders]
+
+    # THEN the same model should have been returned
+    assert config_models[0] is config_models[1]
+
+    # WHEN adding another generator config
+    builders[1].add_generator_config("other", GeneratorConfig)
+
+    # THEN a new model should be built
+    assert builders[1].build() is not config_models[0]
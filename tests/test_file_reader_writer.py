@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -212,3 +213,79 @@ def test_configure_include_dir():
 
     # THEN the processed files output should report the configured include directory
     assert writer.processed_files.generated.foo.include_dir == include_dir
+
+
+def test_write_if_changed(tmp_path: Path):
+    writer = given()
+
+    # AND GIVEN that write-if-changed mode is enabled
+    writer.setup_write_if_changed(True)
+
+    # AND GIVEN an existing file with the same content
+    existing_file_path = tmp_path / "foo.hpp"
+    existing_file_path.write_text("header")
+    os.utime(existing_file_path, (0, 0))
+
+    # AND GIVEN an existing file with different content
+    changed_file_path = tmp_path / "foo.cpp"
+    changed_file_path.write_text("old source")
+    os.utime(changed_file_path, (0, 0))
+
+    # WHEN writing the files
+    writer.write_header(key="foo", filename=existing_file_path, content="header")
+    writer.write_source(key="foo", filename=changed_file_path, content="source")
+
+    # THEN the unchanged file should not have been touched
+    assert existing_file_path.stat().st_mtime == 0
+
+    # THEN the changed file should have been written
+    assert changed_file_path.stat().st_mtime != 0
+    assert changed_file_path.read_text() == "source"
+
+    # THEN both files should be reported as generated
+    assert_generated_files(writer, foo_header=1, foo_source=1)
+
+    # THEN the processed files should report which files have been written
+    assert writer.processed_files.written == [changed_file_path]
+    assert writer.processed_files.unchanged == [existing_file_path]
+
+
+def test_copy_if_changed(tmp_path: Path):
+    writer = given()
+
+    # AND GIVEN that write-if-changed mode is enabled
+    writer.setup_write_if_changed(True)
+
+    # AND GIVEN a source directory that has already been copied before
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    (source_dir / "source.cpp").write_text("source")
+    target_file = tmp_path / "target" / "source.cpp"
+    target_file.parent.mkdir()
+    target_file.write_text("source")
+    os.utime(target_file, (0, 0))
+
+    # WHEN copying the source directory again
+    writer.copy_source_directory(key="foo", source_dir=source_dir, target_dir=tmp_path / "target")
+
+    # THEN the target file should not have been touched
+    assert target_file.stat().st_mtime == 0
+    assert_generated_files(writer, foo_source=1)
+    assert writer.processed_files.unchanged == [target_file]
+
+
+def test_write_unchanged_without_write_if_changed(tmp_path: Path):
+    writer = given()
+
+    # AND GIVEN an existing file
+    existing_file_path = tmp_path / "foo.hpp"
+    existing_file_path.write_text("header")
+    os.utime(existing_file_path, (0, 0))
+
+    # WHEN writing the same content without write-if-changed mode
+    writer.write_header(key="foo", filename=existing_file_path, content="header")
+
+    # THEN the file should have been written anyway
+    assert existing_file_path.stat().st_mtime != 0
+    assert writer.processed_files.written == [existing_file_path]
+    assert writer.processed_files.unchanged == []
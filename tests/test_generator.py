@@ -0,0 +1,415 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import json
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pydjinni import API
+from pydjinni.exceptions import ConfigurationException
+from pydjinni.generator.cpp.cpp.config import CppConfig
+from pydjinni.generator.generator import Generator
+from pydjinni.generator.type_specifiers import TypeSpecifierCache
+from pydjinni.parser.ast import Enum, Record
+from pydjinni.profiler import Profiler
+
+
+def given(
+        tmp_path: Path,
+        cache_dir: Path | None = None,
+        incremental: bool = False,
+        idl: str = """
+        foo = enum { a; }
+        bar = enum { b; }
+        baz = enum { c; }
+        """
+) -> tuple[API.ConfiguredContext, Path]:
+    # GIVEN an API configured for the cpp target
+    config = {"generate": {"cpp": {"out": tmp_path / "out"}}}
+    if cache_dir:
+        config["generate"]["cache_dir"] = cache_dir
+    if incremental:
+        config["generate"]["incremental"] = True
+    context = API().configure(options=config)
+
+    # AND GIVEN an input file with multiple types that use the same template
+    input_file = tmp_path / "input.djinni"
+    input_file.write_text(idl)
+    return context, input_file
+
+
+def cpp_generator(context: API.ConfiguredContext) -> Generator:
+    return next(
+        generator
+        for target in context.configured_targets
+        for generator in target.generator_instances
+        if generator.key == "cpp"
+    )
+
+
+def test_template_compiled_once(tmp_path: Path):
+    context, input_file = given(tmp_path)
+    generator = cpp_generator(context)
+
+    # WHEN generating output for multiple types of the same kind
+    with patch.object(generator._jinja_env, "compile", wraps=generator._jinja_env.compile) as compile_mock:
+        context.parse(input_file).generate("cpp")
+
+    # THEN each template should only have been compiled once
+    compiled_templates = [call.args[1] for call in compile_mock.call_args_list]
+    assert compiled_templates.count("header/enum.jinja2.hpp") == 1
+    assert compiled_templates.count("source/enum.jinja2.cpp") == 1
+
+    # THEN all types should have been generated
+    for name in ["foo", "bar", "baz"]:
+        assert (tmp_path / "out" / f"{name}.hpp").exists()
+
+
+def test_template_bytecode_cache(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+
+    # GIVEN a previous generation run with a configured cache directory
+    context, input_file = given(tmp_path, cache_dir)
+    context.parse(input_file).generate("cpp")
+    expected_output = (tmp_path / "out" / "foo.hpp").read_text()
+
+    # THEN the compiled templates should have been persisted
+    assert any((cache_dir / "templates" / "cpp").iterdir())
+
+    # WHEN generating again with a fresh API instance
+    context, input_file = given(tmp_path, cache_dir)
+    generator = cpp_generator(context)
+    with patch.object(generator._jinja_env, "compile", wraps=generator._jinja_env.compile) as compile_mock:
+        context.parse(input_file).generate("cpp")
+
+    # THEN the top-level templates should have been loaded from the bytecode cache
+    compiled_templates = [call.args[1] for call in compile_mock.call_args_list]
+    assert "header/enum.jinja2.hpp" not in compiled_templates
+
+    # THEN the output should be unchanged
+    assert (tmp_path / "out" / "foo.hpp").read_text() == expected_output
+
+
+def generated_types(generate_mock) -> list[str]:
+    return [call.args[0].name for call in generate_mock.call_args_list]
+
+
+def test_incremental_generation(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+
+    # GIVEN a previous incremental generation run
+    context, input_file = given(tmp_path, cache_dir, incremental=True)
+    context.parse(input_file).generate("cpp")
+
+    # WHEN generating again with unchanged input
+    context, input_file = given(tmp_path, cache_dir, incremental=True)
+    generator = cpp_generator(context)
+    with patch.object(generator, "generate_enum", wraps=generator.generate_enum) as generate_mock:
+        generate_context = context.parse(input_file).generate("cpp")
+
+    # THEN no type should have been rendered again
+    assert generated_types(generate_mock) == []
+
+    # THEN the outputs of all types should still be reported
+    processed_files = generate_context._file_reader_writer.processed_files
+    for name in ["foo", "bar", "baz"]:
+        assert tmp_path / "out" / f"{name}.hpp" in processed_files.generated.cpp.header
+        assert tmp_path / "out" / f"{name}.hpp" in processed_files.unchanged
+
+
+def test_incremental_generation_changed_dependency(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    idl = """
+    foo = enum { a; }
+    bar = record { foo: foo; }
+    baz = enum { c; }
+    """
+
+    # GIVEN a previous incremental generation run
+    context, input_file = given(tmp_path, cache_dir, incremental=True, idl=idl)
+    context.parse(input_file).generate("cpp")
+
+    # WHEN a type that another type depends on is changed
+    context, input_file = given(tmp_path, cache_dir, incremental=True, idl=idl.replace("a;", "a; b;"))
+    generator = cpp_generator(context)
+    with (
+        patch.object(generator, "generate_enum", wraps=generator.generate_enum) as generate_enum_mock,
+        patch.object(generator, "generate_record", wraps=generator.generate_record) as generate_record_mock,
+    ):
+        context.parse(input_file).generate("cpp")
+
+    # THEN the changed type and the dependent type should have been rendered again
+    assert generated_types(generate_enum_mock) == ["foo"]
+    assert generated_types(generate_record_mock) == ["bar"]
+    assert "A,\n    B" in (tmp_path / "out" / "foo.hpp").read_text()
+
+
+def test_incremental_generation_removed_type(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+
+    # GIVEN a previous incremental generation run
+    context, input_file = given(tmp_path, cache_dir, incremental=True)
+    context.parse(input_file).generate("cpp")
+    assert (tmp_path / "out" / "baz.hpp").exists()
+
+    # WHEN a type is removed from the input
+    context, input_file = given(tmp_path, cache_dir, incremental=True, idl="foo = enum { a; }\nbar = enum { b; }")
+    generate_context = context.parse(input_file).generate("cpp")
+
+    # THEN the outputs of the removed type should have been deleted
+    assert not (tmp_path / "out" / "baz.hpp").exists()
+    assert not (tmp_path / "out" / "baz.cpp").exists()
+    assert (tmp_path / "out" / "foo.hpp").exists()
+
+    # THEN the removed type should not be reported
+    processed_files = generate_context._file_reader_writer.processed_files
+    assert tmp_path / "out" / "baz.hpp" not in processed_files.generated.cpp.header
+
+
+def test_incremental_generation_shared_cache_dir(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+
+    def given_input(name: str) -> tuple[API.ConfiguredContext, Path]:
+        context = API().configure(options={"generate": {
+            "cpp": {"out": tmp_path / f"out_{name}"}, "cache_dir": cache_dir, "incremental": True
+        }})
+        input_file = tmp_path / f"{name}.djinni"
+        input_file.write_text(f"{name}_rec = record {{ a: i32; }}")
+        return context, input_file
+
+    # GIVEN an incremental generation run of an input file
+    context, input_file = given_input("a")
+    context.parse(input_file).generate("cpp")
+
+    # WHEN generating a different input file into a different output directory with the same cache directory
+    context, input_file = given_input("b")
+    context.parse(input_file).generate("cpp")
+
+    # THEN the outputs of the first run should have been kept
+    assert (tmp_path / "out_a" / "a_rec.hpp").exists()
+    assert (tmp_path / "out_b" / "b_rec.hpp").exists()
+
+
+def test_incremental_generation_keeps_files_outside_of_output_directories(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    unrelated_file = tmp_path / "unrelated.hpp"
+    unrelated_file.write_text("")
+
+    # GIVEN a previous incremental generation run with a manifest that records a file outside of the output directory
+    context, input_file = given(tmp_path, cache_dir, incremental=True)
+    context.parse(input_file).generate("cpp")
+    manifest_path, = (cache_dir / "manifest").glob("cpp-*.json")
+    manifest = json.loads(manifest_path.read_text())
+    manifest["types"]["unrelated"] = {"fingerprint": "", "outputs": [["header", str(unrelated_file)]]}
+    manifest_path.write_text(json.dumps(manifest))
+
+    # WHEN generating the input again
+    context, input_file = given(tmp_path, cache_dir, incremental=True)
+    context.parse(input_file).generate("cpp")
+
+    # THEN the file outside of the output directory should not have been deleted
+    assert unrelated_file.exists()
+
+def test_incremental_generation_removed_type_yaml(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    yaml_out = tmp_path / "yaml"
+
+    def given_yaml(idl: str, out_file: str | None = None) -> tuple[API.ConfiguredContext, Path]:
+        yaml_config = {"out": yaml_out} | ({"out_file": out_file} if out_file else {})
+        context = API().configure(options={"generate": {
+            "yaml": yaml_config, "cache_dir": cache_dir, "incremental": True
+        }})
+        input_file = tmp_path / "input.djinni"
+        input_file.write_text(idl)
+        return context, input_file
+
+    # GIVEN a previous incremental generation run of the yaml target
+    context, input_file = given_yaml("foo = enum { a; }\nbar = enum { b; }")
+    context.parse(input_file).generate("yaml")
+    assert (yaml_out / "bar.yaml").exists()
+
+    # WHEN a type is removed from the input
+    context, input_file = given_yaml("foo = enum { a; }")
+    context.parse(input_file).generate("yaml")
+
+    # THEN the output of the removed type should have been deleted
+    assert not (yaml_out / "bar.yaml").exists()
+    assert (yaml_out / "foo.yaml").exists()
+
+    # WHEN all types are merged into a single file
+    context, input_file = given_yaml("foo = enum { a; }", out_file="types.yaml")
+    context.parse(input_file).generate("yaml")
+
+    # THEN the outputs of the previous runs should have been deleted
+    assert not (yaml_out / "foo.yaml").exists()
+    assert (yaml_out / "types.yaml").exists()
+
+
+def test_incremental_generation_requires_cache_dir(tmp_path: Path):
+    context, input_file = given(tmp_path, incremental=True)
+
+    # WHEN parsing with incremental generation enabled but without a cache directory
+    # THEN a ConfigurationException should be raised
+    with pytest.raises(ConfigurationException):
+        context.parse(input_file)
+
+
+def test_parallel_generation(tmp_path: Path):
+    idl = "\n".join(f"enum{index} = enum {{ a; }}\nrecord{index} = record {{ e: enum{index}; }}" for index in range(10))
+
+    # GIVEN the output of a sequential generation run
+    (tmp_path / "sequential").mkdir()
+    context, input_file = given(tmp_path / "sequential", idl=idl)
+    sequential_context = context.parse(input_file).generate("cpp")
+
+    # WHEN generating the same input in parallel
+    (tmp_path / "parallel").mkdir()
+    context, input_file = given(tmp_path / "parallel", idl=idl)
+    generate_context = context.parse(input_file)
+    with Profiler() as profiler:
+        generate_context.generate("cpp", jobs=4)
+
+    # THEN the output should be identical to the sequential output
+    for sequential_file in (tmp_path / "sequential" / "out").glob("*.?pp"):
+        parallel_file = tmp_path / "parallel" / "out" / sequential_file.name
+        assert parallel_file.read_text() == sequential_file.read_text().replace("sequential", "parallel")
+
+    # THEN the generated files should be reported in the same order
+    def reported_files(processed_files, directory: str) -> list[str]:
+        return [file.name for file in processed_files.generated.cpp.header if directory in file.parts]
+
+    sequential_files = sequential_context._file_reader_writer.processed_files
+    parallel_files = generate_context._file_reader_writer.processed_files
+    assert reported_files(parallel_files, "parallel") == reported_files(sequential_files, "sequential")
+
+    # THEN the rendering of the worker threads should have been recorded
+    render_threads = {span.thread for span in profiler.spans if span.category == "render"}
+    assert render_threads and threading.main_thread().ident not in render_threads
+    assert profiler.counters[("type specifiers", "cpp")]["misses"] > 0
+
+
+def test_parallel_generation_error(tmp_path: Path):
+    context, input_file = given(tmp_path, idl="foo = enum { a; }\nbar = record { a: i32; }\nbaz = enum { c; }")
+    generator = cpp_generator(context)
+
+    # GIVEN a generator that fails to render a type
+    def generate_record(type_def):
+        raise Generator.GenerationException(type_def, "failed")
+
+    # WHEN generating the types in parallel
+    # THEN the original exception should be raised
+    with patch.object(generator, "generate_record", generate_record):
+        with pytest.raises(Generator.GenerationException) as excinfo:
+            context.parse(input_file).generate("cpp", jobs=2)
+    assert excinfo.value.input_def.name == "bar"
+
+
+def test_registered_generate_handler(tmp_path: Path):
+    context, input_file = given(tmp_path, idl="foo = enum { a; }\nbar = record { a: i32; }")
+    generator = cpp_generator(context)
+    generator_class = type(generator)
+    generated = []
+
+    # GIVEN a handler that is registered for records
+    with patch.dict(generator_class._generate_handlers):
+        generator_class.register_generate_handler(Record, lambda _, type_def: generated.append(type_def.name))
+        try:
+            # WHEN generating the types
+            context.parse(input_file).generate("cpp")
+
+            # THEN the resolved handlers should be cached in the dispatch tables of the generator
+            assert generator._generate_dispatch[Enum] == "generate_enum"
+            assert generator._marshal_dispatch[Record] is generator.marshal_models[Record]
+        finally:
+            generator_class._clear_dispatch_tables()
+
+    # THEN the registered handler should have been used instead of the `generate_record` method
+    assert generated == ["bar"]
+    assert not (tmp_path / "out" / "bar.hpp").exists()
+    assert (tmp_path / "out" / "foo.hpp").exists()
+
+
+def test_marshal_models_constructed_without_validation(tmp_path: Path):
+    context, input_file = given(tmp_path, idl="foo = record { a: i32; }")
+    generator = cpp_generator(context)
+    marshal_model = generator.marshal_models[Record]
+
+    # WHEN generating the types
+    with patch.object(marshal_model, "__pydantic_validator__") as validator:
+        ast = context.parse(input_file).generate("cpp").ast
+
+    # THEN the marshal model should not have been validated
+    validator.validate_python.assert_not_called()
+
+    # AND the marshal model should reference the declaration and config without copying them
+    record = ast[0]
+    assert record.cpp.decl is record
+    assert record.cpp.config is generator.config
+
+    # AND the computed fields should still be exported
+    assert record.cpp.model_dump()["typename"] == "::Foo"
+
+
+def test_type_specifiers_memoized(tmp_path: Path):
+    context, input_file = given(tmp_path, idl="foo = record { a: list<i32>; b: list<i32>; c: list<i32>?; }")
+    generator = cpp_generator(context)
+
+    # WHEN generating a record with fields of the same generic instantiation
+    with Profiler() as profiler:
+        context.parse(input_file).generate("cpp")
+
+    # THEN each distinct instantiation should have been computed once
+    assert profiler.counters[("type specifiers", "cpp")] == {"hits": 1, "misses": 2, "size": 2}
+    assert "std::vector<int32_t> a" in (tmp_path / "out" / "foo.hpp").read_text()
+
+    # AND THEN the cache should have been released after the generation
+    assert id(generator.config) not in TypeSpecifierCache._caches
+
+
+def test_type_specifier_cache_released_after_aggregate_files(tmp_path: Path):
+    context, input_file = given(tmp_path, idl="foo = record { a: list<i32>; }")
+    generator = cpp_generator(context)
+    generate = generator.generate
+
+    def generate_with_aggregate_file(ast, copy_support_lib_sources=True):
+        generate(ast, copy_support_lib_sources)
+        # GIVEN a generator that renders an aggregate file after all types have been rendered
+        TypeSpecifierCache.of(generator.config).get(lambda type_ref: "aggregate", None)
+
+    # WHEN generating the target
+    with Profiler() as profiler, patch.object(generator, "generate", generate_with_aggregate_file):
+        context.parse(input_file).generate("cpp")
+
+    # THEN the type specifiers of the aggregate file should have been counted
+    assert profiler.counters[("type specifiers", "cpp")] == {"hits": 0, "misses": 2, "size": 2}
+
+    # AND THEN the cache should have been released after all files have been rendered
+    assert id(generator.config) not in TypeSpecifierCache._caches
+
+def test_type_specifier_cache_released_with_config():
+    # GIVEN a cache for a configuration
+    config = CppConfig(out=Path("out"))
+    TypeSpecifierCache.of(config)
+    key = id(config)
+
+    # WHEN the configuration is garbage collected
+    del config
+    gc.collect()
+
+    # THEN the cache should have been dropped as well
+    assert key not in TypeSpecifierCache._caches
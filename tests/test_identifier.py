@@ -68,3 +68,18 @@ def test_identifier_conversion_prefix(name, style, output):
 
     # THEN the converted name should be prefixed
     assert converted == f"{prefix}{output}"
+
+
+def test_identifier_conversion_is_memoized():
+    # GIVEN two equal Identifier instances and a style
+    style = IdentifierStyle(style=IdentifierStyle.Case.pascal, prefix="I")
+
+    # WHEN converting both identifiers
+    hits = Identifier.cache_info().hits
+    first = Identifier("memoized_name").convert(style)
+    second = Identifier("memoized_name").convert(IdentifierStyle(style=IdentifierStyle.Case.pascal, prefix="I"))
+
+    # THEN the second conversion should be served from the cache and return the same interned string
+    assert first == "IMemoizedName"
+    assert first is second
+    assert Identifier.cache_info().hits == hits + 1
@@ -0,0 +1,200 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pickle
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from importlib_metadata import PackageNotFoundError
+
+from pydjinni import API
+from pydjinni.parser.parse_cache import ParseCache, grammar_version
+from pydjinni.parser.parser import Parser
+
+
+def given(tmp_path: Path, input_idl: str, **config) -> tuple[API.ConfiguredContext, Path]:
+    # GIVEN an API with a configured cache directory
+    context = API().configure(
+        options={"generate": {"cache_dir": tmp_path / "cache", "cpp": {"out": tmp_path / "out"}} | config}
+    )
+
+    # AND GIVEN an input file
+    input_file = tmp_path / "input.djinni"
+    input_file.write_text(input_idl)
+    return context, input_file
+
+
+def test_cached_parse(tmp_path: Path):
+    context, input_file = given(
+        tmp_path,
+        """
+        @import "imported.djinni"
+        # record comment
+        foo = record {
+            bar: imported;
+            baz: list<string>;
+        }
+        """,
+    )
+    imported_file = tmp_path / "imported.djinni"
+    imported_file.write_text("imported = enum { a; }")
+
+    # GIVEN a previous parse run that populated the cache
+    context.parse(input_file)
+
+    # WHEN parsing the input again
+    with patch.object(Parser, "_analyze", wraps=None) as analyze_mock:
+        result = context.parse(input_file)
+
+    # THEN no file should have been analyzed again
+    analyze_mock.assert_not_called()
+
+    # THEN the restored result should be complete and resolved
+    assert [type_def.name for type_def in result.type_defs] == ["imported", "foo"]
+    record = result.type_defs[1]
+    assert record.comment == "record comment"
+    assert record.fields[0].type_ref.type_def is result.type_defs[0]
+    assert record.fields[1].type_ref.type_def.name == "list"
+    assert record.cpp.name == "Foo"
+    assert [file_import.path for file_import in result.file_imports] == [imported_file]
+
+
+def test_cached_parse_picks_up_changed_imports(tmp_path: Path):
+    context, input_file = given(tmp_path, '@import "imported.djinni"\nfoo = record { bar: imported; }')
+    imported_file = tmp_path / "imported.djinni"
+    imported_file.write_text("imported = enum { a; }")
+
+    # GIVEN a previous parse run that populated the cache
+    context.parse(input_file)
+
+    # WHEN the imported file changes
+    imported_file.write_text("imported = flags { a; }")
+    result = context.parse(input_file)
+
+    # THEN the changed import should be reflected in the result
+    assert result.type_defs[1].fields[0].type_ref.type_def.primitive == "flags"
+
+
+def test_cached_parse_errors(tmp_path: Path):
+    context, input_file = given(tmp_path, "foo = record { bar: i32; }\nbaz = unknown {}")
+
+    # GIVEN a previous parse run of an invalid file
+    with pytest.raises(Parser.ParsingExceptionList) as first_run:
+        context.parse(input_file)
+
+    # WHEN parsing the file again
+    with pytest.raises(Parser.ParsingExceptionList) as second_run:
+        context.parse(input_file)
+
+    # THEN the same errors should be reported
+    assert [str(error) for error in second_run.value.items] == [str(error) for error in first_run.value.items]
+
+
+def test_no_cache(tmp_path: Path):
+    context, input_file = given(tmp_path, "foo = record { bar: i32; }")
+
+    # WHEN parsing with caching disabled
+    context.parse(input_file, use_cache=False)
+
+    # THEN no cache entries should have been written
+    assert not (tmp_path / "cache" / "ast").exists()
+
+
+def test_cache_eviction(tmp_path: Path):
+    cache = ParseCache(tmp_path, max_size=100)
+
+    # GIVEN multiple cache entries that exceed the size limit
+    for index in range(3):
+        entry_path = tmp_path / f"{index}.pickle"
+        entry_path.write_bytes(b"0" * 60)
+        os.utime(entry_path, (index, index))
+
+    # WHEN pruning the cache
+    cache.prune()
+
+    # THEN only the most recently used entry should remain
+    assert [entry.name for entry in tmp_path.glob("*.pickle")] == ["2.pickle"]
+
+
+def test_unwritable_cache_dir(tmp_path: Path):
+    # GIVEN a cache directory that can't be created, because a file exists in its place
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("")
+    context = API().configure(options={"generate": {"cache_dir": tmp_path / "cache" / "nested"}})
+    input_file = tmp_path / "input.djinni"
+    input_file.write_text("foo = record { bar: i32; }")
+
+    # WHEN parsing the input twice
+    context.parse(input_file)
+    result = context.parse(input_file)
+
+    # THEN the cache should have been skipped
+    assert [type_def.name for type_def in result.type_defs] == ["foo"]
+
+
+@pytest.mark.parametrize(
+    "content", [b"corrupted", pickle.dumps({"not": "an entry"})], ids=["corrupted", "unexpected_content"]
+)
+def test_invalid_cache_entry(tmp_path: Path, content: bytes):
+    cache = ParseCache(tmp_path, max_size=100)
+
+    # GIVEN a cache entry that can't be restored
+    entry_path = tmp_path / "key.pickle"
+    entry_path.write_bytes(content)
+
+    # WHEN loading the entry
+    # THEN it should be treated as missing and removed
+    assert cache.load("key") is None
+    assert not entry_path.exists()
+
+
+def test_cache_eviction_of_removed_entries(tmp_path: Path):
+    cache = ParseCache(tmp_path, max_size=0)
+
+    # GIVEN a cache entry that is removed concurrently while the cache is pruned
+    (tmp_path / "0.pickle").write_bytes(b"0")
+    stat = Path.stat
+
+    def removed_stat(path: Path, *args, **kwargs):
+        if path.suffix == ".pickle":
+            raise FileNotFoundError(path)
+        return stat(path, *args, **kwargs)
+
+    # WHEN pruning the cache
+    # THEN the removed entry should be skipped
+    with patch.object(Path, "stat", removed_stat):
+        cache.prune()
+
+
+def test_cached_parse_without_package_metadata(tmp_path: Path):
+    context, input_file = given(tmp_path, "foo = record { bar: i32; }")
+
+    # GIVEN PyDjinni running from a source checkout without package metadata
+    grammar_version.cache_clear()
+    try:
+        with patch("pydjinni.parser.parse_cache.version", side_effect=PackageNotFoundError("pydjinni")):
+            # WHEN parsing the input
+            result = context.parse(input_file)
+            fallback_version = grammar_version()
+    finally:
+        grammar_version.cache_clear()
+
+    # THEN the input should have been parsed and cached
+    assert [type_def.name for type_def in result.type_defs] == ["foo"]
+    assert list((tmp_path / "cache" / "ast").glob("*.pickle"))
+
+    # THEN the sources should have been fingerprinted instead of the version
+    assert fallback_version != grammar_version()
@@ -13,10 +13,12 @@
 # limitations under the License.
 
 from pathlib import Path
+import pickle
 import re
 
 import pytest
-from pydjinni.position import Cursor, Position
+from pydjinni.parser.base_models import TypeReference
+from pydjinni.position import Cursor, Position, _files, reset_files
 
 
 @pytest.mark.parametrize(
@@ -70,3 +72,53 @@ def test_position_with_offset():
     # THEN the resulting position should have the correct offset
     assert position.start == Cursor(line=1, col=5)
     assert position.end == Cursor(line=1, col=7)
+
+
+def test_position_immutable():
+    # GIVEN a position
+    position = Position(file=Path("test.pydjinni"), start=Cursor(line=1, col=2), end=Cursor(line=1, col=7))
+
+    # THEN it should not be possible to modify it
+    with pytest.raises(AttributeError):
+        position.file = Path("other.pydjinni")
+
+
+def test_position_file_interned():
+    # WHEN creating two positions in the same file
+    first = Position(file=Path("test.pydjinni"), start=Cursor(line=1, col=2), end=Cursor(line=1, col=7))
+    second = Position(file=Path("test.pydjinni"), start=Cursor(line=2, col=2), end=Cursor(line=2, col=7))
+
+    # THEN both positions should share the same file reference
+    assert first.file is second.file
+
+    # WHEN resetting the interned files
+    reset_files()
+
+    # THEN the file should no longer be referenced
+    assert Path("test.pydjinni") not in _files
+
+    # AND THEN the existing positions should keep their file
+    assert first.file == Path("test.pydjinni")
+
+
+def test_position_pickle():
+    position = Position(file=Path("test.pydjinni"), start=Cursor(line=1, col=2), end=Cursor(line=1, col=7))
+
+    assert pickle.loads(pickle.dumps(position)) == position
+
+
+def test_position_serialization():
+    # GIVEN a type reference with a position
+    type_ref = TypeReference(
+        name="foo",
+        position=Position(file=Path("test.pydjinni"), start=Cursor(line=1, col=2), end=Cursor(line=1, col=7)),
+    )
+
+    # WHEN serializing the type reference
+    output = type_ref.model_dump(mode="json")
+
+    # THEN the position should be serialized as an object
+    assert output["position"] == {"start": {"line": 1, "col": 2}, "end": {"line": 1, "col": 7}, "file": "test.pydjinni"}
+
+    # AND it should be possible to restore the position from the serialized form
+    assert TypeReference.model_validate(output).position == type_ref.position
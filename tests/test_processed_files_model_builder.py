@@ -53,3 +53,23 @@ def test_add_source_only_generated_field():
     assert "foo" in model_instance.generated.__class__.model_fields
     assert "source" in model_instance.generated.foo.__class__.model_fields
     assert "header" not in model_instance.generated.foo.__class__.model_fields
+
+
+def test_build_reuses_model():
+    # GIVEN two ProcessedFilesModelBuilder instances with the same generated fields
+    builders = [ProcessedFilesModelBuilder(), ProcessedFilesModelBuilder()]
+    for builder in builders:
+        builder.add_generated_field("foo", header=True, source=True)
+
+    # WHEN building the models
+    models = [builder.build() for builder in builders]
+
+    # THEN the same model should have been returned
+    assert models[0] is models[1]
+
+    # WHEN building a model with different outputs for the same generator
+    other_builder = ProcessedFilesModelBuilder()
+    other_builder.add_generated_field("foo", header=False, source=True)
+
+    # THEN a new model should be built
+    assert other_builder.build() is not models[0]
@@ -0,0 +1,111 @@
+# Copyright 2025 jothepro
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+from pathlib import Path
+
+from pydjinni import API
+from pydjinni.profiler import Profiler, count, span
+
+
+def test_profiler_records_phases(tmp_path: Path):
+    # GIVEN an input file
+    input_file = tmp_path / "input.djinni"
+    input_file.write_text("""
+    foo = record {
+        bar: i32;
+    }
+    """)
+
+    # WHEN generating output while a profiler is active
+    with Profiler() as profiler:
+        API().configure(options={
+            "generate": {"cpp": {"out": tmp_path / "out"}, "support_lib_sources": False}
+        }).parse(input_file).generate("cpp")
+
+    # THEN all phases should have been recorded
+    phases = profiler.totals(lambda span: span.category)
+    assert {"configure", "setup", "parse", "marshal", "generate", "render", "write"} <= set(phases)
+
+    # AND THEN the rendering and writing should have been attributed to the target
+    assert {("cpp", "render"), ("cpp", "write"), ("cpp", "marshal")} <= set(
+        profiler.totals(lambda span: (span.target, span.category))
+    )
+
+    # AND THEN the rendered type and templates should be known
+    assert ("cpp", "foo") in profiler.totals(lambda span: (span.args.get("generator"), span.args.get("type")))
+    assert "header/record.jinja2.hpp" in profiler.totals(lambda span: span.args.get("template"))
+
+    # AND THEN the statistics of the memoized type specifiers should have been recorded
+    type_specifiers = profiler.counters[("type specifiers", "cpp")]
+    assert type_specifiers["misses"] == type_specifiers["size"] >= 1
+
+    # WHEN writing a trace
+    trace = tmp_path / "trace.json"
+    profiler.write_trace(trace)
+
+    # THEN it should contain a complete event for each span
+    events = [event for event in json.loads(trace.read_text())["traceEvents"] if event["ph"] == "X"]
+    assert len(events) == len(profiler.spans)
+    assert {"name", "cat", "ts", "dur", "pid", "tid", "args"} <= set(events[0])
+
+
+def test_profiler_nested_spans():
+    # GIVEN an active profiler
+    with Profiler() as profiler:
+        # WHEN recording nested spans
+        with span("outer", "outer", target="foo"):
+            time.sleep(0.01)
+            with span("inner", "inner"):
+                time.sleep(0.01)
+
+    # THEN the nested span should not be accounted to the enclosing span
+    inner, outer = profiler.spans
+    assert outer.self_duration == outer.duration - inner.duration
+
+    # AND THEN the nested span should inherit the target of the enclosing span
+    assert inner.target == "foo"
+
+
+def test_profiler_inactive():
+    # GIVEN a profiler that has been stopped
+    with Profiler() as profiler:
+        pass
+
+    # WHEN recording a span
+    with span("foo", "bar"):
+        pass
+
+    # THEN nothing should have been recorded
+    assert profiler.spans == []
+
+
+def test_profiler_counters(tmp_path: Path):
+    # GIVEN an active profiler
+    with Profiler() as profiler:
+        # WHEN recording counters
+        count("foo", "cache", hits=2, misses=1)
+        count("foo", "cache", hits=1)
+
+    # THEN the values should have been summed up
+    assert profiler.counters == {("cache", "foo"): {"hits": 3, "misses": 1}}
+
+    # AND THEN the trace should contain a counter event
+    trace = tmp_path / "trace.json"
+    profiler.write_trace(trace)
+    events = [event for event in json.loads(trace.read_text())["traceEvents"] if event["ph"] == "C"]
+    assert events == [{"name": "foo", "cat": "cache", "ph": "C", "ts": 0.0, "pid": events[0]["pid"], "args": {
+        "hits": 3, "misses": 1
+    }}]
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 from pathlib import Path
 
 import pytest
@@ -21,6 +22,7 @@ from pydjinni.exceptions import InputParsingException
 from pydjinni.parser.ast import TypeReference
 from pydjinni.parser.base_models import BaseType, BaseExternalType
 from pydjinni.parser.resolver import Resolver
+from pydjinni.position import Cursor, Position
 
 
 def internal_given() -> tuple[Resolver, BaseType, TypeReference]:
@@ -127,6 +129,57 @@ def test_load_external_type(tmp_path: Path):
     assert type_def.primitive == BaseExternalType.Primitive.record
 
 
+def test_load_external_type_positions(tmp_path: Path):
+    # GIVEN a Resolver instance
+    resolver = Resolver(BaseExternalType)
+
+    # AND GIVEN an input file with multiple external type definitions
+    file = tmp_path / "my_types.yaml"
+    file.write_text(yaml.dump_all([
+        {'name': 'foo', 'primitive': 'record'},
+        {'primitive': 'enum', 'name': 'bar'}
+    ]))
+
+    # WHEN loading the type definitions from the file
+    foo, bar = resolver.load_external(file)
+
+    # THEN the positions should point to the names of the types
+    lines = file.read_text().splitlines()
+    for type_def in (foo, bar):
+        assert type_def.position.file == file
+        line = lines[type_def.position.start.line]
+        assert line[type_def.position.start.col:type_def.position.end.col] == type_def.name
+        assert type_def.identifier_position == type_def.position
+
+
+def test_load_external_type_cached(tmp_path: Path):
+    # GIVEN a Resolver instance
+    resolver = Resolver(BaseExternalType)
+
+    # AND GIVEN an input file with an external type definition that has already been loaded
+    file = tmp_path / "my_type.yaml"
+    file.write_text(yaml.dump({'name': 'foo', 'primitive': 'record'}))
+    loaded_type, = resolver.load_external(file)
+
+    # WHEN loading the unchanged file again after a reset
+    resolver.reset()
+    reloaded_type, = resolver.load_external(file)
+
+    # THEN the previously loaded type should be registered again
+    assert reloaded_type is loaded_type
+    assert resolver.resolve(TypeReference(name="foo")) is loaded_type
+
+    # WHEN the file is modified
+    file.write_text(yaml.dump({'name': 'foo', 'primitive': 'enum'}))
+    os.utime(file, ns=(file.stat().st_atime_ns, file.stat().st_mtime_ns + 1_000_000_000))
+    resolver.reset()
+    modified_type, = resolver.load_external(file)
+
+    # THEN the file should be loaded again
+    assert modified_type is not loaded_type
+    assert modified_type.primitive == BaseExternalType.Primitive.enum
+
+
 def test_load_invalid_external_type(tmp_path: Path):
     # GIVEN a Resolver instance
     resolver = Resolver(BaseExternalType)
@@ -167,3 +220,56 @@ def test_register_namespaced_type(tmp_path: Path, type_ref: TypeReference, type_
 
     # THEN the type_ref should now contain a reference to the new type
     assert resolved_type_def == type_def
+
+
+def test_resolve_shadowing_type():
+    # GIVEN a resolver with a type in the global namespace
+    resolver = Resolver(BaseExternalType)
+    global_type = BaseType(name="bar")
+    resolver.register(global_type)
+
+    # AND GIVEN a reference to the type from within a nested namespace
+    type_ref = TypeReference(name="bar", namespace=["foo", "baz"])
+
+    # WHEN resolving the reference
+    # THEN the type from the global namespace should be found
+    assert resolver.resolve(type_ref) is global_type
+
+    # WHEN registering a type with the same name in an enclosing namespace of the reference
+    shadowing_type = BaseType(name="bar", namespace=["foo"])
+    resolver.register(shadowing_type)
+
+    # THEN the reference should resolve to the type in the closer namespace
+    assert resolver.resolve(type_ref) is shadowing_type
+    assert resolver.resolve(TypeReference(name="bar")) is global_type
+
+
+def test_canonical_type_reference():
+    # GIVEN a resolver with a generic collection type and a primitive type
+    resolver = Resolver(BaseExternalType)
+    list_type = BaseExternalType(name="list", primitive=BaseExternalType.Primitive.collection, params=["T"])
+    string_type = BaseExternalType(name="string", namespace=["foo"])
+
+    # AND GIVEN two structurally identical type references at different positions
+    def given_type_ref(line: int) -> TypeReference:
+        return TypeReference(
+            name="list",
+            position=Position(start=Cursor(line=line), end=Cursor(line=line)),
+            parameters=[TypeReference(name="foo.string", type_def=string_type)],
+            type_def=list_type,
+        )
+
+    first, second = given_type_ref(1), given_type_ref(2)
+
+    # WHEN canonicalizing the type references
+    canonical = resolver.canonical(first)
+
+    # THEN both references should share the same canonical reference without a position
+    assert resolver.canonical(second) is canonical
+    assert canonical.position is None
+    assert canonical.type_def is list_type
+    assert canonical.parameters[0] is resolver.canonical(first.parameters[0])
+    assert canonical.parameters[0].name == ".foo.string"
+
+    # AND an optional reference to the same type should have its own canonical reference
+    assert resolver.canonical(TypeReference(name="list", optional=True, type_def=list_type)) is not canonical
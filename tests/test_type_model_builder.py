@@ -38,3 +38,24 @@ def test_add_field():
     # THEN the model should contain the field
     assert "name" in type_model.model_fields
     assert type_model.model_fields["name"].annotation == FieldTypeModel
+
+
+def test_build_reuses_model():
+    # GIVEN a base type model
+    class BaseTypeModel(BaseModel, extra="allow"):
+        foo: int = 1
+
+    # AND GIVEN a Field type model
+    class FieldTypeModel(BaseModel):
+        bar: int = 2
+
+    # AND GIVEN two TypeModelBuilders with the same field
+    builders = [TypeModelBuilder(BaseTypeModel), TypeModelBuilder(BaseTypeModel)]
+    for builder in builders:
+        builder.add_field("name", FieldTypeModel)
+
+    # WHEN building the models
+    type_models = [builder.build() for builder in builders]
+
+    # THEN the same model should have been returned
+    assert type_models[0] is type_models[1]